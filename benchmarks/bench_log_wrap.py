@@ -0,0 +1,84 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Per-call overhead of LogWrap wrappers.
+
+Usage: python benchmarks/bench_log_wrap.py [-n NUMBER]
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import logging
+import timeit
+import typing
+
+# Package Implementation
+import logwrap
+
+LOGGER = logging.getLogger("logwrap.benchmark")
+LOGGER.addHandler(logging.NullHandler())
+LOGGER.propagate = False
+
+PAYLOAD = {"key": [1, 2, 3], "nested": {"value": "text" * 10}}
+
+
+def plain(arg1: int, arg2: str = "default", *args: typing.Any, payload: typing.Any = None, **kwargs: typing.Any) -> int:
+    """Undecorated function."""
+    return arg1
+
+
+wrapped = logwrap.logwrap(log=LOGGER)(plain)
+
+
+def measure(func: typing.Callable[..., typing.Any], number: int) -> float:
+    """Measure per call time in nanoseconds.
+
+    :param func: callable to measure
+    :type func: typing.Callable[..., typing.Any]
+    :param number: number of calls per repeat
+    :type number: int
+    :return: best per-call time in nanoseconds
+    :rtype: float
+    """
+    timer = timeit.Timer(lambda: func(1, "arg", 3, 4, payload=PAYLOAD, extra=True))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000_000
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=100_000, help="calls per repeat")
+    number: int = parser.parse_args().number
+
+    results: typing.Dict[str, float] = {"undecorated": measure(plain, number)}
+
+    LOGGER.setLevel(logging.CRITICAL)
+    results["logwrap, logging disabled"] = measure(wrapped, number)
+
+    logwrap.registry.disable(wrapped)
+    results["logwrap, wrapper disabled"] = measure(wrapped, number)
+    logwrap.registry.enable(wrapped)
+
+    LOGGER.setLevel(logging.DEBUG)
+    results["logwrap, logging enabled"] = measure(wrapped, number // 10)
+
+    base = results["undecorated"]
+    for name, value in results.items():
+        print(f"{name:<40}{value:>12.1f} ns/call{value - base:>12.1f} ns overhead")
+
+
+if __name__ == "__main__":
+    main()
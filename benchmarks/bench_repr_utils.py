@@ -0,0 +1,94 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Formatting time of pretty_repr and pretty_str on deep and wide structures.
+
+Usage: python benchmarks/bench_repr_utils.py [-n NUMBER]
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import sys
+import timeit
+import typing
+
+# Package Implementation
+import logwrap
+
+
+def make_deep(depth: int) -> typing.List[typing.Any]:
+    """Make nested lists.
+
+    :param depth: nesting depth
+    :type depth: int
+    :return: nested lists with dict on the deepest level
+    :rtype: typing.List[typing.Any]
+    """
+    result: typing.List[typing.Any] = [{"key": "value", "number": 1}]
+    for _ in range(depth - 1):
+        result = [result, depth]
+    return result
+
+
+WIDE = {
+    f"key_{idx}": [idx, str(idx), (idx, idx + 0.5), {"flag": idx % 2 == 0, "items": [1, 2, 3]}] for idx in range(1000)
+}
+DEEP = [make_deep(15) for _ in range(100)]
+# Deeper than the recursion limit allows for the recursive implementation
+VERY_DEEP = make_deep(sys.getrecursionlimit() * 2)
+
+CASES: typing.Dict[str, typing.Tuple[typing.Any, int]] = {
+    "wide (1000 keys x 4 values)": (WIDE, 20),
+    "deep (100 x 15 levels)": (DEEP, 80),
+    f"very deep ({sys.getrecursionlimit() * 2} levels)": (VERY_DEEP, sys.getrecursionlimit() * 8 + 8),
+}
+
+
+def measure(func: typing.Callable[..., str], src: typing.Any, max_indent: int, number: int) -> float:
+    """Measure formatting time in milliseconds.
+
+    :param func: formatting function
+    :type func: typing.Callable[..., str]
+    :param src: object to format
+    :type src: typing.Any
+    :param max_indent: maximal indent before classic repr() call
+    :type max_indent: int
+    :param number: number of calls per repeat
+    :type number: int
+    :return: best per-call time in milliseconds
+    :rtype: float
+    """
+    timer = timeit.Timer(lambda: func(src, max_indent=max_indent))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=10, help="calls per repeat")
+    number: int = parser.parse_args().number
+
+    for name, (src, max_indent) in CASES.items():
+        for func in (logwrap.pretty_repr, logwrap.pretty_str):
+            try:
+                result = f"{measure(func, src, max_indent, number):>12.3f} ms/call"
+            except RecursionError:
+                result = f"{'RecursionError':>20}"
+            print(f"{func.__name__ + ', ' + name:<50}{result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@
 
 """logwrap module.
 
-Contents: 'logwrap', 'pretty_repr', 'pretty_str'
+Contents: 'logwrap', 'pretty_repr', 'pretty_str', 'pretty_repr_dump', 'pretty_str_dump'
 
 Original code was made for Mirantis Inc by Alexey Stepanov,
 later it has been reworked and extended for support of special cases.
@@ -25,16 +25,30 @@ later it has been reworked and extended for support of special cases.
 from __future__ import annotations
 
 # Local Implementation
+from .constants import STRUCTURED_FIELDS
+from .dedup import FailureDeduplicator
+from .formatters import JsonLinesFormatter
 from .log_on_access import LogOnAccess
+from .log_worker import LogWorker
+from .log_worker import OverflowPolicy
+from .log_wrap import ArgsSnapshot
 from .log_wrap import BoundParameter
 from .log_wrap import LogWrap
 from .log_wrap import bind_args_kwargs
 from .log_wrap import logwrap
+from .metrics import FunctionMetrics
+from .metrics import MetricsSnapshot
 from .repr_utils import PrettyFormat
 from .repr_utils import PrettyRepr
 from .repr_utils import PrettyStr
 from .repr_utils import pretty_repr
+from .repr_utils import pretty_repr_dump
 from .repr_utils import pretty_str
+from .repr_utils import pretty_str_dump
+from .sampling import EveryNth
+from .sampling import Probabilistic
+from .sampling import SamplingPolicy
+from .sampling import TokenBucket
 
 __all__ = (
     "LogWrap",
@@ -44,9 +58,23 @@ __all__ = (
     "PrettyStr",
     "pretty_repr",
     "pretty_str",
+    "pretty_repr_dump",
+    "pretty_str_dump",
     "BoundParameter",
     "bind_args_kwargs",
     "LogOnAccess",
+    "LogWorker",
+    "OverflowPolicy",
+    "SamplingPolicy",
+    "EveryNth",
+    "Probabilistic",
+    "TokenBucket",
+    "FunctionMetrics",
+    "MetricsSnapshot",
+    "FailureDeduplicator",
+    "ArgsSnapshot",
+    "STRUCTURED_FIELDS",
+    "JsonLinesFormatter",
 )
 
 try:
@@ -14,3 +14,6 @@
 """Global constants."""
 
 VALID_LOGGER_NAMES = ("LOGGER", "LOG", "logger", "log", "_logger", "_log")
+
+# Record attributes added by LogWrap in structured mode
+STRUCTURED_FIELDS = ("func", "func_module", "qualname", "call_args", "result", "duration_ns", "outcome")
@@ -0,0 +1,239 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Repeated failures suppression."""
+
+from __future__ import annotations
+
+# Standard Library
+import collections
+import functools
+import threading
+import time
+import typing
+
+# Package Implementation
+from logwrap import watchdog
+
+__all__ = ("FailureDeduplicator", "fingerprint")
+
+
+def fingerprint(name: str, exception: BaseException) -> typing.Hashable:
+    """Make failure fingerprint: function name, exception type and traceback code locations.
+
+    :param name: function name
+    :type name: str
+    :param exception: exception captured
+    :type exception: BaseException
+    :return: hashable fingerprint
+    :rtype: typing.Hashable
+
+    .. versionadded:: 10.0.0
+    """
+    locations: typing.List[typing.Tuple[str, int]] = []
+    exc_tb = exception.__traceback__
+    while exc_tb is not None:
+        locations.append((exc_tb.tb_frame.f_code.co_filename, exc_tb.tb_lineno))
+        exc_tb = exc_tb.tb_next
+    return name, exception.__class__, tuple(locations)
+
+
+class _Occurrences:
+    """Occurrences of the single failure fingerprint."""
+
+    __slots__ = ("window_start", "last_seen", "repeated", "flush", "pending")
+
+    def __init__(self, now: float) -> None:
+        """Occurrences of the single failure fingerprint.
+
+        :param now: timestamp of the first occurrence
+        :type now: float
+        """
+        self.window_start: float = now
+        self.last_seen: float = now
+        self.repeated: int = 0
+        self.flush: typing.Optional[typing.Callable[[int, float], typing.Any]] = None
+        self.pending: typing.Optional[watchdog.Watch] = None
+
+    def reset(self, now: float) -> None:
+        """Start new summary window: pending summary is not required.
+
+        :param now: timestamp of the window start
+        :type now: float
+        """
+        self.window_start = now
+        self.repeated = 0
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+
+class FailureDeduplicator:
+    """Log the first failure in full and summaries for repeated failures with the same fingerprint.
+
+    Fingerprints table is limited by size, least recently seen fingerprints are evicted.
+    Fingerprint, which did not recur during interval, is forgotten: next occurrence is logged in full.
+    If flush callback is provided, repeats not reported by the next occurrence are reported when interval expires.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__interval", "__max_fingerprints", "__lock", "__table", "__suppressed")
+
+    def __init__(self, interval: float = 10.0, max_fingerprints: int = 1024) -> None:
+        """Log the first failure in full and summaries for repeated failures with the same fingerprint.
+
+        :param interval: interval between summary records in seconds
+        :type interval: float
+        :param max_fingerprints: maximum number of tracked fingerprints
+        :type max_fingerprints: int
+        :raises ValueError: interval or table size is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"interval should be positive, got {interval}")
+        if max_fingerprints < 1:
+            raise ValueError(f"max_fingerprints should be positive, got {max_fingerprints}")
+        self.__interval: float = interval
+        self.__max_fingerprints: int = max_fingerprints
+        self.__lock: threading.Lock = threading.Lock()
+        self.__table: collections.OrderedDict[typing.Hashable, _Occurrences] = collections.OrderedDict()
+        self.__suppressed: int = 0
+
+    @property
+    def interval(self) -> float:
+        """Interval between summary records.
+
+        :return: interval in seconds
+        :rtype: float
+        """
+        return self.__interval
+
+    @property
+    def max_fingerprints(self) -> int:
+        """Maximum number of tracked fingerprints.
+
+        :return: fingerprints table size limit
+        :rtype: int
+        """
+        return self.__max_fingerprints
+
+    @property
+    def suppressed(self) -> int:
+        """Number of failures, which were not logged in full.
+
+        :return: suppressed failures counter
+        :rtype: int
+        """
+        return self.__suppressed
+
+    def __len__(self) -> int:
+        """Number of tracked fingerprints.
+
+        :return: fingerprints table size
+        :rtype: int
+        """
+        return len(self.__table)
+
+    def register(
+        self,
+        key: typing.Hashable,
+        flush: typing.Optional[typing.Callable[[int, float], typing.Any]] = None,
+    ) -> typing.Tuple[bool, int, float]:
+        """Register failure occurrence.
+
+        :param key: failure fingerprint
+        :type key: typing.Hashable
+        :param flush: callback for the summary (number of repeats and summary period) of suppressed repeats,
+                      which were not reported until interval expiration. Called from the watchdog thread.
+        :type flush: typing.Optional[typing.Callable[[int, float], typing.Any]]
+        :return: failure should be logged in full, number of repeats to report in summary and summary period.
+        :rtype: typing.Tuple[bool, int, float]
+        """
+        now: float = time.monotonic()
+        with self.__lock:
+            occurrences: typing.Optional[_Occurrences] = self.__table.get(key, None)
+            if occurrences is None:
+                self.__table[key] = _Occurrences(now)
+                if len(self.__table) > self.__max_fingerprints:
+                    self.__table.popitem(last=False)
+                return True, 0, 0.0
+
+            self.__table.move_to_end(key)
+            repeated: int = occurrences.repeated
+            period: float = now - occurrences.window_start
+            if now - occurrences.last_seen >= self.__interval:
+                # Did not recur during interval: log in full again, report the rest of repeats
+                occurrences.last_seen = now
+                occurrences.reset(now)
+                return True, repeated, period
+
+            occurrences.last_seen = now
+            occurrences.repeated += 1
+            self.__suppressed += 1
+            if period < self.__interval:
+                if flush is not None:
+                    occurrences.flush = flush
+                    if occurrences.pending is None:
+                        occurrences.pending = watchdog.watch(
+                            occurrences.window_start + self.__interval - now,
+                            functools.partial(self.__flush_expired, occurrences, occurrences.window_start),
+                        )
+                return False, 0, 0.0
+            occurrences.reset(now)
+            return False, repeated + 1, period
+
+    def __flush_expired(self, occurrences: _Occurrences, window_start: float) -> None:
+        """Report repeats of expired summary window, if they were not reported by the next occurrence.
+
+        :param occurrences: occurrences of failure fingerprint
+        :type occurrences: _Occurrences
+        :param window_start: start of expired summary window
+        :type window_start: float
+        """
+        now: float = time.monotonic()
+        with self.__lock:
+            if occurrences.window_start != window_start or not occurrences.repeated:  # Already reported
+                return
+            flush: typing.Optional[typing.Callable[[int, float], typing.Any]] = occurrences.flush
+            repeated: int = occurrences.repeated
+            occurrences.reset(now)
+        if flush is not None:
+            flush(repeated, now - window_start)
+
+    def flush(self) -> None:
+        """Report not yet reported repeats of all fingerprints now (for example, on shutdown)."""
+        now: float = time.monotonic()
+        pending: typing.List[typing.Tuple[typing.Callable[[int, float], typing.Any], int, float]] = []
+        with self.__lock:
+            for occurrences in self.__table.values():
+                if occurrences.repeated and occurrences.flush is not None:
+                    pending.append((occurrences.flush, occurrences.repeated, now - occurrences.window_start))
+                    occurrences.reset(now)
+        for flush, repeated, period in pending:
+            flush(repeated, period)
+
+    def clear(self) -> None:
+        """Forget all fingerprints."""
+        with self.__lock:
+            for occurrences in self.__table.values():
+                occurrences.reset(0.0)
+            self.__table.clear()
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(interval={self.__interval}, max_fingerprints={self.__max_fingerprints})"
@@ -0,0 +1,78 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Formatters for records emitted by LogWrap in structured mode."""
+
+from __future__ import annotations
+
+# Standard Library
+import json
+import logging
+import typing
+
+# Local Implementation
+from .constants import STRUCTURED_FIELDS
+
+__all__ = ("JsonLinesFormatter",)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format log record as JSON object on the single line.
+
+    Object contains record time, level, logger name, message and structured fields set on the record.
+    Values, which are not serializable by `json`, are replaced by `repr`.
+
+    .. versionadded:: 10.0.0
+    """
+
+    def __init__(self, ensure_ascii: bool = False) -> None:
+        """Format log record as JSON object on the single line.
+
+        :param ensure_ascii: escape non-ASCII characters in output
+        :type ensure_ascii: bool
+        """
+        super().__init__()
+        self.__dumps: typing.Callable[[typing.Any], str] = json.JSONEncoder(
+            ensure_ascii=ensure_ascii,
+            separators=(",", ":"),
+            default=repr,
+        ).encode
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record.
+
+        :param record: log record
+        :type record: logging.LogRecord
+        :return: JSON object
+        :rtype: str
+        """
+        data: typing.Dict[str, typing.Any] = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        record_dict: typing.Dict[str, typing.Any] = record.__dict__
+        for field in STRUCTURED_FIELDS:
+            if field in record_dict:
+                data[field] = record_dict[field]
+        if record.exc_info:
+            # Cache the traceback text: it does not change
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return self.__dumps(data)
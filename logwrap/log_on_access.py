@@ -26,6 +26,7 @@ import typing
 
 # Package Implementation
 from logwrap import constants
+from logwrap import records
 from logwrap import repr_utils
 
 __all__ = ("LogOnAccess",)
@@ -36,6 +37,27 @@ _OwnerT = typing.TypeVar("_OwnerT")
 _ReturnT = typing.TypeVar("_ReturnT")
 
 
+def _check_budget(name: str, value: typing.Optional[int]) -> typing.Optional[int]:
+    """Validate repr budget value.
+
+    :param name: budget name
+    :type name: str
+    :param value: budget value or None if not limited
+    :type value: typing.Optional[int]
+    :return: validated value
+    :rtype: typing.Optional[int]
+    :raises TypeError: Value is not int
+    :raises ValueError: Value is negative
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"Unexpected type: {value.__class__.__name__}. Should be {int.__name__}.")
+    if value < 0:
+        raise ValueError(f"{name} should not be negative, got {value}")
+    return value
+
+
 class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
     """Property with logging on successful get/set/delete or failure.
 
@@ -153,6 +175,9 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         log_traceback: bool = True,
         override_name: typing.Optional[str] = None,
         max_indent: int = 20,
+        max_items: typing.Optional[int] = None,
+        max_str_len: typing.Optional[int] = None,
+        max_total_chars: typing.Optional[int] = None,
     ) -> None:
         """Advanced property main entry point.
 
@@ -184,6 +209,16 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         :type override_name: typing.Optional[str]
         :param max_indent: maximal indent before classic repr() call
         :type max_indent: int
+        :param max_items: maximum number of shown items for each container in repr
+        :type max_items: typing.Optional[int]
+        :param max_str_len: maximum number of shown characters (bytes) for each string in repr
+        :type max_str_len: typing.Optional[int]
+        :param max_total_chars: approximate size limit for each repr
+        :type max_total_chars: typing.Optional[int]
+        :raises TypeError: budget is not int
+        :raises ValueError: budget is negative
+
+        .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
         """
         super().__init__(fget=fget, fset=fset, fdel=fdel, doc=doc)
 
@@ -201,8 +236,17 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         self.__log_traceback: bool = log_traceback
         self.__override_name: typing.Optional[str] = override_name
         self.__max_indent: int = max_indent
+        self.__max_items: typing.Optional[int] = _check_budget("max_items", max_items)
+        self.__max_str_len: typing.Optional[int] = _check_budget("max_str_len", max_str_len)
+        self.__max_total_chars: typing.Optional[int] = _check_budget("max_total_chars", max_total_chars)
+        # Formatter for object and values repr: made on demand and dropped on settings change
+        self.__formatter: typing.Optional[repr_utils.PrettyRepr] = None
         self.__name: str = ""
         self.__owner: typing.Optional[typing.Type[_OwnerT]] = None
+        # Log records are attributed to the getter/setter/deleter: frames are not inspected on each record
+        self.__get_location: records.CodeLocation = records.code_location(fget)
+        self.__set_location: records.CodeLocation = records.code_location(fset)
+        self.__del_location: records.CodeLocation = records.code_location(fdel)
 
     def __set_name__(self, owner: typing.Optional[typing.Type[_OwnerT]], name: str) -> None:
         """Set __name__ and __objclass__ property.
@@ -241,6 +285,25 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         tb_text = "\nTraceback (most recent call last):\n" + "".join(traceback.format_list(full_tb)) + "".join(exc_line)
         return tb_text
 
+    @property
+    def __repr_formatter(self) -> repr_utils.PrettyRepr:
+        """Formatter for object and values repr.
+
+        Formatter is made once and reused until indentation or output size settings change.
+
+        :return: formatter with configured indentation and output size budgets
+        :rtype: repr_utils.PrettyRepr
+        """
+        formatter: typing.Optional[repr_utils.PrettyRepr] = self.__formatter
+        if formatter is None:
+            formatter = self.__formatter = repr_utils.PrettyRepr(
+                max_indent=self.max_indent,
+                max_items=self.max_items,
+                max_str_len=self.max_str_len,
+                max_total_chars=self.max_total_chars,
+            )
+        return formatter
+
     def __get_obj_source(self, instance: _OwnerT, owner: typing.Optional[typing.Type[_OwnerT]] = None) -> str:
         """Get object repr block.
 
@@ -252,7 +315,7 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         :rtype: str
         """
         if self.log_object_repr:
-            return repr_utils.pretty_repr(instance, max_indent=self.max_indent)
+            return self.__repr_formatter(instance)
         if owner is not None:
             return f"<{owner.__name__}() at 0x{id(instance):X}>"
         if self.__objclass__ is not None:
@@ -335,24 +398,29 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         source: str = self.__get_obj_source(instance, owner)
         logger: logging.Logger = self._get_logger_for_instance(instance)
 
+        location: records.CodeLocation = self.__get_location
+
         timestamp: float = time.time()
         try:
             if self.log_before:
-                logger.log(self.log_level, f"Request: {source}.{self.__name__}")
+                records.emit(logger, self.log_level, f"Request: {source}.{self.__name__}", location)
             result: _ReturnT = super().__get__(instance, owner)
             if self.log_success:
-                logger.log(
+                records.emit(
+                    logger,
                     self.log_level,
                     f"Done at {time.time() - timestamp:.03f}s: "
-                    f"{source}.{self.__name__} -> {repr_utils.pretty_repr(result)}",
+                    f"{source}.{self.__name__} -> {self.__repr_formatter(result)}",
+                    location,
                 )
             return result
         except Exception:
             if self.log_failure:
-                logger.log(
+                records.emit(
+                    logger,
                     self.exc_level,
                     f"Failed after {time.time() - timestamp:.03f}s: {source}.{self.__name__}{self.__traceback}",
-                    exc_info=False,
+                    location,
                 )
             raise
 
@@ -371,24 +439,34 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         source: str = self.__get_obj_source(instance)
         logger: logging.Logger = self._get_logger_for_instance(instance)
 
+        location: records.CodeLocation = self.__set_location
+
         timestamp: float = time.time()
         try:
             if self.log_before:
-                logger.log(self.log_level, f"Request: {source}.{self.__name__} = {repr_utils.pretty_repr(value)}")
+                records.emit(
+                    logger,
+                    self.log_level,
+                    f"Request: {source}.{self.__name__} = {self.__repr_formatter(value)}",
+                    location,
+                )
             super().__set__(instance, value)
             if self.log_success:
-                logger.log(
+                records.emit(
+                    logger,
                     self.log_level,
                     f"Done at {time.time() - timestamp:.03f}s: "
-                    f"{source}.{self.__name__} = {repr_utils.pretty_repr(value)}",
+                    f"{source}.{self.__name__} = {self.__repr_formatter(value)}",
+                    location,
                 )
         except Exception:
             if self.log_failure:
-                logger.log(
+                records.emit(
+                    logger,
                     self.exc_level,
                     f"Failed after {time.time() - timestamp:.03f}s: "
-                    f"{source}.{self.__name__} = {repr_utils.pretty_repr(value)}{self.__traceback}",
-                    exc_info=False,
+                    f"{source}.{self.__name__} = {self.__repr_formatter(value)}{self.__traceback}",
+                    location,
                 )
             raise
 
@@ -406,19 +484,27 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         source: str = self.__get_obj_source(instance)
         logger: logging.Logger = self._get_logger_for_instance(instance)
 
+        location: records.CodeLocation = self.__del_location
+
         timestamp: float = time.time()
         try:
             if self.log_before:
-                logger.log(self.log_level, f"Request: del {source}.{self.__name__}")
+                records.emit(logger, self.log_level, f"Request: del {source}.{self.__name__}", location)
             super().__delete__(instance)
             if self.log_success:
-                logger.log(self.log_level, f"Done at {time.time() - timestamp:.03f}s: del {source}.{self.__name__}")
+                records.emit(
+                    logger,
+                    self.log_level,
+                    f"Done at {time.time() - timestamp:.03f}s: del {source}.{self.__name__}",
+                    location,
+                )
         except Exception:
             if self.log_failure:
-                logger.log(
+                records.emit(
+                    logger,
                     self.exc_level,
                     f"Failed after {time.time() - timestamp:.03f}s: del {source}.{self.__name__}{self.__traceback}",
-                    exc_info=False,
+                    location,
                 )
             raise
 
@@ -604,6 +690,76 @@ class LogOnAccess(property, typing.Generic[_OwnerT, _ReturnT]):
         :type value: int
         """
         self.__max_indent = value
+        self.__formatter = None
+
+    @property
+    def max_items(self) -> typing.Optional[int]:
+        """Max number of shown items for each container during repr.
+
+        :return: items limit or None if not limited
+        :rtype: typing.Optional[int]
+
+        .. versionadded:: 10.0.0
+        """
+        return self.__max_items
+
+    @max_items.setter
+    def max_items(self, value: typing.Optional[int]) -> None:
+        """Max number of shown items for each container during repr.
+
+        :param value: items limit or None if not limited
+        :type value: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        self.__max_items = _check_budget("max_items", value)
+        self.__formatter = None
+
+    @property
+    def max_str_len(self) -> typing.Optional[int]:
+        """Max number of shown characters (bytes) for each string during repr.
+
+        :return: string length limit or None if not limited
+        :rtype: typing.Optional[int]
+
+        .. versionadded:: 10.0.0
+        """
+        return self.__max_str_len
+
+    @max_str_len.setter
+    def max_str_len(self, value: typing.Optional[int]) -> None:
+        """Max number of shown characters (bytes) for each string during repr.
+
+        :param value: string length limit or None if not limited
+        :type value: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        self.__max_str_len = _check_budget("max_str_len", value)
+        self.__formatter = None
+
+    @property
+    def max_total_chars(self) -> typing.Optional[int]:
+        """Approximate size limit for each repr.
+
+        :return: size limit or None if not limited
+        :rtype: typing.Optional[int]
+
+        .. versionadded:: 10.0.0
+        """
+        return self.__max_total_chars
+
+    @max_total_chars.setter
+    def max_total_chars(self, value: typing.Optional[int]) -> None:
+        """Approximate size limit for each repr.
+
+        :param value: size limit or None if not limited
+        :type value: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        self.__max_total_chars = _check_budget("max_total_chars", value)
+        self.__formatter = None
 
     @property
     def __name__(self) -> str:
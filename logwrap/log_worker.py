@@ -0,0 +1,249 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Background worker for formatting and emission of log records."""
+
+from __future__ import annotations
+
+# Standard Library
+import atexit
+import enum
+import logging
+import queue
+import threading
+import time
+import typing
+
+__all__ = ("LogWorker", "OverflowPolicy")
+
+
+class OverflowPolicy(str, enum.Enum):
+    """Behavior on full queue of the background worker.
+
+    .. versionadded:: 10.0.0
+    """
+
+    DROP = "drop"  # Drop the new record
+    BLOCK = "block"  # Wait for the free space in queue
+    SAMPLE = "sample"  # Wait for the free space for each N-th record, drop the others
+
+
+_STOP = object()
+
+
+class LogWorker:
+    """Background thread for formatting and emission of log records.
+
+    Records are created on the calling thread (time, thread and process information is correct)
+    and passed to the logger handlers from the worker thread through the bounded queue.
+    Message text is rendered by handlers, so formatting happens on the worker thread too.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = (
+        "__queue",
+        "__overflow",
+        "__sample_rate",
+        "__flush_timeout",
+        "__lock",
+        "__thread",
+        "__overflowed",
+        "__dropped",
+    )
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        overflow: typing.Union[OverflowPolicy, str] = OverflowPolicy.DROP,
+        sample_rate: int = 100,
+        flush_timeout: float = 5.0,
+    ) -> None:
+        """Background thread for formatting and emission of log records.
+
+        :param max_queue_size: maximum records in queue
+        :type max_queue_size: int
+        :param overflow: behavior on full queue
+        :type overflow: typing.Union[OverflowPolicy, str]
+        :param sample_rate: for `sample` overflow policy: wait for the free space for each N-th record
+        :type sample_rate: int
+        :param flush_timeout: maximum time to wait for the queued records processing on interpreter exit
+        :type flush_timeout: float
+        :raises ValueError: incorrect queue size or sample rate
+        """
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size should be positive, got {max_queue_size}")
+        if sample_rate < 1:
+            raise ValueError(f"sample_rate should be positive, got {sample_rate}")
+        self.__queue: queue.Queue[typing.Any] = queue.Queue(maxsize=max_queue_size)
+        self.__overflow: OverflowPolicy = OverflowPolicy(overflow)
+        self.__sample_rate: int = sample_rate
+        self.__flush_timeout: float = flush_timeout
+        self.__lock: threading.Lock = threading.Lock()
+        self.__thread: typing.Optional[threading.Thread] = None
+        self.__overflowed: int = 0
+        self.__dropped: int = 0
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        """Behavior on full queue.
+
+        :return: overflow policy
+        :rtype: OverflowPolicy
+        """
+        return self.__overflow
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped due to queue overflow.
+
+        :return: dropped records counter
+        :rtype: int
+        """
+        return self.__dropped
+
+    @property
+    def queue_size(self) -> int:
+        """Approximate number of records waiting for processing.
+
+        :return: queue size
+        :rtype: int
+        """
+        return self.__queue.qsize()
+
+    @property
+    def is_alive(self) -> bool:
+        """Worker thread is running.
+
+        :return: worker thread state
+        :rtype: bool
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def __start(self) -> None:
+        """Start worker thread if it is not running."""
+        with self.__lock:
+            if self.is_alive:
+                return
+            self.__thread = threading.Thread(target=self.__run, name=f"{self.__class__.__name__}", daemon=True)
+            self.__thread.start()
+            atexit.register(self.stop)
+
+    def __run(self) -> None:
+        """Worker thread main loop: pass records to the logger handlers."""
+        while True:
+            item = self.__queue.get()
+            try:
+                if item is _STOP:
+                    return
+                logger, record = item
+                logger.handle(record)
+            except Exception:  # pragma: no cover
+                # Handlers errors are processed by handlers itself, this is last resort
+                logging.getLogger(__name__).exception("Record emission failed")
+            finally:
+                self.__queue.task_done()
+
+    def __on_overflow(self) -> bool:
+        """Process overflow of the queue.
+
+        :return: record should be put to the queue with waiting
+        :rtype: bool
+        """
+        if self.__overflow == OverflowPolicy.BLOCK:
+            return True
+        with self.__lock:
+            self.__overflowed += 1
+            if self.__overflow == OverflowPolicy.SAMPLE and (self.__overflowed - 1) % self.__sample_rate == 0:
+                return True
+            self.__dropped += 1
+        return False
+
+    def submit(self, logger: logging.Logger, record: logging.LogRecord) -> bool:
+        """Submit record for the emission from the worker thread.
+
+        :param logger: logger, which handlers should process record
+        :type logger: logging.Logger
+        :param record: log record
+        :type record: logging.LogRecord
+        :return: record has been queued
+        :rtype: bool
+        """
+        if not self.is_alive:
+            self.__start()
+        try:
+            self.__queue.put_nowait((logger, record))
+        except queue.Full:
+            if not self.__on_overflow():
+                return False
+            self.__queue.put((logger, record))
+        return True
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait for processing of all queued records.
+
+        :param timeout: maximum time to wait (None: wait forever)
+        :type timeout: typing.Optional[float]
+        :return: all records has been processed
+        :rtype: bool
+        """
+        if not self.is_alive:
+            return self.__queue.unfinished_tasks == 0
+        deadline: typing.Optional[float] = None if timeout is None else time.monotonic() + timeout
+        with self.__queue.all_tasks_done:
+            while self.__queue.unfinished_tasks:
+                remaining: typing.Optional[float] = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.__queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: typing.Optional[float] = None) -> bool:
+        """Flush queued records and stop worker thread. Worker is restarted on the next record.
+
+        :param timeout: maximum time to wait (None: use flush_timeout from constructor)
+        :type timeout: typing.Optional[float]
+        :return: all records has been processed
+        :rtype: bool
+        """
+        with self.__lock:
+            thread: typing.Optional[threading.Thread] = self.__thread
+            if thread is None or not thread.is_alive():
+                return self.__queue.unfinished_tasks == 0
+            self.__thread = None
+            atexit.unregister(self.stop)
+        timeout = self.__flush_timeout if timeout is None else timeout
+        start: float = time.monotonic()
+        self.__queue.put(_STOP)
+        thread.join(timeout)
+        flushed: bool = not thread.is_alive()
+        if not flushed:  # pragma: no cover
+            logging.getLogger(__name__).warning(
+                "%s was not flushed in %.03fs: %d records left", self, time.monotonic() - start, self.queue_size
+            )
+        return flushed
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"max_queue_size={self.__queue.maxsize}, "
+            f"overflow={self.__overflow.value!r}, "
+            f"sample_rate={self.__sample_rate}, "
+            f"flush_timeout={self.__flush_timeout}, )"
+        )
@@ -20,28 +20,51 @@ from __future__ import annotations
 
 # Standard Library
 import asyncio
+import copy
+import enum
 import functools
 import inspect
 import logging
 import os
 import sys
+import time
 import traceback
 import types
 import typing
 
 # Package Implementation
 from logwrap import constants
+from logwrap import dedup as failures_dedup
+from logwrap import log_worker
+from logwrap import metrics as call_metrics
+from logwrap import records
+from logwrap import registry
 from logwrap import repr_utils
+from logwrap import sampling as sampling_policies
+from logwrap import watchdog
 
-__all__ = ("LogWrap", "logwrap", "BoundParameter", "bind_args_kwargs")
+__all__ = ("LogWrap", "logwrap", "BoundParameter", "bind_args_kwargs", "ArgsSnapshot")
 
 LOGGER: logging.Logger = logging.getLogger("logwrap")
 INDENT = 4
-_CURRENT_FILE = os.path.abspath(__file__)
+# Frames of logwrap itself are not logged in tracebacks
+_INTERNAL_PREFIXES: typing.Tuple[str, ...] = (os.path.dirname(os.path.abspath(__file__)) + os.sep,)
 
 _WrappedT = typing.TypeVar("_WrappedT", bound=typing.Callable[..., typing.Any])
 
 
+class ArgsSnapshot(str, enum.Enum):
+    """Snapshot policy for call arguments, which are rendered after call start (on failure or by background worker).
+
+    .. versionadded:: 10.0.0
+    """
+
+    REFERENCE = "reference"  # Keep references: mutated arguments are rendered with new values
+    SHALLOW = "shallow"  # copy.copy() of each logged argument
+    DEEP = "deep"  # copy.deepcopy() of each logged argument
+    REPR = "repr"  # Render arguments repr immediately
+
+
 class BoundParameter(inspect.Parameter):
     """Parameter-like object store BOUND with value parameter.
 
@@ -153,12 +176,611 @@ def bind_args_kwargs(sig: inspect.Signature, *args: typing.Any, **kwargs: typing
     return result
 
 
+def _render_annotation(param: inspect.Parameter) -> str:
+    """Render parameter annotation comment for the log record.
+
+    :param param: parameter from signature
+    :type param: inspect.Parameter
+    :return: annotation comment or empty string if parameter is not annotated
+    :rtype: str
+    """
+    if param.annotation is param.empty:
+        return ""
+    return f"  # type: {getattr(param.annotation, '__name__', param.annotation)!s}"
+
+
+def _render_kind_header(param: inspect.Parameter) -> str:
+    """Render parameter kind header for the log record.
+
+    :param param: parameter from signature
+    :type param: inspect.Parameter
+    :return: parameter kind header line
+    :rtype: str
+    """
+    return f"\n{'':<{INDENT}}# {param.kind!s}:"
+
+
+class _Blacklist(typing.NamedTuple):
+    """Blacklisted argument names and resolved indexes of parameters to log, published together."""
+
+    # Blacklisted names snapshot: compared by identity
+    names: typing.Tuple[str, ...]
+    # Indexes of parameters to log
+    logged_indices: typing.Tuple[int, ...]
+
+
+def _updating(method: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+    """Make list method, which updates snapshot of blacklisted names after change.
+
+    :param method: list method, which changes list in place
+    :type method: typing.Callable[..., typing.Any]
+    :return: method with snapshot update
+    :rtype: typing.Callable[..., typing.Any]
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: _BlacklistedNames, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.snapshot = tuple(self)
+
+    return wrapper
+
+
+class _BlacklistedNames(typing.List[str]):
+    """List of blacklisted argument names with snapshot, updated on each change in place.
+
+    Snapshot is replaced on each change, so call plans compare it by identity instead of comparing lists.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("snapshot",)
+
+    def __init__(self, names: typing.Iterable[str] = ()) -> None:
+        """List of blacklisted argument names with snapshot, updated on each change in place.
+
+        :param names: blacklisted argument names
+        :type names: typing.Iterable[str]
+        """
+        super().__init__(names)
+        self.snapshot: typing.Tuple[str, ...] = tuple(self)
+
+    __setitem__ = _updating(list.__setitem__)
+    __delitem__ = _updating(list.__delitem__)
+    __iadd__ = _updating(list.__iadd__)
+    __imul__ = _updating(list.__imul__)
+    append = _updating(list.append)
+    extend = _updating(list.extend)
+    insert = _updating(list.insert)
+    pop = _updating(list.pop)
+    remove = _updating(list.remove)
+    clear = _updating(list.clear)
+    sort = _updating(list.sort)
+    reverse = _updating(list.reverse)
+
+
+class _CallPlan:
+    """Precompiled per-function data for arguments binding and logging.
+
+    Built once on decoration and reused on each call of wrapped function.
+    """
+
+    __slots__ = (
+        "signature",
+        "parameters",
+        "names",
+        "kinds",
+        "prefixes",
+        "annotations",
+        "kind_headers",
+        "defaults",
+        "positional_count",
+        "var_positional_idx",
+        "var_keyword_idx",
+        "keyword_indices",
+        "blacklist",
+        "location",
+    )
+
+    def __init__(self, func: typing.Callable[..., typing.Any], blacklisted_names: typing.Iterable[str]) -> None:
+        """Precompiled per-function data for arguments binding and logging.
+
+        :param func: decorated function
+        :type func: typing.Callable[..., typing.Any]
+        :param blacklisted_names: Blacklisted argument names.
+        :type blacklisted_names: typing.Iterable[str]
+        """
+        self.signature: inspect.Signature = inspect.signature(func)
+        self.parameters: typing.Tuple[inspect.Parameter, ...] = tuple(self.signature.parameters.values())
+        self.names: typing.Tuple[str, ...] = tuple(param.name for param in self.parameters)
+        self.kinds: typing.Tuple[typing.Any, ...] = tuple(param.kind for param in self.parameters)
+        self.prefixes: typing.Tuple[str, ...] = tuple(f"\n{'':<{INDENT}}{param.name}=" for param in self.parameters)
+        self.annotations: typing.Tuple[str, ...] = tuple(_render_annotation(param) for param in self.parameters)
+        self.kind_headers: typing.Tuple[str, ...] = tuple(_render_kind_header(param) for param in self.parameters)
+        self.defaults: typing.Tuple[typing.Any, ...] = tuple(param.default for param in self.parameters)
+
+        self.positional_count: int = 0
+        self.var_positional_idx: typing.Optional[int] = None
+        self.var_keyword_idx: typing.Optional[int] = None
+        self.keyword_indices: typing.Dict[str, int] = {}
+        for idx, param in enumerate(self.parameters):
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                self.positional_count += 1
+            elif param.kind == param.VAR_POSITIONAL:
+                self.var_positional_idx = idx
+            elif param.kind == param.VAR_KEYWORD:
+                self.var_keyword_idx = idx
+            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+                self.keyword_indices[param.name] = idx
+
+        self.blacklist: _Blacklist = _Blacklist((), ())
+        self.set_blacklisted_names(blacklisted_names)
+        # Log records are attributed to the wrapped function
+        self.location: records.CodeLocation = records.code_location(func)
+
+    def set_blacklisted_names(self, blacklisted_names: typing.Iterable[str]) -> None:
+        """Resolve blacklisted argument names to the indexes of parameters to log.
+
+        :param blacklisted_names: Blacklisted argument names.
+        :type blacklisted_names: typing.Iterable[str]
+
+        Names and indexes are published by single assignment: concurrent calls never see them mismatched.
+        """
+        names: typing.Tuple[str, ...] = (
+            blacklisted_names if isinstance(blacklisted_names, tuple) else tuple(blacklisted_names)
+        )
+        self.blacklist = _Blacklist(names, tuple(idx for idx, name in enumerate(self.names) if name not in names))
+
+    def bind(
+        self,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.List[typing.Any]:
+        """Bind *args and **kwargs to the parameters values.
+
+        :param args: positional arguments
+        :type args: typing.Tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        :return: values in order of parameters. Not filled *args and **kwargs are `Parameter.empty`.
+        :rtype: typing.List[typing.Any]
+        :raises TypeError: arguments do not match signature
+
+        Values are bound without inspect.Signature.bind() if possible, signature is used only to raise error.
+        """
+        values: typing.List[typing.Any] = list(self.defaults)
+        n_args: int = len(args)
+        if n_args > self.positional_count:
+            if self.var_positional_idx is None:
+                return self.__bind_by_signature(args, kwargs)
+            values[: self.positional_count] = args[: self.positional_count]
+            values[self.var_positional_idx] = args[self.positional_count :]
+        else:
+            values[:n_args] = args
+
+        if kwargs:
+            extra: typing.Dict[str, typing.Any] = {}
+            for name, value in kwargs.items():
+                idx: typing.Optional[int] = self.keyword_indices.get(name, None)
+                if idx is None:
+                    if self.var_keyword_idx is None:
+                        return self.__bind_by_signature(args, kwargs)
+                    extra[name] = value
+                elif idx < n_args:  # multiple values for argument
+                    return self.__bind_by_signature(args, kwargs)
+                else:
+                    values[idx] = value
+            if extra:
+                values[self.var_keyword_idx] = extra  # type: ignore[index]
+
+        for idx in range(min(n_args, self.positional_count), len(values)):
+            if values[idx] is inspect.Parameter.empty and self.kinds[idx] not in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            ):
+                return self.__bind_by_signature(args, kwargs)
+        return values
+
+    def __bind_by_signature(
+        self,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.List[typing.Any]:
+        """Bind *args and **kwargs using signature (slow path).
+
+        :param args: positional arguments
+        :type args: typing.Tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        :return: values in order of parameters. Not filled *args and **kwargs are `Parameter.empty`.
+        :rtype: typing.List[typing.Any]
+        :raises TypeError: arguments do not match signature
+        """
+        bound: typing.MutableMapping[str, typing.Any] = self.signature.bind(*args, **kwargs).arguments
+        return [bound.get(name, default) for name, default in zip(self.names, self.defaults)]
+
+    def annotation(self, idx: int, param: inspect.Parameter) -> str:
+        """Get rendered annotation comment for parameter.
+
+        :param idx: parameter index in signature
+        :type idx: int
+        :param param: parameter (may be replaced during pre-processing)
+        :type param: inspect.Parameter
+        :return: annotation comment or empty string if parameter is not annotated
+        :rtype: str
+        """
+        if param.annotation is self.parameters[idx].annotation:
+            return self.annotations[idx]
+        return _render_annotation(param)
+
+    def kind_header(self, idx: int, param: inspect.Parameter) -> str:
+        """Get rendered kind header for parameter.
+
+        :param idx: parameter index in signature
+        :type idx: int
+        :param param: parameter (may be replaced during pre-processing)
+        :type param: inspect.Parameter
+        :return: parameter kind header line
+        :rtype: str
+        """
+        if param.kind == self.kinds[idx]:
+            return self.kind_headers[idx]
+        return _render_kind_header(param)
+
+
+class _LazyMessage:
+    """Log message, rendered on the first str() call and cached.
+
+    Text is rendered by handler (`LogRecord.getMessage()`), so records dropped by level, filters or handlers
+    do not spend time on formatting.
+    """
+
+    __slots__ = ("__source", "__text")
+
+    def __init__(self, render: typing.Callable[..., str], *params: typing.Any) -> None:
+        """Log message, rendered on the first str() call and cached.
+
+        :param render: text render function
+        :type render: typing.Callable[..., str]
+        :param params: positional arguments for render function
+        :type params: typing.Any
+        """
+        self.__source: typing.Optional[typing.Tuple[typing.Callable[..., str], typing.Tuple[typing.Any, ...]]] = (
+            render,
+            params,
+        )
+        self.__text: typing.Optional[str] = None
+
+    def __str__(self) -> str:
+        """Rendered message text.
+
+        :return: rendered text
+        :rtype: str
+        """
+        text: typing.Optional[str] = self.__text
+        if text is None:
+            source = self.__source
+            if source is None:  # Rendered in another thread
+                return self.__text  # type: ignore[return-value]
+            render, params = source
+            text = self.__text = render(*params)
+            # Do not keep arguments and result alive while record is stored by handlers
+            self.__source = None
+        return text
+
+    def __repr__(self) -> str:
+        """Debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"<{self.__class__.__name__}({self.__str__()!r})>"
+
+
+# Arguments repr: text (rendered on demand) or JSON-able mapping in structured mode
+_ArgumentsT = typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _structured_value(value: typing.Any) -> typing.Any:
+    """Convert value to the JSON-able form for structured records.
+
+    :param value: source value
+    :type value: typing.Any
+    :return: value itself for JSON scalars, compact repr for other objects
+    :rtype: typing.Any
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    try:
+        return repr(value)
+    except Exception as exc:  # pylint: disable=broad-except
+        return f"<{value.__class__.__name__} at 0x{id(value):X} (repr failed with reason: {exc})>"
+
+
+def _render_object_message(header: str, obj: typing.Any, formatter: repr_utils.PrettyRepr) -> str:
+    """Render record text with object repr (function execution result or yielded item).
+
+    :param header: record header with function name and execution time
+    :type header: str
+    :param obj: object to log
+    :type obj: typing.Any
+    :param formatter: object repr formatter
+    :type formatter: repr_utils.PrettyRepr
+    :return: record text
+    :rtype: str
+
+    Record is rendered lazily by handler, so repr failure is reported in record instead of raising.
+    """
+    try:
+        rendered: str = formatter(obj)
+    except Exception as exc:  # pylint: disable=broad-except
+        rendered = f"{object.__repr__(obj)} (repr failed with reason: {exc.__class__.__name__}: {exc})"
+    return f"{header}:\n{rendered}"
+
+
+def _format_duration(duration_ns: int) -> str:
+    """Format call duration for log record.
+
+    :param duration_ns: call duration in nanoseconds
+    :type duration_ns: int
+    :return: duration in seconds with microseconds precision
+    :rtype: str
+    """
+    return f"{duration_ns / 1_000_000_000:.06f}s"
+
+
+def _copy_values(
+    copier: typing.Callable[[typing.Any], typing.Any],
+    values: typing.List[typing.Any],
+    indices: typing.Iterable[int],
+) -> None:
+    """Replace values by copies in place. Values, which could not be copied, are kept by reference.
+
+    :param copier: copy function
+    :type copier: typing.Callable[[typing.Any], typing.Any]
+    :param values: bound values in order of parameters
+    :type values: typing.List[typing.Any]
+    :param indices: indexes of values to copy
+    :type indices: typing.Iterable[int]
+    """
+    for idx in indices:
+        try:
+            values[idx] = copier(values[idx])
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+def _capture_outer_frames(limit: typing.Optional[int]) -> typing.List[typing.Tuple[str, int, str]]:
+    """Capture caller frames positions without source lines lookup.
+
+    :param limit: maximum number of frames to capture (most recent are kept)
+    :type limit: typing.Optional[int]
+    :return: filename, line number and function name of the caller frames, the outermost first
+    :rtype: typing.List[typing.Tuple[str, int, str]]
+    """
+    frames: typing.List[typing.Tuple[str, int, str]] = []
+    frame: typing.Optional[types.FrameType] = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None and (limit is None or len(frames) < limit):
+        code: types.CodeType = frame.f_code
+        if not code.co_filename.startswith(_INTERNAL_PREFIXES):
+            frames.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _render_traceback(
+    outer_frames: typing.List[typing.Tuple[str, int, str]],
+    exc_tb: typing.Optional[types.TracebackType],
+    exception: BaseException,
+    limit: typing.Optional[int],
+) -> str:
+    """Render traceback text. Source lines are read only here.
+
+    :param outer_frames: caller frames captured on exception
+    :type outer_frames: typing.List[typing.Tuple[str, int, str]]
+    :param exc_tb: exception traceback captured on exception
+    :type exc_tb: typing.Optional[types.TracebackType]
+    :param exception: exception captured
+    :type exception: BaseException
+    :param limit: maximum number of frames to render (most recent are kept)
+    :type limit: typing.Optional[int]
+    :return: traceback text in the standard format
+    :rtype: str
+    """
+    frames: typing.List[typing.Tuple[str, int, str]] = list(outer_frames)
+    while exc_tb is not None:
+        code: types.CodeType = exc_tb.tb_frame.f_code
+        if not code.co_filename.startswith(_INTERNAL_PREFIXES):
+            frames.append((code.co_filename, exc_tb.tb_lineno, code.co_name))
+        exc_tb = exc_tb.tb_next
+    if limit is not None:
+        frames = frames[len(frames) - limit :]
+    summary: traceback.StackSummary = traceback.StackSummary.from_list(
+        [traceback.FrameSummary(filename, lineno, name) for filename, lineno, name in frames]
+    )
+    return (
+        f"Traceback (most recent call last):\n"
+        f"{''.join(summary.format())}"
+        f"{''.join(traceback.format_exception_only(exception.__class__, exception))}"
+    )
+
+
+class _WrappedFunction:
+    """Per-function data, shared by all calls of wrapped function.
+
+    Built once on decoration.
+    """
+
+    __slots__ = ("func", "name", "logger", "plan", "metrics", "state", "sampling_source", "sampling")
+
+    def __init__(
+        self,
+        func: typing.Callable[..., typing.Any],
+        logger: logging.Logger,
+        plan: _CallPlan,
+        state: registry._WrapperState,  # pylint: disable=protected-access
+        sampling: typing.Optional[sampling_policies.SamplingPolicy],
+    ) -> None:
+        """Per-function data, shared by all calls of wrapped function.
+
+        :param func: decorated function
+        :type func: typing.Callable[..., typing.Any]
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param plan: call plan of wrapped function
+        :type plan: _CallPlan
+        :param state: registry state of the wrapper: if disabled, wrapper passes calls through
+        :type state: registry._WrapperState
+        :param sampling: sampling policy of decorator
+        :type sampling: typing.Optional[sampling_policies.SamplingPolicy]
+        """
+        self.func: typing.Callable[..., typing.Any] = func
+        self.name: str = func.__name__
+        self.logger: logging.Logger = logger
+        self.plan: _CallPlan = plan
+        self.metrics: call_metrics.FunctionMetrics = call_metrics.FunctionMetrics(
+            f"{func.__module__}.{func.__qualname__}"
+        )
+        self.state: registry._WrapperState = state  # pylint: disable=protected-access
+        self.sampling_source: typing.Optional[sampling_policies.SamplingPolicy] = sampling
+        self.sampling: typing.Optional[sampling_policies.SamplingPolicy] = (
+            sampling.clone() if sampling is not None else None
+        )
+
+    def get_sampling(self, policy: sampling_policies.SamplingPolicy) -> sampling_policies.SamplingPolicy:
+        """Get own clone of decorator sampling policy: policy state is not shared between functions.
+
+        :param policy: current sampling policy of decorator
+        :type policy: sampling_policies.SamplingPolicy
+        :return: sampling policy of wrapped function
+        :rtype: sampling_policies.SamplingPolicy
+        """
+        if self.sampling is None or self.sampling_source is not policy:  # Policy has been changed on decorator
+            self.sampling_source = policy
+            self.sampling = policy.clone()
+        return self.sampling
+
+
+class _CallContext:
+    """Logging decisions and data of the single call, made before call and used after it."""
+
+    __slots__ = (
+        "target",
+        "method",
+        "args",
+        "kwargs",
+        "log_enabled",
+        "exc_enabled",
+        "calling_on_exc",
+        "collect_metrics",
+        "bind_late",
+        "arguments",
+        "slow_threshold_ns",
+        "merge_records",
+        "log_duration",
+        "log_items_every",
+        "measure",
+        "started",
+        "in_flight",
+    )
+
+    def __init__(
+        self,
+        target: _WrappedFunction,
+        method: str,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        """Logging decisions and data of the single call, made before call and used after it.
+
+        :param target: wrapped function data
+        :type target: _WrappedFunction
+        :param method: call method name for Calling record
+        :type method: str
+        :param args: positional arguments
+        :type args: typing.Tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        """
+        self.target: _WrappedFunction = target
+        self.method: str = method
+        self.args: typing.Tuple[typing.Any, ...] = args
+        self.kwargs: typing.Dict[str, typing.Any] = kwargs
+        self.log_enabled: bool = False
+        self.exc_enabled: bool = False
+        self.calling_on_exc: bool = False
+        self.collect_metrics: bool = False
+        self.bind_late: bool = False
+        self.arguments: _ArgumentsT = ""
+        self.slow_threshold_ns: typing.Optional[int] = None
+        self.merge_records: bool = False
+        self.log_duration: bool = False
+        self.log_items_every: int = 0
+        self.measure: bool = False
+        self.started: int = 0
+        self.in_flight: typing.Optional[watchdog.Watch] = None
+
+
+class _GeneratorFunction:
+    """Function-like wrapper of generator and async generator functions.
+
+    Arguments are bound eagerly on call, so wrapper itself can not be a generator function.
+    Wrapper is not ``types.FunctionType``, but exposes code object of wrapped function:
+    ``inspect.isgeneratorfunction`` and ``inspect.isasyncgenfunction`` recognize it as wrapped function does.
+    Code object is used only for introspection, calls are passed to the plain wrapper.
+
+    .. versionadded:: 10.0.0
+    """
+
+    def __init__(self, func: typing.Callable[..., typing.Any], call: typing.Callable[..., typing.Any]) -> None:
+        """Function-like wrapper of generator and async generator functions.
+
+        :param func: decorated generator or async generator function
+        :type func: typing.Callable[..., typing.Any]
+        :param call: plain wrapper, which binds arguments and returns logged generator
+        :type call: typing.Callable[..., typing.Any]
+        """
+        functools.update_wrapper(self, func)
+        self.__code__: types.CodeType = func.__code__
+        self.__defaults__: typing.Optional[typing.Tuple[typing.Any, ...]] = func.__defaults__
+        self.__kwdefaults__: typing.Optional[typing.Dict[str, typing.Any]] = func.__kwdefaults__
+        self.__call: typing.Callable[..., typing.Any] = call
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """Call wrapped function.
+
+        :return: logged generator or async generator
+        :rtype: typing.Any
+        """
+        return self.__call(*args, **kwargs)
+
+    def __get__(self, instance: typing.Any, owner: typing.Any = None) -> typing.Any:
+        """Bind to instance as plain function does.
+
+        :return: self for access from class, bound method for access from instance
+        :rtype: typing.Any
+        """
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __repr__(self) -> str:
+        """Representation for debug purposes."""
+        return f"<logged generator function {self.__qualname__} at 0x{id(self):X}>"  # type: ignore[attr-defined]
+
+
 class LogWrap:
     """Base class for LogWrap implementation."""
 
     __slots__ = (
         "__blacklisted_names",
         "__blacklisted_exceptions",
+        "__blacklisted_exceptions_cache",
         "__logger",
         "__log_level",
         "__exc_level",
@@ -167,6 +789,24 @@ class LogWrap:
         "__log_call_args_on_exc",
         "__log_traceback",
         "__log_result_obj",
+        "__worker",
+        "__sampling",
+        "__log_duration",
+        "__slow_threshold_ns",
+        "__collect_metrics",
+        "__log_items_every",
+        "__traceback_limit",
+        "__dedup",
+        "__errors_only",
+        "__args_snapshot",
+        "__merge_records",
+        "__in_flight_threshold",
+        "__structured",
+        "__max_items",
+        "__max_str_len",
+        "__max_total_chars",
+        "__formatter",
+        "__custom_params_processing",
     )
 
     def __init__(
@@ -181,6 +821,22 @@ class LogWrap:
         log_call_args_on_exc: bool = True,
         log_traceback: bool = True,
         log_result_obj: bool = True,
+        worker: typing.Optional[log_worker.LogWorker] = None,
+        sampling: typing.Optional[sampling_policies.SamplingPolicy] = None,
+        log_duration: bool = False,
+        slow_threshold: typing.Optional[float] = None,
+        collect_metrics: bool = False,
+        log_items_every: int = 0,
+        traceback_limit: typing.Optional[int] = None,
+        dedup: typing.Optional[failures_dedup.FailureDeduplicator] = None,
+        errors_only: bool = False,
+        args_snapshot: typing.Union[ArgsSnapshot, str] = ArgsSnapshot.REFERENCE,
+        merge_records: bool = False,
+        in_flight_threshold: typing.Optional[float] = None,
+        structured: bool = False,
+        max_items: typing.Optional[int] = None,
+        max_str_len: typing.Optional[int] = None,
+        max_total_chars: typing.Optional[int] = None,
     ) -> None:
         """Log function calls and return values.
 
@@ -205,21 +861,68 @@ class LogWrap:
         :type log_traceback: bool
         :param log_result_obj: log result of function call.
         :type log_result_obj: bool
+        :param worker: background worker for records formatting and emission. If not set: log from calling thread.
+        :type worker: typing.Optional[log_worker.LogWorker]
+        :param sampling: sampling policy (cloned per decorated function). Exceptions are logged regardless of policy.
+        :type sampling: typing.Optional[sampling_policies.SamplingPolicy]
+        :param log_duration: log call duration in Done and Failed records.
+        :type log_duration: bool
+        :param slow_threshold: log only calls longer than threshold (in seconds). Failed calls are always logged.
+        :type slow_threshold: typing.Optional[float]
+        :param collect_metrics: collect calls count, errors count and latency histogram (regardless of log levels).
+        :type collect_metrics: bool
+        :param log_items_every: for generators: log repr of each N-th yielded item (0: do not log items).
+        :type log_items_every: int
+        :param traceback_limit: maximum number of frames in logged traceback (most recent are kept).
+        :type traceback_limit: typing.Optional[int]
+        :param dedup: repeated failures suppression: log the first failure in full and periodic summaries.
+        :type dedup: typing.Optional[failures_dedup.FailureDeduplicator]
+        :param errors_only: log Calling record only if call failed, do not log successful calls.
+        :type errors_only: bool
+        :param args_snapshot: snapshot policy for arguments rendered after call start.
+        :type args_snapshot: typing.Union[ArgsSnapshot, str]
+        :param merge_records: emit single record with arguments, result and duration after call instead of pair.
+        :type merge_records: bool
+        :param in_flight_threshold: emit "In flight" record for calls running longer than threshold (in seconds).
+        :type in_flight_threshold: typing.Optional[float]
+        :param structured: emit short messages with call data in record attributes (see `logwrap.STRUCTURED_FIELDS`).
+        :type structured: bool
+        :param max_items: maximum number of shown items for each container in arguments and results repr.
+        :type max_items: typing.Optional[int]
+        :param max_str_len: maximum number of shown characters (bytes) for each string in arguments and results repr.
+        :type max_str_len: typing.Optional[int]
+        :param max_total_chars: approximate size limit for each argument and result repr.
+        :type max_total_chars: typing.Optional[int]
 
         .. versionchanged:: 3.3.0 Extract func from log and do not use Union.
         .. versionchanged:: 5.1.0 log_traceback parameter
         .. versionchanged:: 8.0.0 pick up logger from target module if possible
         .. versionchanged:: 9.0.0 Only LogWrap instance act as decorator
+        .. versionchanged:: 10.0.0 worker parameter
+        .. versionchanged:: 10.0.0 sampling parameter
+        .. versionchanged:: 10.0.0 log_duration and slow_threshold parameters
+        .. versionchanged:: 10.0.0 collect_metrics parameter
+        .. versionchanged:: 10.0.0 log_items_every parameter
+        .. versionchanged:: 10.0.0 traceback_limit parameter
+        .. versionchanged:: 10.0.0 dedup parameter
+        .. versionchanged:: 10.0.0 errors_only and args_snapshot parameters
+        .. versionchanged:: 10.0.0 merge_records and in_flight_threshold parameters
+        .. versionchanged:: 10.0.0 structured parameter
+        .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
         """
         # Typing fix:
         if blacklisted_names is None:
-            self.__blacklisted_names: typing.List[str] = []
+            self.__blacklisted_names: _BlacklistedNames = _BlacklistedNames()
         else:
-            self.__blacklisted_names = list(blacklisted_names)
+            self.__blacklisted_names = _BlacklistedNames(blacklisted_names)
         if blacklisted_exceptions is None:
             self.__blacklisted_exceptions: typing.List[typing.Type[Exception]] = []
         else:
             self.__blacklisted_exceptions = list(blacklisted_exceptions)
+        # Source list copy and tuple for isinstance: rebuilt only if list has been changed
+        self.__blacklisted_exceptions_cache: typing.Tuple[
+            typing.List[typing.Type[Exception]], typing.Tuple[typing.Type[Exception], ...]
+        ] = ([], ())
 
         if isinstance(log, logging.Logger):
             self.__logger: typing.Optional[logging.Logger] = log
@@ -229,10 +932,41 @@ class LogWrap:
         self.__log_level: int = log_level
         self.__exc_level: int = exc_level
         self.__max_indent: int = max_indent
+        # Formatter for arguments and results repr: made on demand and dropped on settings change
+        self.__formatter: typing.Optional[repr_utils.PrettyRepr] = None
         self.__log_call_args: bool = log_call_args
         self.__log_call_args_on_exc: bool = log_call_args_on_exc
         self.__log_traceback: bool = log_traceback
         self.__log_result_obj: bool = log_result_obj
+        self.__worker: typing.Optional[log_worker.LogWorker] = worker
+        self.__sampling: typing.Optional[sampling_policies.SamplingPolicy] = sampling
+        self.__log_duration: bool = log_duration
+        self.__slow_threshold_ns: typing.Optional[int] = None
+        self.slow_threshold = slow_threshold
+        self.__collect_metrics: bool = collect_metrics
+        self.__log_items_every: int = 0
+        self.log_items_every = log_items_every
+        self.__traceback_limit: typing.Optional[int] = None
+        self.traceback_limit = traceback_limit
+        self.__dedup: typing.Optional[failures_dedup.FailureDeduplicator] = dedup
+        self.__errors_only: bool = errors_only
+        self.__args_snapshot: ArgsSnapshot = ArgsSnapshot(args_snapshot)
+        self.__merge_records: bool = merge_records
+        self.__in_flight_threshold: typing.Optional[float] = None
+        self.in_flight_threshold = in_flight_threshold
+        self.__structured: bool = structured
+        self.__max_items: typing.Optional[int] = None
+        self.max_items = max_items
+        self.__max_str_len: typing.Optional[int] = None
+        self.max_str_len = max_str_len
+        self.__max_total_chars: typing.Optional[int] = None
+        self.max_total_chars = max_total_chars
+
+        # BoundParameter objects are required only if parameters processing is overridden
+        self.__custom_params_processing: bool = (
+            self.__class__.pre_process_param is not LogWrap.pre_process_param
+            or self.__class__.post_process_param is not LogWrap.post_process_param
+        )
 
         # We are not interested to pass any arguments to object
 
@@ -316,6 +1050,7 @@ class LogWrap:
         if not isinstance(val, int):
             raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
         self.__max_indent = val
+        self.__formatter = None
 
     @property
     def blacklisted_names(self) -> typing.List[str]:
@@ -420,124 +1155,661 @@ class LogWrap:
         self.__log_result_obj = val
 
     @property
-    def _logger(self) -> typing.Optional[logging.Logger]:
-        """Logger instance.
+    def worker(self) -> typing.Optional[log_worker.LogWorker]:
+        """Background worker for records formatting and emission.
 
-        :return: logger instance if configured
-        :rtype: typing.Optional[logging.Logger]
+        :return: background worker if used
+        :rtype: typing.Optional[log_worker.LogWorker]
         """
-        return self.__logger
+        return self.__worker
 
-    def __repr__(self) -> str:
-        """Repr for debug purposes.
+    @property
+    def sampling(self) -> typing.Optional[sampling_policies.SamplingPolicy]:
+        """Sampling policy for calls logging.
 
-        :return: representation for logging/debug purposes
-        :rtype: str
+        :return: sampling policy if used
+        :rtype: typing.Optional[sampling_policies.SamplingPolicy]
         """
-        return (
-            f"{self.__class__.__name__}("
-            f"log={self._logger}, "
-            f"log_level={self.log_level}, "
-            f"exc_level={self.exc_level}, "
-            f"max_indent={self.max_indent}, "
-            f"blacklisted_names={self.blacklisted_names}, "
-            f"blacklisted_exceptions={self.blacklisted_exceptions}, "
-            f"log_call_args={self.log_call_args}, "
-            f"log_call_args_on_exc={self.log_call_args_on_exc}, "
-            f"log_result_obj={self.log_result_obj}, )"
-        )
+        return self.__sampling
 
-    # noinspection PyMethodMayBeStatic
-    def pre_process_param(  # pylint: disable=no-self-use
-        self,
-        arg: BoundParameter,
-    ) -> typing.Union[BoundParameter, typing.Tuple[BoundParameter, typing.Any], None]:
-        """Process parameter for the future logging.
+    @sampling.setter
+    def sampling(self, val: typing.Optional[sampling_policies.SamplingPolicy]) -> None:
+        """Sampling policy for calls logging.
 
-        :param arg: bound parameter
-        :type arg: BoundParameter
-        :return: value, value override for logging or None if argument should not be logged.
-        :rtype: typing.Union[BoundParameter, typing.Tuple[BoundParameter, typing.Any], None]
+        :param val: sampling policy to use or None to log all calls
+        :type val: typing.Optional[sampling_policies.SamplingPolicy]
+        :raises TypeError: unexpected policy type
+        """
+        if val is not None and not isinstance(val, sampling_policies.SamplingPolicy):
+            raise TypeError(
+                f"Unexpected type: {val.__class__.__name__}. Should be {sampling_policies.SamplingPolicy.__name__}."
+            )
+        self.__sampling = val
 
-        Override this method if some modifications required for parameter value before logging
+    @property
+    def log_duration(self) -> bool:
+        """Flag: log call duration.
 
-        .. versionadded:: 3.3.0
+        :return: log call duration in Done and Failed records
+        :rtype: bool
         """
-        return arg
+        return self.__log_duration
 
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def post_process_param(  # pylint: disable=unused-argument, no-self-use
-        self,
-        arg: BoundParameter,
-        arg_repr: str,
-    ) -> str:
-        """Process parameter for the future logging.
+    @log_duration.setter
+    def log_duration(self, val: bool) -> None:
+        """Flag: log call duration.
 
-        :param arg: bound parameter
-        :type arg: BoundParameter
-        :param arg_repr: repr for value
-        :type arg_repr: str
-        :return: processed repr for value
-        :rtype: str
+        :param val: Enable flag
+        :type val: bool
+        :raises TypeError: Value is not bool
+        """
+        if not isinstance(val, bool):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {bool.__name__}.")
+        self.__log_duration = val
 
-        Override this method if some modifications required for result of repr() over parameter
+    @property
+    def slow_threshold(self) -> typing.Optional[float]:
+        """Minimal duration of logged calls in seconds.
 
-        .. versionadded:: 3.3.0
+        :return: threshold in seconds or None if all calls should be logged
+        :rtype: typing.Optional[float]
         """
-        return arg_repr
+        if self.__slow_threshold_ns is None:
+            return None
+        return self.__slow_threshold_ns / 1_000_000_000
+
+    @slow_threshold.setter
+    def slow_threshold(self, val: typing.Optional[float]) -> None:
+        """Minimal duration of logged calls in seconds.
+
+        :param val: threshold in seconds or None to log all calls
+        :type val: typing.Optional[float]
+        :raises TypeError: Value is not a number
+        :raises ValueError: Value is negative
+        """
+        if val is None:
+            self.__slow_threshold_ns = None
+            return
+        if isinstance(val, bool) or not isinstance(val, (int, float)):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {float.__name__}.")
+        if val < 0:
+            raise ValueError(f"slow_threshold should not be negative, got {val}")
+        self.__slow_threshold_ns = int(val * 1_000_000_000)
 
-    def _safe_val_repr(self, value: typing.Any) -> str:
-        """Try to get repr for value and provide fallback text in case of impossibility.
+    @property
+    def collect_metrics(self) -> bool:
+        """Flag: collect calls metrics.
 
-        :param value: value to try make repr
-        :type value: typing.Any
-        :return: repr string or fallback description
-        :rtype: str
+        :return: collect calls count, errors count and latency histogram
+        :rtype: bool
         """
-        try:
-            return repr_utils.pretty_repr(
-                src=value,
-                indent=INDENT + 4,
-                no_indent_start=True,
-                max_indent=self.max_indent,
-            )
-        except Exception as exc:
-            base_name: str = getattr(value, "name", getattr(value, "__name__", value.__class__.__name__))
-            base_details: str = f"at 0x{id(value):X} (repr failed with reason: {exc})"
-            if isinstance(value, types.FunctionType):  # pragma: no cover
-                return f"<function {base_name} {base_details}>"
-            if isinstance(value, types.MethodType):  # pragma: no cover
-                return f"<method {base_name} {base_details}>"
-            return f"<object {base_name} {base_details}>"
+        return self.__collect_metrics
 
-    def _get_func_args_repr(
-        self,
-        sig: inspect.Signature,
-        args: typing.Tuple[typing.Any, ...],
-        kwargs: typing.Dict[str, typing.Any],
-    ) -> str:
-        """Internal helper for reducing complexity of decorator code.
+    @collect_metrics.setter
+    def collect_metrics(self, val: bool) -> None:
+        """Flag: collect calls metrics.
 
-        :param sig: function signature
-        :type sig: inspect.Signature
-        :param args: positional arguments
-        :type args: typing.Tuple
-        :param kwargs: keyword arguments
-        :type kwargs: typing.Dict[str, typing.Any]
-        :return: repr over function arguments
+        :param val: Enable flag
+        :type val: bool
+        :raises TypeError: Value is not bool
+        """
+        if not isinstance(val, bool):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {bool.__name__}.")
+        self.__collect_metrics = val
+
+    @property
+    def log_items_every(self) -> int:
+        """Log repr of each N-th item yielded by generator.
+
+        :return: items sampling rate (0: do not log items)
+        :rtype: int
+        """
+        return self.__log_items_every
+
+    @log_items_every.setter
+    def log_items_every(self, val: int) -> None:
+        """Log repr of each N-th item yielded by generator.
+
+        :param val: items sampling rate (0: do not log items)
+        :type val: int
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        if isinstance(val, bool) or not isinstance(val, int):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
+        if val < 0:
+            raise ValueError(f"log_items_every should not be negative, got {val}")
+        self.__log_items_every = val
+
+    @property
+    def traceback_limit(self) -> typing.Optional[int]:
+        """Maximum number of frames in logged traceback.
+
+        :return: frames limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__traceback_limit
+
+    @traceback_limit.setter
+    def traceback_limit(self, val: typing.Optional[int]) -> None:
+        """Maximum number of frames in logged traceback.
+
+        :param val: frames limit or None to log full traceback
+        :type val: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        if val is None:
+            self.__traceback_limit = None
+            return
+        if isinstance(val, bool) or not isinstance(val, int):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
+        if val < 0:
+            raise ValueError(f"traceback_limit should not be negative, got {val}")
+        self.__traceback_limit = val
+
+    @property
+    def dedup(self) -> typing.Optional[failures_dedup.FailureDeduplicator]:
+        """Repeated failures suppression.
+
+        :return: failures deduplicator if used
+        :rtype: typing.Optional[failures_dedup.FailureDeduplicator]
+        """
+        return self.__dedup
+
+    @dedup.setter
+    def dedup(self, val: typing.Optional[failures_dedup.FailureDeduplicator]) -> None:
+        """Repeated failures suppression.
+
+        :param val: failures deduplicator or None to log all failures in full
+        :type val: typing.Optional[failures_dedup.FailureDeduplicator]
+        :raises TypeError: unexpected type
+        """
+        if val is not None and not isinstance(val, failures_dedup.FailureDeduplicator):
+            raise TypeError(
+                f"Unexpected type: {val.__class__.__name__}. Should be {failures_dedup.FailureDeduplicator.__name__}."
+            )
+        self.__dedup = val
+
+    @property
+    def errors_only(self) -> bool:
+        """Log Calling record only if call failed.
+
+        :return: errors only mode is enabled
+        :rtype: bool
+        """
+        return self.__errors_only
+
+    @errors_only.setter
+    def errors_only(self, val: bool) -> None:
+        """Log Calling record only if call failed.
+
+        :param val: Enable flag
+        :type val: bool
+        :raises TypeError: Value is not bool
+        """
+        if not isinstance(val, bool):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {bool.__name__}.")
+        self.__errors_only = val
+
+    @property
+    def args_snapshot(self) -> ArgsSnapshot:
+        """Snapshot policy for arguments rendered after call start.
+
+        :return: snapshot policy
+        :rtype: ArgsSnapshot
+        """
+        return self.__args_snapshot
+
+    @args_snapshot.setter
+    def args_snapshot(self, val: typing.Union[ArgsSnapshot, str]) -> None:
+        """Snapshot policy for arguments rendered after call start.
+
+        :param val: snapshot policy
+        :type val: typing.Union[ArgsSnapshot, str]
+        :raises TypeError: Value is not ArgsSnapshot or str
+        :raises ValueError: Unknown policy
+        """
+        if not isinstance(val, str):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {ArgsSnapshot.__name__}.")
+        self.__args_snapshot = ArgsSnapshot(val)
+
+    @property
+    def merge_records(self) -> bool:
+        """Emit single record per call after call instead of Calling and Done records.
+
+        :return: merged records mode is enabled
+        :rtype: bool
+        """
+        return self.__merge_records
+
+    @merge_records.setter
+    def merge_records(self, val: bool) -> None:
+        """Emit single record per call after call instead of Calling and Done records.
+
+        :param val: Enable flag
+        :type val: bool
+        :raises TypeError: Value is not bool
+        """
+        if not isinstance(val, bool):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {bool.__name__}.")
+        self.__merge_records = val
+
+    @property
+    def in_flight_threshold(self) -> typing.Optional[float]:
+        """Call duration in seconds, after which "In flight" record is emitted for the running call.
+
+        :return: threshold in seconds or None if calls in flight are not reported
+        :rtype: typing.Optional[float]
+        """
+        return self.__in_flight_threshold
+
+    @in_flight_threshold.setter
+    def in_flight_threshold(self, val: typing.Optional[float]) -> None:
+        """Call duration in seconds, after which "In flight" record is emitted for the running call.
+
+        :param val: threshold in seconds or None to not report calls in flight
+        :type val: typing.Optional[float]
+        :raises TypeError: Value is not a number
+        :raises ValueError: Value is not positive
+        """
+        if val is None:
+            self.__in_flight_threshold = None
+            return
+        if isinstance(val, bool) or not isinstance(val, (int, float)):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {float.__name__}.")
+        if val <= 0:
+            raise ValueError(f"in_flight_threshold should be positive, got {val}")
+        self.__in_flight_threshold = float(val)
+
+    @property
+    def structured(self) -> bool:
+        """Emit short messages with call data in record attributes instead of rendered multi-line messages.
+
+        :return: structured records mode is enabled
+        :rtype: bool
+        """
+        return self.__structured
+
+    @structured.setter
+    def structured(self, val: bool) -> None:
+        """Emit short messages with call data in record attributes instead of rendered multi-line messages.
+
+        :param val: Enable flag
+        :type val: bool
+        :raises TypeError: Value is not bool
+        """
+        if not isinstance(val, bool):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {bool.__name__}.")
+        self.__structured = val
+
+    @property
+    def max_items(self) -> typing.Optional[int]:
+        """Maximum number of shown items for each container in arguments and results repr.
+
+        :return: items limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_items
+
+    @max_items.setter
+    def max_items(self, val: typing.Optional[int]) -> None:
+        """Maximum number of shown items for each container in arguments and results repr.
+
+        :param val: items limit or None to show all items
+        :type val: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        if val is None:
+            self.__max_items = None
+            self.__formatter = None
+            return
+        if isinstance(val, bool) or not isinstance(val, int):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
+        if val < 0:
+            raise ValueError(f"max_items should not be negative, got {val}")
+        self.__max_items = val
+        self.__formatter = None
+
+    @property
+    def max_str_len(self) -> typing.Optional[int]:
+        """Maximum number of shown characters (bytes) for each string in arguments and results repr.
+
+        :return: string length limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_str_len
+
+    @max_str_len.setter
+    def max_str_len(self, val: typing.Optional[int]) -> None:
+        """Maximum number of shown characters (bytes) for each string in arguments and results repr.
+
+        :param val: string length limit or None to show whole strings
+        :type val: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        if val is None:
+            self.__max_str_len = None
+            self.__formatter = None
+            return
+        if isinstance(val, bool) or not isinstance(val, int):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
+        if val < 0:
+            raise ValueError(f"max_str_len should not be negative, got {val}")
+        self.__max_str_len = val
+        self.__formatter = None
+
+    @property
+    def max_total_chars(self) -> typing.Optional[int]:
+        """Approximate size limit for each argument and result repr.
+
+        :return: size limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_total_chars
+
+    @max_total_chars.setter
+    def max_total_chars(self, val: typing.Optional[int]) -> None:
+        """Approximate size limit for each argument and result repr.
+
+        :param val: size limit or None to not limit repr size
+        :type val: typing.Optional[int]
+        :raises TypeError: Value is not int
+        :raises ValueError: Value is negative
+        """
+        if val is None:
+            self.__max_total_chars = None
+            self.__formatter = None
+            return
+        if isinstance(val, bool) or not isinstance(val, int):
+            raise TypeError(f"Unexpected type: {val.__class__.__name__}. Should be {int.__name__}.")
+        if val < 0:
+            raise ValueError(f"max_total_chars should not be negative, got {val}")
+        self.__max_total_chars = val
+        self.__formatter = None
+
+    @property
+    def _logger(self) -> typing.Optional[logging.Logger]:
+        """Logger instance.
+
+        :return: logger instance if configured
+        :rtype: typing.Optional[logging.Logger]
+        """
+        return self.__logger
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"log={self._logger}, "
+            f"log_level={self.log_level}, "
+            f"exc_level={self.exc_level}, "
+            f"max_indent={self.max_indent}, "
+            f"blacklisted_names={self.blacklisted_names}, "
+            f"blacklisted_exceptions={self.blacklisted_exceptions}, "
+            f"log_call_args={self.log_call_args}, "
+            f"log_call_args_on_exc={self.log_call_args_on_exc}, "
+            f"log_traceback={self.log_traceback}, "
+            f"log_result_obj={self.log_result_obj}, "
+            f"worker={self.worker}, "
+            f"sampling={self.sampling}, "
+            f"log_duration={self.log_duration}, "
+            f"slow_threshold={self.slow_threshold}, "
+            f"collect_metrics={self.collect_metrics}, "
+            f"log_items_every={self.log_items_every}, "
+            f"traceback_limit={self.traceback_limit}, "
+            f"dedup={self.dedup}, "
+            f"errors_only={self.errors_only}, "
+            f"args_snapshot={self.args_snapshot.value}, "
+            f"merge_records={self.merge_records}, "
+            f"in_flight_threshold={self.in_flight_threshold}, "
+            f"structured={self.structured}, "
+            f"max_items={self.max_items}, "
+            f"max_str_len={self.max_str_len}, "
+            f"max_total_chars={self.max_total_chars}, )"
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def pre_process_param(  # pylint: disable=no-self-use
+        self,
+        arg: BoundParameter,
+    ) -> typing.Union[BoundParameter, typing.Tuple[BoundParameter, typing.Any], None]:
+        """Process parameter for the future logging.
+
+        :param arg: bound parameter
+        :type arg: BoundParameter
+        :return: value, value override for logging or None if argument should not be logged.
+        :rtype: typing.Union[BoundParameter, typing.Tuple[BoundParameter, typing.Any], None]
+
+        Override this method if some modifications required for parameter value before logging
+
+        .. versionadded:: 3.3.0
+        """
+        return arg
+
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def post_process_param(  # pylint: disable=unused-argument, no-self-use
+        self,
+        arg: BoundParameter,
+        arg_repr: str,
+    ) -> str:
+        """Process parameter for the future logging.
+
+        :param arg: bound parameter
+        :type arg: BoundParameter
+        :param arg_repr: repr for value
+        :type arg_repr: str
+        :return: processed repr for value
+        :rtype: str
+
+        Override this method if some modifications required for result of repr() over parameter
+
+        .. versionadded:: 3.3.0
+        """
+        return arg_repr
+
+    def _repr_formatter(self) -> repr_utils.PrettyRepr:
+        """Formatter for arguments and results repr.
+
+        Formatter is made once and reused until indentation or output size settings change.
+
+        :return: formatter with configured indentation and output size budgets
+        :rtype: repr_utils.PrettyRepr
+        """
+        formatter: typing.Optional[repr_utils.PrettyRepr] = self.__formatter
+        if formatter is None:
+            formatter = self.__formatter = repr_utils.PrettyRepr(
+                max_indent=self.max_indent,
+                max_items=self.max_items,
+                max_str_len=self.max_str_len,
+                max_total_chars=self.max_total_chars,
+            )
+        return formatter
+
+    def _safe_val_repr(self, value: typing.Any) -> str:
+        """Try to get repr for value and provide fallback text in case of impossibility.
+
+        :param value: value to try make repr
+        :type value: typing.Any
+        :return: repr string or fallback description
         :rtype: str
+        """
+        try:
+            return self._repr_formatter()(
+                src=value,
+                indent=INDENT + 4,
+                no_indent_start=True,
+            )
+        except Exception as exc:
+            base_name: str = getattr(value, "name", getattr(value, "__name__", value.__class__.__name__))
+            base_details: str = f"at 0x{id(value):X} (repr failed with reason: {exc})"
+            if isinstance(value, types.FunctionType):  # pragma: no cover
+                return f"<function {base_name} {base_details}>"
+            if isinstance(value, types.MethodType):  # pragma: no cover
+                return f"<method {base_name} {base_details}>"
+            return f"<object {base_name} {base_details}>"
+
+    def _get_func_args_repr(
+        self,
+        plan: _CallPlan,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> _ArgumentsT:
+        """Internal helper for reducing complexity of decorator code.
+
+        :param plan: precompiled function call plan
+        :type plan: _CallPlan
+        :param args: positional arguments
+        :type args: typing.Tuple
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        :return: repr over function arguments, rendered on demand. In structured mode: JSON-able mapping.
+        :rtype: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
+        :raises TypeError: arguments do not match signature
 
         .. versionchanged:: 3.3.0 Use pre- and post- processing of params during execution
+        .. versionchanged:: 10.0.0 Bind arguments immediately and render repr on demand
+        .. versionchanged:: 10.0.0 Arguments snapshot policy
+        .. versionchanged:: 10.0.0 Structured mode
         """
         if not (self.log_call_args or self.log_call_args_on_exc):
             return ""
 
+        names: typing.Tuple[str, ...] = self.__blacklisted_names.snapshot
+        if plan.blacklist.names is not names:
+            plan.set_blacklisted_names(names)
+
+        values: typing.List[typing.Any] = plan.bind(args, kwargs)
+        if self.__structured:  # Compact values are made immediately: snapshot is not required
+            return self._get_structured_args(plan, values)
+        if self.__args_snapshot == ArgsSnapshot.SHALLOW:
+            _copy_values(copy.copy, values, plan.blacklist.logged_indices)
+        elif self.__args_snapshot == ArgsSnapshot.DEEP:
+            _copy_values(copy.deepcopy, values, plan.blacklist.logged_indices)
+        elif self.__args_snapshot == ArgsSnapshot.REPR:
+            return self._render_func_args(plan, values)
+        return _LazyMessage(self._render_func_args, plan, values)
+
+    def _get_func_args_repr_after_call(
+        self,
+        plan: _CallPlan,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> _ArgumentsT:
+        """Bind call arguments after failed call, which has not been logged on start.
+
+        :param plan: call plan of wrapped function
+        :type plan: _CallPlan
+        :param args: positional arguments
+        :type args: typing.Tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        :return: deferred arguments repr or empty string if arguments do not match signature
+        :rtype: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
+
+        .. versionadded:: 10.0.0
+        """
+        try:
+            return self._get_func_args_repr(plan=plan, args=args, kwargs=kwargs)
+        except TypeError:  # Function has not been called: arguments do not match signature
+            return ""
+
+    def _get_structured_args(self, plan: _CallPlan, values: typing.List[typing.Any]) -> typing.Dict[str, typing.Any]:
+        """Get JSON-able arguments mapping for structured mode.
+
+        JSON scalars are kept as is, other values are replaced by compact repr.
+        Pre-processing of parameters is applied, post-processing is applied to repr of non-scalar values.
+
+        :param plan: precompiled function call plan
+        :type plan: _CallPlan
+        :param values: bound values in order of parameters
+        :type values: typing.List[typing.Any]
+        :return: argument values by name
+        :rtype: typing.Dict[str, typing.Any]
+
+        .. versionadded:: 10.0.0
+        """
+        result: typing.Dict[str, typing.Any] = {}
+        for idx in plan.blacklist.logged_indices:
+            value: typing.Any = values[idx]
+            if self.__custom_params_processing:
+                param: BoundParameter = BoundParameter(parameter=plan.parameters[idx], value=value)
+                preprocessed: typing.Union[
+                    BoundParameter, typing.Tuple[BoundParameter, typing.Any], None
+                ] = self.pre_process_param(param)
+                if preprocessed is None:
+                    continue
+                if isinstance(preprocessed, (tuple, list)):
+                    param, value = preprocessed
+                else:
+                    value = param.value
+            if value is inspect.Parameter.empty:
+                if plan.kinds[idx] == inspect.Parameter.VAR_POSITIONAL:
+                    value = ()
+                elif plan.kinds[idx] == inspect.Parameter.VAR_KEYWORD:
+                    value = {}
+            compact: typing.Any = _structured_value(value)
+            if self.__custom_params_processing and isinstance(compact, str) and compact is not value:
+                compact = self.post_process_param(param, compact)
+            result[plan.names[idx]] = compact
+        return result
+
+    def _render_func_args(self, plan: _CallPlan, values: typing.List[typing.Any]) -> str:
+        """Render repr over bound function arguments.
+
+        :param plan: precompiled function call plan
+        :type plan: _CallPlan
+        :param values: bound values in order of parameters
+        :type values: typing.List[typing.Any]
+        :return: repr over function arguments
+        :rtype: str
+
+        .. versionadded:: 10.0.0
+        """
+        if self.__custom_params_processing:
+            return self.__get_processed_args_repr(plan, values)
+
+        buf: typing.List[str] = []
+        last_kind = None
+        for idx in plan.blacklist.logged_indices:
+            value = values[idx]
+            kind = plan.kinds[idx]
+            if value is inspect.Parameter.empty:
+                if kind == inspect.Parameter.VAR_POSITIONAL:
+                    value = ()
+                elif kind == inspect.Parameter.VAR_KEYWORD:
+                    value = {}
+
+            if last_kind != kind:
+                buf.append(plan.kind_headers[idx])
+                last_kind = kind
+
+            buf.append(f"{plan.prefixes[idx]}{self._safe_val_repr(value)},{plan.annotations[idx]}")
+        if buf:
+            buf.append("\n")
+        return "".join(buf)
+
+    def __get_processed_args_repr(self, plan: _CallPlan, values: typing.List[typing.Any]) -> str:
+        """Get arguments repr with pre- and post- processing of bound parameters.
+
+        :param plan: precompiled function call plan
+        :type plan: _CallPlan
+        :param values: bound values in order of parameters
+        :type values: typing.List[typing.Any]
+        :return: repr over function arguments
+        :rtype: str
+        """
         param_str: str = ""
 
         last_kind = None
-        for param in bind_args_kwargs(sig, *args, **kwargs):
-            if param.name in self.blacklisted_names:
-                continue
+        for idx in plan.blacklist.logged_indices:
+            param: BoundParameter = BoundParameter(parameter=plan.parameters[idx], value=values[idx])
 
             preprocessed: typing.Union[
                 BoundParameter, typing.Tuple[BoundParameter, typing.Any], None
@@ -561,20 +1833,95 @@ class LogWrap:
             val = self.post_process_param(param, val)
 
             if last_kind != param.kind:
-                param_str += f"\n{'':<{INDENT}}# {param.kind!s}:"
+                param_str += plan.kind_header(idx, param)
                 last_kind = param.kind
 
-            if param.annotation is param.empty:
-                annotation: str = ""
-            else:
-                annotation = f"  # type: {getattr(param.annotation, '__name__', param.annotation)!s}"
-
-            param_str += f"\n{'':<{INDENT}}{param.name}={val},{annotation}"
+            param_str += f"\n{'':<{INDENT}}{param.name}={val},{plan.annotation(idx, param)}"
         if param_str:
             param_str += "\n"
         return param_str
 
-    def _make_done_record(self, logger: logging.Logger, func_name: str, result: typing.Any) -> None:
+    def _emit(
+        self,
+        logger: logging.Logger,
+        level: int,
+        msg: typing.Union[str, _LazyMessage],
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+        extra: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        exc_info: typing.Optional[
+            typing.Tuple[typing.Type[BaseException], BaseException, typing.Optional[types.TracebackType]]
+        ] = None,
+    ) -> None:
+        """Emit log record from calling thread or using background worker.
+
+        Record is made directly: `logging.Logger.findCaller` is not used.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param level: log level
+        :type level: int
+        :param msg: record message
+        :type msg: typing.Union[str, _LazyMessage]
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+        :param extra: additional record attributes (structured mode)
+        :type extra: typing.Optional[typing.Dict[str, typing.Any]]
+        :param exc_info: exception information for the record (structured mode)
+        :type exc_info: typing.Optional[typing.Tuple[typing.Type[BaseException], BaseException, types.TracebackType]]
+
+        .. versionadded:: 10.0.0
+        """
+        if self.__worker is None:
+            records.emit(logger, level, msg, location, extra, exc_info)
+        elif logger.isEnabledFor(level):
+            self.__worker.submit(logger, records.make_record(logger, level, msg, location, extra, exc_info))
+
+    @staticmethod
+    def _make_structured_extra(
+        name: str,
+        location: records.CodeLocation,
+        outcome: str,
+        arguments: typing.Optional[_ArgumentsT] = None,
+        result: typing.Any = None,
+        duration_ns: typing.Optional[int] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """Make record attributes for structured mode.
+
+        :param name: function name
+        :type name: str
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+        :param outcome: call stage or result: calling, in_flight, yielded, success, closed or failure
+        :type outcome: str
+        :param arguments: structured arguments (text arguments repr is not logged)
+        :type arguments: typing.Optional[typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]]
+        :param result: result or yielded item in JSON-able form
+        :type result: typing.Any
+        :param duration_ns: call duration in nanoseconds
+        :type duration_ns: typing.Optional[int]
+        :return: record attributes
+        :rtype: typing.Dict[str, typing.Any]
+
+        .. versionadded:: 10.0.0
+        """
+        return {
+            "func": name,
+            "func_module": location.module,
+            "qualname": location.qualname,
+            "call_args": arguments if isinstance(arguments, dict) else None,
+            "result": result,
+            "duration_ns": duration_ns,
+            "outcome": outcome,
+        }
+
+    def _make_done_record(
+        self,
+        logger: logging.Logger,
+        func_name: str,
+        result: typing.Any,
+        duration_ns: typing.Optional[int] = None,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
         """Construct success record.
 
         :param logger: logger instance to use
@@ -583,14 +1930,251 @@ class LogWrap:
         :type func_name: str
         :param result: function execution result
         :type result: typing.Any
+        :param duration_ns: call duration in nanoseconds if should be logged
+        :type duration_ns: typing.Optional[int]
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+
+        .. versionchanged:: 10.0.0 result repr is rendered on demand
+        .. versionchanged:: 10.0.0 duration_ns parameter
+        .. versionchanged:: 10.0.0 location parameter
         """
-        msg: str = f"Done: {func_name!r}"
+        msg: typing.Union[str, _LazyMessage] = f"Done: {func_name!r}"
+        if duration_ns is not None:
+            msg = f"{msg} at {_format_duration(duration_ns)}"
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=msg,
+                location=location,
+                extra=self._make_structured_extra(
+                    name=func_name,
+                    location=location,
+                    outcome="success",
+                    result=_structured_value(result) if self.log_result_obj else None,
+                    duration_ns=duration_ns,
+                ),
+            )
+            return
+        if self.log_result_obj:
+            msg = _LazyMessage(_render_object_message, f"{msg} with result", result, self._repr_formatter())
+        self._emit(logger=logger, level=self.log_level, msg=msg, location=location)
+
+    def _make_merged_record(
+        self,
+        logger: logging.Logger,
+        name: str,
+        arguments: _ArgumentsT,
+        result: typing.Any,
+        duration_ns: int,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
+        """Make single log record for the finished call.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param name: function name
+        :type name: str
+        :param arguments: function arguments repr
+        :type arguments: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
+        :param result: function execution result
+        :type result: typing.Any
+        :param duration_ns: call duration in nanoseconds
+        :type duration_ns: int
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
 
+        .. versionadded:: 10.0.0
+        """
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=f"Done: {name!r} at {_format_duration(duration_ns)}",
+                location=location,
+                extra=self._make_structured_extra(
+                    name=name,
+                    location=location,
+                    outcome="success",
+                    arguments=arguments if self.log_call_args else None,
+                    result=_structured_value(result) if self.log_result_obj else None,
+                    duration_ns=duration_ns,
+                ),
+            )
+            return
+        template: str = "Done: {0!r} at {1}\n{0}({2})"
+        if self.log_result_obj:
+            template += "\nwith result"
+        msg: _LazyMessage = _LazyMessage(
+            template.format,
+            name,
+            _format_duration(duration_ns),
+            arguments if self.log_call_args else "",
+        )
         if self.log_result_obj:
-            msg += f" with result:\n{repr_utils.pretty_repr(result, max_indent=self.max_indent)}"
-        logger.log(level=self.log_level, msg=msg)
+            msg = _LazyMessage(_render_object_message, msg, result, self._repr_formatter())
+        self._emit(logger=logger, level=self.log_level, msg=msg, location=location)
+
+    def _make_in_flight_record(
+        self,
+        logger: logging.Logger,
+        name: str,
+        arguments: _ArgumentsT,
+        started: int,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
+        """Make log record for the call running longer than in flight threshold. Called from the watchdog thread.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param name: function name
+        :type name: str
+        :param arguments: function arguments repr
+        :type arguments: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
+        :param started: call start timestamp (`time.perf_counter_ns()`)
+        :type started: int
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+
+        .. versionadded:: 10.0.0
+        """
+        duration_ns: int = time.perf_counter_ns() - started
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=f"In flight: {name!r} running for {_format_duration(duration_ns)}",
+                location=location,
+                extra=self._make_structured_extra(
+                    name=name,
+                    location=location,
+                    outcome="in_flight",
+                    arguments=arguments if self.log_call_args else None,
+                    duration_ns=duration_ns,
+                ),
+            )
+            return
+        self._emit(
+            logger=logger,
+            level=self.log_level,
+            msg=_LazyMessage(
+                "In flight: {0!r} running for {1}\n{0}({2})".format,
+                name,
+                _format_duration(duration_ns),
+                arguments if self.log_call_args else "",
+            ),
+            location=location,
+        )
+
+    def _make_item_record(
+        self,
+        logger: logging.Logger,
+        func_name: str,
+        index: int,
+        item: typing.Any,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
+        """Make log record for the item yielded by generator.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param func_name: function name
+        :type func_name: str
+        :param index: item number (starting from 1)
+        :type index: int
+        :param item: yielded item
+        :type item: typing.Any
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+
+        .. versionadded:: 10.0.0
+        """
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=f"Yielded: {func_name!r} item #{index}",
+                location=location,
+                extra=self._make_structured_extra(
+                    name=func_name,
+                    location=location,
+                    outcome="yielded",
+                    result=_structured_value(item),
+                ),
+            )
+            return
+        self._emit(
+            logger=logger,
+            level=self.log_level,
+            msg=_LazyMessage(
+                _render_object_message,
+                f"Yielded: {func_name!r} item #{index}",
+                item,
+                self._repr_formatter(),
+            ),
+            location=location,
+        )
+
+    def _make_iteration_done_record(
+        self,
+        logger: logging.Logger,
+        func_name: str,
+        items: int,
+        duration_ns: int,
+        result: typing.Any = None,
+        closed: bool = False,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
+        """Make log record on the generator exhaustion or close.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param func_name: function name
+        :type func_name: str
+        :param items: number of items yielded
+        :type items: int
+        :param duration_ns: total iteration time in nanoseconds
+        :type duration_ns: int
+        :param result: generator return value
+        :type result: typing.Any
+        :param closed: generator was closed by consumer before exhaustion
+        :type closed: bool
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
 
-    def _make_calling_record(self, logger: logging.Logger, name: str, arguments: str, method: str = "Calling") -> None:
+        .. versionadded:: 10.0.0
+        """
+        msg: typing.Union[str, _LazyMessage] = (
+            f"{'Closed' if closed else 'Done'}: {func_name!r} yielded {items} items at {_format_duration(duration_ns)}"
+        )
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=msg,
+                location=location,
+                extra=self._make_structured_extra(
+                    name=func_name,
+                    location=location,
+                    outcome="closed" if closed else "success",
+                    result=_structured_value(result) if self.log_result_obj else None,
+                    duration_ns=duration_ns,
+                ),
+            )
+            return
+        if self.log_result_obj and result is not None:
+            msg = _LazyMessage(_render_object_message, f"{msg} with result", result, self._repr_formatter())
+        self._emit(logger=logger, level=self.log_level, msg=msg, location=location)
+
+    def _make_calling_record(
+        self,
+        logger: logging.Logger,
+        name: str,
+        arguments: _ArgumentsT,
+        method: str = "Calling",
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
         """Make log record before execution.
 
         :param logger: logger instance to use
@@ -598,13 +2182,79 @@ class LogWrap:
         :param name: function name
         :type name: str
         :param arguments: function arguments repr
-        :type arguments: str
+        :type arguments: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
         :param method: "calling" or "awaiting"
         :type method: str
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+
+        .. versionchanged:: 10.0.0 arguments repr is rendered on demand
+        .. versionchanged:: 10.0.0 location parameter
+        """
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.log_level,
+                msg=f"{method}: {name!r}",
+                location=location,
+                extra=self._make_structured_extra(
+                    name=name,
+                    location=location,
+                    outcome="calling",
+                    arguments=arguments if self.log_call_args else None,
+                ),
+            )
+            return
+        self._emit(
+            logger=logger,
+            level=self.log_level,
+            msg=_LazyMessage("{}: \n{}({})".format, method, name, arguments if self.log_call_args else ""),
+            location=location,
+        )
+
+    def _make_repeated_record(
+        self,
+        logger: logging.Logger,
+        name: str,
+        exc_name: str,
+        location: records.CodeLocation,
+        repeated: int,
+        period: float,
+    ) -> None:
+        """Make summary log record for repeated failures.
+
+        :param logger: logger instance to use
+        :type logger: logging.Logger
+        :param name: function name
+        :type name: str
+        :param exc_name: exception class name
+        :type exc_name: str
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+        :param repeated: number of suppressed repeats
+        :type repeated: int
+        :param period: summary period in seconds
+        :type period: float
+
+        .. versionadded:: 10.0.0
         """
-        logger.log(level=self.log_level, msg=f"{method}: \n{name}({arguments if self.log_call_args else ''})")
+        self._emit(
+            logger=logger,
+            level=self.exc_level,
+            msg=f"Failed: {name!r} with {exc_name}: repeated {repeated:,} times in the last {period:.0f}s",
+            location=location,
+        )
 
-    def _make_exc_record(self, logger: logging.Logger, name: str, arguments: str, exception: Exception) -> None:
+    def _make_exc_record(
+        self,
+        logger: logging.Logger,
+        name: str,
+        arguments: _ArgumentsT,
+        exception: Exception,
+        duration_ns: typing.Optional[int] = None,
+        items: typing.Optional[int] = None,
+        location: records.CodeLocation = records.UNKNOWN_LOCATION,
+    ) -> None:
         """Make log record if exception raised.
 
         :param logger: logger instance to use
@@ -612,27 +2262,458 @@ class LogWrap:
         :param name: function name
         :type name: str
         :param arguments: function arguments repr
-        :type arguments: str
+        :type arguments: typing.Union[str, _LazyMessage, typing.Dict[str, typing.Any]]
         :param exception: exception captured
         :type exception: Exception
+        :param duration_ns: call duration in nanoseconds if should be logged
+        :type duration_ns: typing.Optional[int]
+        :param items: number of items yielded before exception (generators only)
+        :type items: typing.Optional[int]
+        :param location: source code location of the wrapped function
+        :type location: records.CodeLocation
+
+        .. versionchanged:: 10.0.0 arguments repr is rendered on demand
+        .. versionchanged:: 10.0.0 duration_ns and items parameters
+        .. versionchanged:: 10.0.0 traceback is rendered on demand
+        .. versionchanged:: 10.0.0 repeated failures suppression
+        .. versionchanged:: 10.0.0 location parameter
         """
-        exc_info = sys.exc_info()
-        stack: traceback.StackSummary = traceback.extract_stack()
-        full_tb: typing.List[traceback.FrameSummary] = [elem for elem in stack if elem.filename != _CURRENT_FILE]
-        exc_line: typing.List[str] = traceback.format_exception_only(*exc_info[:2])
-        # Make standard traceback string
-        tb_text: str = (
-            f"Traceback (most recent call last):\n{''.join(traceback.format_list(full_tb))}{''.join(exc_line)}"
-            if self.log_traceback and not isinstance(exception, tuple(self.blacklisted_exceptions))
+        if self.__dedup is not None:
+            log_full, repeated, period = self.__dedup.register(
+                failures_dedup.fingerprint(name, exception),
+                flush=functools.partial(
+                    self._make_repeated_record,
+                    logger,
+                    name,
+                    exception.__class__.__name__,
+                    location,
+                ),
+            )
+            if repeated:
+                self._make_repeated_record(logger, name, exception.__class__.__name__, location, repeated, period)
+            if not log_full:
+                return
+
+        blacklisted_source, blacklisted = self.__blacklisted_exceptions_cache
+        if blacklisted_source != self.__blacklisted_exceptions:
+            blacklisted = tuple(self.__blacklisted_exceptions)
+            self.__blacklisted_exceptions_cache = (list(self.__blacklisted_exceptions), blacklisted)
+
+        status: str = "Failed" if duration_ns is None else f"Failed after {_format_duration(duration_ns)}"
+        if items is not None:
+            status = f"{status} ({items} items yielded)"
+
+        if self.__structured:
+            self._emit(
+                logger=logger,
+                level=self.exc_level,
+                msg=f"{status}: {name!r} with {exception.__class__.__name__}",
+                location=location,
+                extra=self._make_structured_extra(
+                    name=name,
+                    location=location,
+                    outcome="failure",
+                    arguments=arguments if self.log_call_args_on_exc else None,
+                    duration_ns=duration_ns,
+                ),
+                exc_info=(
+                    (exception.__class__, exception, exception.__traceback__)
+                    if self.log_traceback and not isinstance(exception, blacklisted)
+                    else None
+                ),
+            )
+            return
+
+        # Make standard traceback string on demand: only frames positions are collected here
+        tb_text: typing.Union[str, _LazyMessage] = (
+            _LazyMessage(
+                _render_traceback,
+                _capture_outer_frames(self.__traceback_limit),
+                exception.__traceback__,
+                exception,
+                self.__traceback_limit,
+            )
+            if self.log_traceback and not isinstance(exception, blacklisted)
             else exception.__class__.__name__
         )
 
-        logger.log(
+        self._emit(
+            logger=logger,
             level=self.exc_level,
-            msg=f"Failed: \n{name}({arguments if self.log_call_args_on_exc else ''})\n{tb_text}",
-            exc_info=False,
+            msg=_LazyMessage(
+                "{}: \n{}({})\n{}".format,
+                status,
+                name,
+                arguments if self.log_call_args_on_exc else "",
+                tb_text,
+            ),
+            location=location,
         )
 
+    def _start_call(
+        self,
+        target: _WrappedFunction,
+        method: str,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[_CallContext]:
+        """Make logging decisions before call, emit Calling record and start measurement.
+
+        Iteration time of generators is measured from the first item request: generator starts measurement itself.
+
+        :param target: wrapped function data
+        :type target: _WrappedFunction
+        :param method: call method name: Calling, Awaiting or Iterating
+        :type method: str
+        :param args: positional arguments
+        :type args: typing.Tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: typing.Dict[str, typing.Any]
+        :return: call context or None if call should be passed through
+        :rtype: typing.Optional[_CallContext]
+        :raises TypeError: arguments do not match signature
+
+        .. versionadded:: 10.0.0
+        """
+        log_enabled: bool = target.logger.isEnabledFor(self.log_level)
+        exc_enabled: bool = target.logger.isEnabledFor(self.exc_level)
+        if not (log_enabled or exc_enabled or self.__collect_metrics):
+            return None
+
+        call: _CallContext = _CallContext(target=target, method=method, args=args, kwargs=kwargs)
+        call.exc_enabled = exc_enabled
+        call.collect_metrics = self.__collect_metrics
+
+        # In errors only mode Calling record is emitted only on failure
+        call.calling_on_exc = log_enabled and self.__errors_only
+        if call.calling_on_exc:
+            log_enabled = False
+        elif log_enabled and self.__sampling is not None and not target.get_sampling(self.__sampling).should_log():
+            log_enabled = False
+        call.log_enabled = log_enabled
+
+        # Arguments are bound before call only for Calling record or values snapshot
+        call.bind_late = not log_enabled and self.__args_snapshot == ArgsSnapshot.REFERENCE
+        if (log_enabled or exc_enabled or call.calling_on_exc) and not call.bind_late:
+            call.arguments = self._get_func_args_repr(plan=target.plan, args=args, kwargs=kwargs)
+        call.slow_threshold_ns = self.__slow_threshold_ns
+        in_flight_threshold: typing.Optional[float] = None
+        iterating: bool = method == "Iterating"
+        if iterating:
+            # Iteration time is always reported. In slow calls only mode items are not logged
+            call.log_duration = True
+            if log_enabled and call.slow_threshold_ns is None:
+                call.log_items_every = self.__log_items_every
+        else:
+            call.merge_records = self.__merge_records
+            call.log_duration = self.__log_duration or call.slow_threshold_ns is not None or call.merge_records
+            if log_enabled:
+                in_flight_threshold = self.__in_flight_threshold
+        call.measure = call.log_duration or call.collect_metrics or in_flight_threshold is not None
+
+        if log_enabled and call.slow_threshold_ns is None and not call.merge_records:
+            self._make_calling_record(
+                logger=target.logger,
+                name=target.name,
+                arguments=call.arguments,
+                method=method,
+                location=target.plan.location,
+            )
+
+        if call.measure and not iterating:
+            call.started = time.perf_counter_ns()
+        if in_flight_threshold is not None:
+            call.in_flight = watchdog.watch(
+                in_flight_threshold,
+                functools.partial(
+                    self._make_in_flight_record,
+                    target.logger,
+                    target.name,
+                    call.arguments,
+                    call.started,
+                    target.plan.location,
+                ),
+            )
+        return call
+
+    def _finish_call(
+        self,
+        call: _CallContext,
+        result: typing.Any = None,
+        items: typing.Optional[int] = None,
+        closed: bool = False,
+    ) -> None:
+        """Record metrics and emit log records after successful call.
+
+        :param call: call context
+        :type call: _CallContext
+        :param result: call result
+        :type result: typing.Any
+        :param items: number of produced items (generators only)
+        :type items: typing.Optional[int]
+        :param closed: generator has been closed before exhaustion
+        :type closed: bool
+
+        .. versionadded:: 10.0.0
+        """
+        target: _WrappedFunction = call.target
+        duration_ns: int = time.perf_counter_ns() - call.started if call.measure else 0
+        if call.collect_metrics:
+            target.metrics.record(duration_ns)
+
+        if not call.log_enabled:
+            return
+        if call.slow_threshold_ns is not None and duration_ns < call.slow_threshold_ns:
+            return
+        if call.merge_records:
+            self._make_merged_record(
+                logger=target.logger,
+                name=target.name,
+                arguments=call.arguments,
+                result=result,
+                duration_ns=duration_ns,
+                location=target.plan.location,
+            )
+            return
+        if call.slow_threshold_ns is not None:
+            self._make_calling_record(
+                logger=target.logger,
+                name=target.name,
+                arguments=call.arguments,
+                method=call.method,
+                location=target.plan.location,
+            )
+        if items is None:
+            self._make_done_record(
+                logger=target.logger,
+                func_name=target.name,
+                result=result,
+                duration_ns=duration_ns if call.log_duration else None,
+                location=target.plan.location,
+            )
+        else:
+            self._make_iteration_done_record(
+                logger=target.logger,
+                func_name=target.name,
+                items=items,
+                duration_ns=duration_ns,
+                result=result,
+                closed=closed,
+                location=target.plan.location,
+            )
+
+    def _fail_call(self, call: _CallContext, exception: Exception, items: typing.Optional[int] = None) -> None:
+        """Record metrics and emit log records after failed call.
+
+        :param call: call context
+        :type call: _CallContext
+        :param exception: raised exception
+        :type exception: Exception
+        :param items: number of produced items (generators only)
+        :type items: typing.Optional[int]
+
+        .. versionadded:: 10.0.0
+        """
+        target: _WrappedFunction = call.target
+        duration_ns: int = time.perf_counter_ns() - call.started if call.measure else 0
+        if call.collect_metrics:
+            target.metrics.record(duration_ns, failed=True)
+        if call.bind_late and (call.exc_enabled or call.calling_on_exc):
+            call.arguments = self._get_func_args_repr_after_call(plan=target.plan, args=call.args, kwargs=call.kwargs)
+        if call.calling_on_exc:
+            self._make_calling_record(
+                logger=target.logger,
+                name=target.name,
+                arguments=call.arguments,
+                method=call.method,
+                location=target.plan.location,
+            )
+        if call.exc_enabled:
+            self._make_exc_record(
+                logger=target.logger,
+                name=target.name,
+                arguments=call.arguments,
+                exception=exception,
+                duration_ns=duration_ns if call.log_duration else None,
+                items=items,
+                location=target.plan.location,
+            )
+
+    def _get_generator_wrapper(self, target: _WrappedFunction) -> _WrappedT:
+        """Construct wrapper for generator function.
+
+        Arguments are bound on call, items are passed through one by one,
+        send/throw/close are delegated to the wrapped generator.
+
+        :param target: wrapped generator function data
+        :type target: _WrappedFunction
+        :return: wrapped generator function
+        :rtype: typing.Callable
+
+        .. versionadded:: 10.0.0
+        """
+        func: typing.Callable[..., typing.Generator[typing.Any, typing.Any, typing.Any]] = target.func
+
+        def logged_generator(
+            call: _CallContext,
+            generator: typing.Generator[typing.Any, typing.Any, typing.Any],
+        ) -> typing.Generator[typing.Any, typing.Any, typing.Any]:
+            """Pass items of the wrapped generator through and log iteration.
+
+            :param call: call context
+            :type call: _CallContext
+            :param generator: generator of wrapped function
+            :type generator: typing.Generator[typing.Any, typing.Any, typing.Any]
+            :return: generator return value
+            :rtype: typing.Any
+            :raises Exception: something went wrong. Exception has been logged if not blacklisted/disabled log.
+            """
+            items: int = 0
+            call.started = time.perf_counter_ns()
+            try:
+                item: typing.Any = next(generator)
+                while True:
+                    items += 1
+                    if call.log_items_every and (items - 1) % call.log_items_every == 0:
+                        self._make_item_record(
+                            logger=target.logger,
+                            func_name=target.name,
+                            index=items,
+                            item=item,
+                            location=target.plan.location,
+                        )
+                    try:
+                        sent: typing.Any = yield item
+                    except GeneratorExit:
+                        generator.close()
+                        raise
+                    except BaseException as e:  # Thrown into generator: delegate
+                        item = generator.throw(e)
+                    else:
+                        item = generator.send(sent)
+            except StopIteration as e:
+                result = e.value
+            except GeneratorExit:
+                self._finish_call(call, items=items, closed=True)
+                raise
+            except Exception as e:
+                self._fail_call(call, e, items=items)
+                raise
+            self._finish_call(call, result, items=items)
+            return result
+
+        def gen_wrapper(
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> typing.Generator[typing.Any, typing.Any, typing.Any]:
+            """Decorator for generator functions.
+
+            :return: generator
+            :rtype: typing.Generator[typing.Any, typing.Any, typing.Any]
+            :raises TypeError: arguments do not match signature
+            """
+            if not target.state.enabled:
+                return func(*args, **kwargs)
+            call: typing.Optional[_CallContext] = self._start_call(target, "Iterating", args, kwargs)
+            if call is None:
+                return func(*args, **kwargs)
+            try:
+                generator: typing.Generator[typing.Any, typing.Any, typing.Any] = func(*args, **kwargs)
+            except Exception as e:
+                call.started = time.perf_counter_ns()
+                self._fail_call(call, e, items=0)
+                raise
+            return logged_generator(call, generator)
+
+        return _GeneratorFunction(func, gen_wrapper)  # type: ignore
+
+    def _get_async_generator_wrapper(self, target: _WrappedFunction) -> _WrappedT:
+        """Construct wrapper for async generator function.
+
+        Arguments are bound on call, items are passed through one by one,
+        asend/athrow/aclose are delegated to the wrapped generator.
+
+        :param target: wrapped async generator function data
+        :type target: _WrappedFunction
+        :return: wrapped async generator function
+        :rtype: typing.Callable
+
+        .. versionadded:: 10.0.0
+        """
+        func: typing.Callable[..., typing.AsyncGenerator[typing.Any, typing.Any]] = target.func
+
+        async def logged_generator(
+            call: _CallContext,
+            generator: typing.AsyncGenerator[typing.Any, typing.Any],
+        ) -> typing.AsyncGenerator[typing.Any, typing.Any]:
+            """Pass items of the wrapped async generator through and log iteration.
+
+            :param call: call context
+            :type call: _CallContext
+            :param generator: async generator of wrapped function
+            :type generator: typing.AsyncGenerator[typing.Any, typing.Any]
+            :return: async generator
+            :rtype: typing.AsyncGenerator[typing.Any, typing.Any]
+            :raises Exception: something went wrong. Exception has been logged if not blacklisted/disabled log.
+            """
+            items: int = 0
+            call.started = time.perf_counter_ns()
+            try:
+                item: typing.Any = await generator.__anext__()
+                while True:
+                    items += 1
+                    if call.log_items_every and (items - 1) % call.log_items_every == 0:
+                        self._make_item_record(
+                            logger=target.logger,
+                            func_name=target.name,
+                            index=items,
+                            item=item,
+                            location=target.plan.location,
+                        )
+                    try:
+                        sent: typing.Any = yield item
+                    except GeneratorExit:
+                        await generator.aclose()
+                        raise
+                    except BaseException as e:  # Thrown into generator: delegate
+                        item = await generator.athrow(e)
+                    else:
+                        item = await generator.asend(sent)
+            except StopAsyncIteration:
+                pass
+            except GeneratorExit:
+                self._finish_call(call, items=items, closed=True)
+                raise
+            except Exception as e:
+                self._fail_call(call, e, items=items)
+                raise
+            self._finish_call(call, items=items)
+
+        def async_gen_wrapper(
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> typing.AsyncGenerator[typing.Any, typing.Any]:
+            """Decorator for async generator functions.
+
+            :return: async generator
+            :rtype: typing.AsyncGenerator[typing.Any, typing.Any]
+            :raises TypeError: arguments do not match signature
+            """
+            if not target.state.enabled:  # Generator is returned as is: asend/athrow/aclose are not intercepted
+                return func(*args, **kwargs)
+            call: typing.Optional[_CallContext] = self._start_call(target, "Iterating", args, kwargs)
+            if call is None:
+                return func(*args, **kwargs)
+            try:
+                generator: typing.AsyncGenerator[typing.Any, typing.Any] = func(*args, **kwargs)
+            except Exception as e:
+                call.started = time.perf_counter_ns()
+                self._fail_call(call, e, items=0)
+                raise
+            return logged_generator(call, generator)
+
+        return _GeneratorFunction(func, async_gen_wrapper)  # type: ignore
+
     def _get_function_wrapper(self, func: _WrappedT) -> _WrappedT:
         """Here should be constructed and returned real decorator.
 
@@ -640,9 +2721,28 @@ class LogWrap:
         :type func: typing.Callable
         :return: wrapped coroutine or function
         :rtype: typing.Callable
+
+        .. versionchanged:: 10.0.0 check logger levels before any arguments processing
+        .. versionchanged:: 10.0.0 sampling: skipped calls are not bound until exception
+        .. versionchanged:: 10.0.0 call duration measurement and slow calls only mode
+        .. versionchanged:: 10.0.0 calls metrics collection
+        .. versionchanged:: 10.0.0 generators and async generators support
+        .. versionchanged:: 10.0.0 wrappers registry: disabled wrapper passes calls through
+        .. versionchanged:: 10.0.0 errors only mode: arguments are bound late if snapshot is not required
+        .. versionchanged:: 10.0.0 merged records and in flight calls reporting for functions and coroutines
         """
+        target: _WrappedFunction = _WrappedFunction(
+            func=func,
+            logger=self._get_logger_for_func(func),
+            plan=_CallPlan(func, self.__blacklisted_names.snapshot),
+            state=registry.register(func),
+            sampling=self.__sampling,
+        )
 
-        logger: logging.Logger = self._get_logger_for_func(func)
+        if inspect.isasyncgenfunction(func):
+            return registry.attach(self._get_async_generator_wrapper(target), target.state)
+        if inspect.isgeneratorfunction(func):
+            return registry.attach(self._get_generator_wrapper(target), target.state)
 
         @functools.wraps(func)
         async def async_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
@@ -652,16 +2752,21 @@ class LogWrap:
             :rtype: typing.Any
             :raises Exception: something went wrong. Exception has been logged if not blacklisted/disabled log.
             """
-            sig: inspect.Signature = inspect.signature(func)
-            args_repr: str = self._get_func_args_repr(sig=sig, args=args, kwargs=kwargs)
+            if not target.state.enabled:
+                return await func(*args, **kwargs)
+            call: typing.Optional[_CallContext] = self._start_call(target, "Awaiting", args, kwargs)
+            if call is None:
+                return await func(*args, **kwargs)
 
             try:
-                self._make_calling_record(logger=logger, name=func.__name__, arguments=args_repr, method="Awaiting")
                 result = await func(*args, **kwargs)
-                self._make_done_record(logger=logger, func_name=func.__name__, result=result)
             except Exception as e:
-                self._make_exc_record(logger=logger, name=func.__name__, arguments=args_repr, exception=e)
+                self._fail_call(call, e)
                 raise
+            finally:
+                if call.in_flight is not None:
+                    call.in_flight.cancel()
+            self._finish_call(call, result)
             return result
 
         @functools.wraps(func)
@@ -672,19 +2777,27 @@ class LogWrap:
             :rtype: typing.Any
             :raises Exception: something went wrong. Exception has been logged if not blacklisted/disabled log.
             """
-            sig: inspect.Signature = inspect.signature(func)
-            args_repr: str = self._get_func_args_repr(sig=sig, args=args, kwargs=kwargs)
+            if not target.state.enabled:
+                return func(*args, **kwargs)
+            call: typing.Optional[_CallContext] = self._start_call(target, "Calling", args, kwargs)
+            if call is None:
+                return func(*args, **kwargs)
 
             try:
-                self._make_calling_record(logger=logger, name=func.__name__, arguments=args_repr)
                 result = func(*args, **kwargs)
-                self._make_done_record(logger=logger, func_name=func.__name__, result=result)
             except Exception as e:
-                self._make_exc_record(logger=logger, name=func.__name__, arguments=args_repr, exception=e)
+                self._fail_call(call, e)
                 raise
+            finally:
+                if call.in_flight is not None:
+                    call.in_flight.cancel()
+            self._finish_call(call, result)
             return result
 
-        return async_wrapper if asyncio.iscoroutinefunction(func) else wrapper  # type: ignore
+        return registry.attach(  # type: ignore
+            async_wrapper if asyncio.iscoroutinefunction(func) else wrapper,
+            target.state,
+        )
 
     def __call__(self, func: _WrappedT) -> _WrappedT:
         """Callable instance.
@@ -708,6 +2821,22 @@ def logwrap(
     log_call_args_on_exc: bool = True,
     log_traceback: bool = True,
     log_result_obj: bool = True,
+    worker: typing.Optional[log_worker.LogWorker] = None,
+    sampling: typing.Optional[sampling_policies.SamplingPolicy] = None,
+    log_duration: bool = False,
+    slow_threshold: typing.Optional[float] = None,
+    collect_metrics: bool = False,
+    log_items_every: int = 0,
+    traceback_limit: typing.Optional[int] = None,
+    dedup: typing.Optional[failures_dedup.FailureDeduplicator] = None,
+    errors_only: bool = False,
+    args_snapshot: typing.Union[ArgsSnapshot, str] = ArgsSnapshot.REFERENCE,
+    merge_records: bool = False,
+    in_flight_threshold: typing.Optional[float] = None,
+    structured: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
 ) -> LogWrap:
     """Overload: with no func."""
 
@@ -726,6 +2855,22 @@ def logwrap(
     log_call_args_on_exc: bool = True,
     log_traceback: bool = True,
     log_result_obj: bool = True,
+    worker: typing.Optional[log_worker.LogWorker] = None,
+    sampling: typing.Optional[sampling_policies.SamplingPolicy] = None,
+    log_duration: bool = False,
+    slow_threshold: typing.Optional[float] = None,
+    collect_metrics: bool = False,
+    log_items_every: int = 0,
+    traceback_limit: typing.Optional[int] = None,
+    dedup: typing.Optional[failures_dedup.FailureDeduplicator] = None,
+    errors_only: bool = False,
+    args_snapshot: typing.Union[ArgsSnapshot, str] = ArgsSnapshot.REFERENCE,
+    merge_records: bool = False,
+    in_flight_threshold: typing.Optional[float] = None,
+    structured: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
 ) -> LogWrap:
     """Overload: with no func."""
 
@@ -744,6 +2889,22 @@ def logwrap(
     log_call_args_on_exc: bool = True,
     log_traceback: bool = True,
     log_result_obj: bool = True,
+    worker: typing.Optional[log_worker.LogWorker] = None,
+    sampling: typing.Optional[sampling_policies.SamplingPolicy] = None,
+    log_duration: bool = False,
+    slow_threshold: typing.Optional[float] = None,
+    collect_metrics: bool = False,
+    log_items_every: int = 0,
+    traceback_limit: typing.Optional[int] = None,
+    dedup: typing.Optional[failures_dedup.FailureDeduplicator] = None,
+    errors_only: bool = False,
+    args_snapshot: typing.Union[ArgsSnapshot, str] = ArgsSnapshot.REFERENCE,
+    merge_records: bool = False,
+    in_flight_threshold: typing.Optional[float] = None,
+    structured: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
 ) -> _WrappedT:
     """Overload: func provided."""
 
@@ -761,6 +2922,22 @@ def logwrap(  # noqa: F811
     log_call_args_on_exc: bool = True,
     log_traceback: bool = True,
     log_result_obj: bool = True,
+    worker: typing.Optional[log_worker.LogWorker] = None,
+    sampling: typing.Optional[sampling_policies.SamplingPolicy] = None,
+    log_duration: bool = False,
+    slow_threshold: typing.Optional[float] = None,
+    collect_metrics: bool = False,
+    log_items_every: int = 0,
+    traceback_limit: typing.Optional[int] = None,
+    dedup: typing.Optional[failures_dedup.FailureDeduplicator] = None,
+    errors_only: bool = False,
+    args_snapshot: typing.Union[ArgsSnapshot, str] = ArgsSnapshot.REFERENCE,
+    merge_records: bool = False,
+    in_flight_threshold: typing.Optional[float] = None,
+    structured: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
 ) -> typing.Union[LogWrap, _WrappedT]:
     """Log function calls and return values.
 
@@ -787,6 +2964,38 @@ def logwrap(  # noqa: F811
     :type log_traceback: bool
     :param log_result_obj: log result of function call.
     :type log_result_obj: bool
+    :param worker: background worker for records formatting and emission. If not set: log from calling thread.
+    :type worker: typing.Optional[log_worker.LogWorker]
+    :param sampling: sampling policy (cloned per decorated function). Exceptions are logged regardless of policy.
+    :type sampling: typing.Optional[sampling_policies.SamplingPolicy]
+    :param log_duration: log call duration in Done and Failed records.
+    :type log_duration: bool
+    :param slow_threshold: log only calls longer than threshold (in seconds). Failed calls are always logged.
+    :type slow_threshold: typing.Optional[float]
+    :param collect_metrics: collect calls count, errors count and latency histogram (regardless of log levels).
+    :type collect_metrics: bool
+    :param log_items_every: for generators: log repr of each N-th yielded item (0: do not log items).
+    :type log_items_every: int
+    :param traceback_limit: maximum number of frames in logged traceback (most recent are kept).
+    :type traceback_limit: typing.Optional[int]
+    :param dedup: repeated failures suppression: log the first failure in full and periodic summaries.
+    :type dedup: typing.Optional[failures_dedup.FailureDeduplicator]
+    :param errors_only: log Calling record only if call failed, do not log successful calls.
+    :type errors_only: bool
+    :param args_snapshot: snapshot policy for arguments rendered after call start.
+    :type args_snapshot: typing.Union[ArgsSnapshot, str]
+    :param merge_records: emit single record with arguments, result and duration after call instead of pair.
+    :type merge_records: bool
+    :param in_flight_threshold: emit "In flight" record for calls running longer than threshold (in seconds).
+    :type in_flight_threshold: typing.Optional[float]
+    :param structured: emit short messages with call data in record attributes (see `logwrap.STRUCTURED_FIELDS`).
+    :type structured: bool
+    :param max_items: maximum number of shown items for each container in arguments and results repr.
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string in arguments and results repr.
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate size limit for each argument and result repr.
+    :type max_total_chars: typing.Optional[int]
     :return: built real decorator.
     :rtype: typing.Union[LogWrap, typing.Callable[..., FuncResultType]]
 
@@ -796,6 +3005,17 @@ def logwrap(  # noqa: F811
     .. versionchanged:: 5.1.0 log_traceback parameter
     .. versionchanged:: 8.0.0 pick up logger from target module if possible
     .. versionchanged:: 9.0.0 Only LogWrap instance act as decorator
+    .. versionchanged:: 10.0.0 worker parameter
+    .. versionchanged:: 10.0.0 sampling parameter
+    .. versionchanged:: 10.0.0 log_duration and slow_threshold parameters
+    .. versionchanged:: 10.0.0 collect_metrics parameter
+    .. versionchanged:: 10.0.0 log_items_every parameter
+    .. versionchanged:: 10.0.0 traceback_limit parameter
+    .. versionchanged:: 10.0.0 dedup parameter
+    .. versionchanged:: 10.0.0 errors_only and args_snapshot parameters
+    .. versionchanged:: 10.0.0 merge_records and in_flight_threshold parameters
+    .. versionchanged:: 10.0.0 structured parameter
+    .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
     """
     wrapper = LogWrap(
         log=log,
@@ -808,6 +3028,22 @@ def logwrap(  # noqa: F811
         log_call_args_on_exc=log_call_args_on_exc,
         log_traceback=log_traceback,
         log_result_obj=log_result_obj,
+        worker=worker,
+        sampling=sampling,
+        log_duration=log_duration,
+        slow_threshold=slow_threshold,
+        collect_metrics=collect_metrics,
+        log_items_every=log_items_every,
+        traceback_limit=traceback_limit,
+        dedup=dedup,
+        errors_only=errors_only,
+        args_snapshot=args_snapshot,
+        merge_records=merge_records,
+        in_flight_threshold=in_flight_threshold,
+        structured=structured,
+        max_items=max_items,
+        max_str_len=max_str_len,
+        max_total_chars=max_total_chars,
     )
     if func is not None:
         return wrapper(func)
@@ -0,0 +1,355 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-memory calls metrics: calls and errors counters with log-linear latency histograms.
+
+Histogram bucket precision is 1/16 of the value (4 bits of mantissa), values are in nanoseconds.
+Each thread writes to its own shard, shards are merged on read, so recording does not use locks.
+Shard of finished thread is folded into the common aggregate of retired shards.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import array
+import threading
+import typing
+import weakref
+
+__all__ = ("FunctionMetrics", "MetricsSnapshot", "snapshot", "reset")
+
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_MAX_VALUE_BITS = 44  # 2**44 ns is more than 4.8 hours: longer calls are counted in the last bucket
+_BUCKETS_COUNT = (_MAX_VALUE_BITS - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: int) -> int:
+    """Get histogram bucket index for value.
+
+    :param value: value in nanoseconds
+    :type value: int
+    :return: bucket index
+    :rtype: int
+    """
+    if value < _SUB_BUCKETS << 1:
+        return max(value, 0)
+    shift: int = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return min((shift << _SUB_BUCKET_BITS) + (value >> shift), _BUCKETS_COUNT - 1)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Get the highest value, counted in the bucket.
+
+    :param index: bucket index
+    :type index: int
+    :return: bucket upper bound in nanoseconds
+    :rtype: int
+    """
+    if index < _SUB_BUCKETS << 1:
+        return index
+    shift: int = (index >> _SUB_BUCKET_BITS) - 1
+    mantissa: int = _SUB_BUCKETS + (index & (_SUB_BUCKETS - 1))
+    return ((mantissa + 1) << shift) - 1
+
+
+class _Shard:
+    """Metrics of the single thread."""
+
+    __slots__ = ("calls", "errors", "total_ns", "buckets")
+
+    def __init__(self) -> None:
+        """Metrics of the single thread."""
+        self.calls: int = 0
+        self.errors: int = 0
+        self.total_ns: int = 0
+        self.buckets: array.array[int] = array.array("Q", bytes(8 * _BUCKETS_COUNT))
+
+    def add(self, other: _Shard) -> None:
+        """Add metrics of other shard.
+
+        :param other: shard to add
+        :type other: _Shard
+        """
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_ns += other.total_ns
+        buckets: array.array[int] = self.buckets
+        for index, count in enumerate(other.buckets):
+            if count:
+                buckets[index] += count
+
+
+class _ThreadSentinel:
+    """Object, which lives in the thread local storage: collected when the thread is finished."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(metrics_ref: weakref.ReferenceType[FunctionMetrics], shard: _Shard) -> None:
+    """Fold shard of finished thread into retired shards aggregate.
+
+    :param metrics_ref: weak reference to the shard owner
+    :type metrics_ref: weakref.ReferenceType[FunctionMetrics]
+    :param shard: shard of finished thread
+    :type shard: _Shard
+    """
+    metrics: typing.Optional[FunctionMetrics] = metrics_ref()
+    if metrics is not None:
+        metrics._retire(shard)  # pylint: disable=protected-access
+
+
+class MetricsSnapshot(typing.NamedTuple):
+    """Merged metrics of the function.
+
+    Histogram is stored as pairs of bucket upper bound (in nanoseconds) and calls count for non-empty buckets.
+
+    .. versionadded:: 10.0.0
+    """
+
+    name: str
+    calls: int
+    errors: int
+    total_ns: int
+    buckets: typing.Tuple[typing.Tuple[int, int], ...]
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean call duration.
+
+        :return: mean call duration in nanoseconds
+        :rtype: float
+        """
+        if not self.calls:
+            return 0.0
+        return self.total_ns / self.calls
+
+    def percentile(self, percent: float) -> int:
+        """Get call duration percentile.
+
+        :param percent: percentile (0 - 100)
+        :type percent: float
+        :return: upper bound of histogram bucket, containing percentile, in nanoseconds
+        :rtype: int
+        :raises ValueError: percent out of range
+        """
+        return self.percentiles(percent)[0]
+
+    def percentiles(self, *percents: float) -> typing.Tuple[int, ...]:
+        """Get call duration percentiles.
+
+        :param percents: percentiles (0 - 100)
+        :type percents: float
+        :return: upper bounds of histogram buckets, containing percentiles, in nanoseconds
+        :rtype: typing.Tuple[int, ...]
+        :raises ValueError: percent out of range
+        """
+        for percent in percents:
+            if not 0 <= percent <= 100:
+                raise ValueError(f"percent should be in range 0 - 100, got {percent}")
+        if not self.calls:
+            return tuple(0 for _ in percents)
+
+        targets: typing.List[typing.Tuple[int, int]] = sorted(
+            (max(1, -(-self.calls * percent // 100)), idx) for idx, percent in enumerate(percents)
+        )
+        result: typing.List[int] = [0] * len(percents)
+        seen: int = 0
+        target_pos: int = 0
+        for upper_bound, count in self.buckets:
+            seen += count
+            while target_pos < len(targets) and targets[target_pos][0] <= seen:
+                result[targets[target_pos][1]] = upper_bound
+                target_pos += 1
+            if target_pos == len(targets):
+                break
+        return tuple(result)
+
+
+class FunctionMetrics:
+    """Calls metrics of the function.
+
+    Metrics are registered for :func:`snapshot` and :func:`reset` on the first recorded call.
+    Shards of finished threads are folded into the single retired shard.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__name", "__local", "__shards", "__retired", "__lock", "__weakref__")
+
+    def __init__(self, name: str) -> None:
+        """Calls metrics of the function.
+
+        :param name: function qualified name
+        :type name: str
+        """
+        self.__name: str = name
+        self.__lock: threading.Lock = threading.Lock()
+        self.__local: threading.local = threading.local()
+        self.__shards: typing.List[_Shard] = []
+        self.__retired: _Shard = _Shard()
+
+    @property
+    def name(self) -> str:
+        """Function qualified name.
+
+        :return: function name with module
+        :rtype: str
+        """
+        return self.__name
+
+    def __get_shard(self) -> _Shard:
+        """Get (create if required) shard of the current thread.
+
+        :return: metrics of the current thread
+        :rtype: _Shard
+        """
+        local: threading.local = self.__local
+        try:
+            return local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard: _Shard = _Shard()
+            sentinel: _ThreadSentinel = _ThreadSentinel()
+            weakref.finalize(sentinel, _retire_shard, weakref.ref(self), shard).atexit = False
+            with self.__lock:
+                self.__shards.append(shard)
+                local.shard = shard
+                local.sentinel = sentinel
+            _REGISTRY.add(self)
+            return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold shard of finished thread into retired shards aggregate.
+
+        :param shard: shard of finished thread
+        :type shard: _Shard
+        """
+        with self.__lock:
+            try:
+                self.__shards.remove(shard)
+            except ValueError:  # Dropped by reset
+                return
+            self.__retired.add(shard)
+
+    def record(self, duration_ns: int, failed: bool = False) -> None:
+        """Record call.
+
+        :param duration_ns: call duration in nanoseconds
+        :type duration_ns: int
+        :param failed: call raised exception
+        :type failed: bool
+        """
+        shard: _Shard = self.__get_shard()
+        shard.calls += 1
+        if failed:
+            shard.errors += 1
+        shard.total_ns += duration_ns
+        shard.buckets[_bucket_index(duration_ns)] += 1
+
+    def _shards(self, reset: bool = False) -> typing.List[_Shard]:
+        """Get all shards.
+
+        :param reset: drop shards: new calls are recorded to the new shards
+        :type reset: bool
+        :return: copy of the shards list including retired shards aggregate
+        :rtype: typing.List[_Shard]
+        """
+        local: threading.local = self.__local
+        with self.__lock:
+            shards: typing.List[_Shard] = [*self.__shards, self.__retired]
+            if reset:
+                self.__local = threading.local()
+                self.__shards = []
+                self.__retired = _Shard()
+        if reset:
+            _REGISTRY.discard(self)
+        del local  # Sentinels of dropped shards are collected outside of the lock
+        return shards
+
+    def snapshot(self, reset: bool = False) -> MetricsSnapshot:
+        """Merge shards of all threads.
+
+        :param reset: drop collected metrics atomically with snapshot: calls are not lost between snapshots
+        :type reset: bool
+        :return: metrics snapshot
+        :rtype: MetricsSnapshot
+        """
+        return _merge(self.__name, self._shards(reset=reset))
+
+    def reset(self) -> None:
+        """Drop collected metrics.
+
+        Calls in progress at the moment of reset may be counted in dropped shards.
+        """
+        self._shards(reset=True)
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"<{self.__class__.__name__}(name={self.__name!r}) at 0x{id(self):X}>"
+
+
+_REGISTRY: weakref.WeakSet[FunctionMetrics] = weakref.WeakSet()
+
+
+def _merge(name: str, shards: typing.Iterable[_Shard]) -> MetricsSnapshot:
+    """Merge shards to the snapshot.
+
+    :param name: function name
+    :type name: str
+    :param shards: threads metrics
+    :type shards: typing.Iterable[_Shard]
+    :return: merged metrics
+    :rtype: MetricsSnapshot
+    """
+    merged: _Shard = _Shard()
+    for shard in shards:
+        merged.add(shard)
+    return MetricsSnapshot(
+        name=name,
+        calls=merged.calls,
+        errors=merged.errors,
+        total_ns=merged.total_ns,
+        buckets=tuple((_bucket_upper_bound(index), count) for index, count in enumerate(merged.buckets) if count),
+    )
+
+
+def snapshot(reset: bool = False) -> typing.Dict[str, MetricsSnapshot]:
+    """Get metrics of all functions with recorded calls.
+
+    Metrics of functions with the same qualified name (redefined or wrapped several times) are merged.
+
+    :param reset: drop collected metrics atomically with snapshot: calls are not lost between snapshots
+    :type reset: bool
+    :return: metrics snapshots by function name
+    :rtype: typing.Dict[str, MetricsSnapshot]
+
+    .. versionadded:: 10.0.0
+    """
+    shards: typing.Dict[str, typing.List[_Shard]] = {}
+    for metrics in list(_REGISTRY):
+        shards.setdefault(metrics.name, []).extend(metrics._shards(reset=reset))  # pylint: disable=protected-access
+    return {name: _merge(name, name_shards) for name, name_shards in sorted(shards.items())}
+
+
+def reset() -> None:
+    """Drop collected metrics of all functions.
+
+    .. versionadded:: 10.0.0
+    """
+    for metrics in list(_REGISTRY):
+        metrics.reset()
@@ -0,0 +1,130 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Log records construction without `logging.Logger.findCaller` frames walk.
+
+Records are attributed to the wrapped function: code location is computed once on decoration.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import inspect
+import logging
+import types
+import typing
+
+__all__ = ("CodeLocation", "UNKNOWN_LOCATION", "code_location", "make_record", "emit")
+
+
+class CodeLocation(typing.NamedTuple):
+    """Source code location for log records."""
+
+    filename: str
+    lineno: int
+    func_name: str
+    module: str = ""
+    qualname: str = ""
+
+
+UNKNOWN_LOCATION = CodeLocation("(unknown file)", 0, "(unknown function)")
+
+_ExcInfoT = typing.Optional[
+    typing.Tuple[typing.Type[BaseException], BaseException, typing.Optional[types.TracebackType]]
+]
+
+
+def code_location(func: typing.Optional[typing.Callable[..., typing.Any]]) -> CodeLocation:
+    """Get source code location of the function.
+
+    :param func: function or wrapper (`__wrapped__` chain is followed)
+    :type func: typing.Optional[typing.Callable[..., typing.Any]]
+    :return: file name, first line number, function name, module and qualified name.
+             Placeholders are used for objects without code.
+    :rtype: CodeLocation
+    """
+    if func is None:
+        return UNKNOWN_LOCATION
+    module: str = getattr(func, "__module__", None) or ""
+    qualname: str = getattr(func, "__qualname__", None) or ""
+    try:
+        code = inspect.unwrap(func).__code__
+    except (AttributeError, ValueError):
+        return UNKNOWN_LOCATION._replace(module=module, qualname=qualname)
+    return CodeLocation(code.co_filename, code.co_firstlineno, code.co_name, module, qualname)
+
+
+def make_record(
+    logger: logging.Logger,
+    level: int,
+    msg: typing.Any,
+    location: CodeLocation,
+    extra: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    exc_info: _ExcInfoT = None,
+) -> logging.LogRecord:
+    """Make log record with known source code location.
+
+    :param logger: logger instance to use
+    :type logger: logging.Logger
+    :param level: log level
+    :type level: int
+    :param msg: record message
+    :type msg: typing.Any
+    :param location: source code location
+    :type location: CodeLocation
+    :param extra: additional record attributes
+    :type extra: typing.Optional[typing.Mapping[str, typing.Any]]
+    :param exc_info: exception information for the record
+    :type exc_info: typing.Optional[typing.Tuple[typing.Type[BaseException], BaseException, types.TracebackType]]
+    :return: log record
+    :rtype: logging.LogRecord
+    """
+    return logger.makeRecord(
+        logger.name,
+        level,
+        location.filename,
+        location.lineno,
+        msg,
+        (),
+        exc_info,
+        location.func_name,
+        extra,
+    )
+
+
+def emit(
+    logger: logging.Logger,
+    level: int,
+    msg: typing.Any,
+    location: CodeLocation,
+    extra: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    exc_info: _ExcInfoT = None,
+) -> None:
+    """Emit log record with known source code location from the calling thread.
+
+    :param logger: logger instance to use
+    :type logger: logging.Logger
+    :param level: log level
+    :type level: int
+    :param msg: record message
+    :type msg: typing.Any
+    :param location: source code location
+    :type location: CodeLocation
+    :param extra: additional record attributes
+    :type extra: typing.Optional[typing.Mapping[str, typing.Any]]
+    :param exc_info: exception information for the record
+    :type exc_info: typing.Optional[typing.Tuple[typing.Type[BaseException], BaseException, types.TracebackType]]
+    """
+    if logger.isEnabledFor(level):
+        logger.handle(make_record(logger, level, msg, location, extra, exc_info))
@@ -0,0 +1,221 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Registry of functions wrapped by LogWrap: global and per-function enable/disable switch.
+
+Disabled wrapper calls wrapped function directly after the single attribute check.
+If environment variable `LOGWRAP_DISABLED` is set to `1`, `true`, `yes` or `on` on import, wrappers are disabled.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import fnmatch
+import os
+import threading
+import typing
+import weakref
+
+__all__ = ("enable", "disable", "is_enabled", "registered")
+
+ENV_DISABLED = "LOGWRAP_DISABLED"
+
+_STATE_ATTR = "__logwrap_state__"
+
+
+class _WrapperState:
+    """State of the single wrapper."""
+
+    __slots__ = ("name", "enabled", "__weakref__")
+
+    def __init__(self, name: str, enabled: bool) -> None:
+        """State of the single wrapper.
+
+        :param name: wrapped function qualified name
+        :type name: str
+        :param enabled: wrapper is enabled
+        :type enabled: bool
+        """
+        self.name: str = name
+        self.enabled: bool = enabled
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"<{self.__class__.__name__}(name={self.name!r}, enabled={self.enabled})>"
+
+
+_LOCK = threading.RLock()
+_STATES: weakref.WeakSet[_WrapperState] = weakref.WeakSet()
+_DEFAULT_ENABLED: bool = os.environ.get(ENV_DISABLED, "").strip().lower() not in {"1", "true", "yes", "on"}
+# Rules are applied in order to the new wrappers: later rule wins. Rule for the same pattern is replaced.
+_RULES: typing.Dict[str, bool] = {}
+
+
+def _is_enabled_by_rules(name: str) -> bool:
+    """Check rules for the function name.
+
+    :param name: function qualified name
+    :type name: str
+    :return: wrapper should be enabled
+    :rtype: bool
+    """
+    enabled: bool = _DEFAULT_ENABLED
+    for pattern, rule_enabled in _RULES.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            enabled = rule_enabled
+    return enabled
+
+
+def register(func: typing.Callable[..., typing.Any]) -> _WrapperState:
+    """Register wrapper of the function.
+
+    :param func: wrapped function
+    :type func: typing.Callable[..., typing.Any]
+    :return: wrapper state. Wrapper should pass calls through if state is not enabled.
+    :rtype: _WrapperState
+    """
+    name: str = f"{func.__module__}.{func.__qualname__}"
+    with _LOCK:
+        state: _WrapperState = _WrapperState(name, _is_enabled_by_rules(name))
+        _STATES.add(state)
+    return state
+
+
+_WrapperT = typing.TypeVar("_WrapperT", bound=typing.Callable[..., typing.Any])
+
+
+def attach(wrapper: _WrapperT, state: _WrapperState) -> _WrapperT:
+    """Attach state to the wrapper for enable/disable by function object.
+
+    :param wrapper: wrapper function
+    :type wrapper: typing.Callable[..., typing.Any]
+    :param state: wrapper state
+    :type state: _WrapperState
+    :return: the same wrapper
+    :rtype: typing.Callable[..., typing.Any]
+    """
+    setattr(wrapper, _STATE_ATTR, state)
+    return wrapper
+
+
+def _switch(enabled: bool, targets: typing.Tuple[typing.Union[str, typing.Callable[..., typing.Any]], ...]) -> int:
+    """Enable or disable wrappers.
+
+    :param enabled: target state
+    :type enabled: bool
+    :param targets: glob patterns on qualified names or wrapped functions. If not set: all wrappers.
+    :type targets: typing.Tuple[typing.Union[str, typing.Callable[..., typing.Any]], ...]
+    :return: number of switched wrappers
+    :rtype: int
+    :raises TypeError: target is not a pattern or function wrapped by LogWrap
+    """
+    global _DEFAULT_ENABLED  # pylint: disable=global-statement
+
+    states: typing.List[_WrapperState] = []
+    patterns: typing.List[str] = []
+    for target in targets:
+        if isinstance(target, str):
+            patterns.append(target)
+            continue
+        state: typing.Optional[_WrapperState] = getattr(target, _STATE_ATTR, None)
+        if state is None:
+            raise TypeError(f"{target!r} is not wrapped by LogWrap")
+        states.append(state)
+
+    with _LOCK:
+        if not targets:
+            _DEFAULT_ENABLED = enabled
+            _RULES.clear()
+            states.extend(_STATES)
+        else:
+            for pattern in patterns:
+                _RULES.pop(pattern, None)  # Replaced rule is moved to the end: it is the latest one
+                _RULES[pattern] = enabled
+            states.extend(
+                state for state in _STATES if any(fnmatch.fnmatchcase(state.name, pattern) for pattern in patterns)
+            )
+        for state in states:
+            state.enabled = enabled
+    return len(states)
+
+
+def enable(*targets: typing.Union[str, typing.Callable[..., typing.Any]]) -> int:
+    """Enable wrappers.
+
+    Patterns are applied to the functions wrapped later too.
+
+    :param targets: glob patterns on qualified names (`module.qualname`) or wrapped functions. If not set: all wrappers.
+    :type targets: typing.Union[str, typing.Callable[..., typing.Any]]
+    :return: number of switched wrappers
+    :rtype: int
+    :raises TypeError: target is not a pattern or function wrapped by LogWrap
+
+    .. versionadded:: 10.0.0
+    """
+    return _switch(True, targets)
+
+
+def disable(*targets: typing.Union[str, typing.Callable[..., typing.Any]]) -> int:
+    """Disable wrappers: calls are passed to the wrapped functions directly.
+
+    Patterns are applied to the functions wrapped later too.
+
+    :param targets: glob patterns on qualified names (`module.qualname`) or wrapped functions. If not set: all wrappers.
+    :type targets: typing.Union[str, typing.Callable[..., typing.Any]]
+    :return: number of switched wrappers
+    :rtype: int
+    :raises TypeError: target is not a pattern or function wrapped by LogWrap
+
+    .. versionadded:: 10.0.0
+    """
+    return _switch(False, targets)
+
+
+def is_enabled(func: typing.Callable[..., typing.Any]) -> bool:
+    """Check wrapper state.
+
+    :param func: function wrapped by LogWrap
+    :type func: typing.Callable[..., typing.Any]
+    :return: wrapper is enabled
+    :rtype: bool
+    :raises TypeError: function is not wrapped by LogWrap
+
+    .. versionadded:: 10.0.0
+    """
+    state: typing.Optional[_WrapperState] = getattr(func, _STATE_ATTR, None)
+    if state is None:
+        raise TypeError(f"{func!r} is not wrapped by LogWrap")
+    return state.enabled
+
+
+def registered() -> typing.Dict[str, bool]:
+    """Get qualified names and states of all alive wrappers.
+
+    Functions with the same qualified name (redefined or wrapped several times) are reported as enabled
+    if any of wrappers is enabled.
+
+    :return: wrapper state by wrapped function qualified name
+    :rtype: typing.Dict[str, bool]
+
+    .. versionadded:: 10.0.0
+    """
+    result: typing.Dict[str, bool] = {}
+    with _LOCK:
+        for state in _STATES:
+            result[state.name] = result.get(state.name, False) or state.enabled
+    return dict(sorted(result.items()))
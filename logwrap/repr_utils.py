@@ -24,33 +24,182 @@ from __future__ import annotations
 
 # Standard Library
 import abc
+import collections
+import dataclasses
+import functools
 import inspect
+import itertools
+import reprlib
+import sys
+import threading
 import types
 import typing
+import weakref
+
+__all__ = (
+    "PrettyFormat",
+    "PrettyRepr",
+    "PrettyStr",
+    "pretty_repr",
+    "pretty_str",
+    "pretty_repr_dump",
+    "pretty_str_dump",
+)
+
+
+# Output fragments consumer: `list.append` of the shared buffer or `write` of the text stream
+_WriteT = typing.Callable[[str], typing.Any]
+# Work item: nested object to format as (object, indent, no_indent_start)
+_WorkT = typing.Tuple[typing.Any, int, bool]
+# Formatting handler in the dispatch table: called as handler(parser, src, indent, no_indent_start, write).
+# Handler writes object or its beginning and returns iterator over the rest of work for nested objects.
+_HandlerT = typing.Callable[
+    ["PrettyFormat", typing.Any, int, bool, _WriteT], typing.Optional[typing.Iterator[_WorkT]]
+]
+# Registered handler has the same signature as magic methods: handler(src, parser, indent, no_indent_start)
+_TypeHandlerT = typing.Callable[[typing.Any, "PrettyFormat", int, bool], str]
+# Fields of structured object as (shown name, attribute name): names differ for private slots
+_FieldsT = typing.Tuple[typing.Tuple[str, str], ...]
+
+# Dispatch table is dropped on overflow: protection against leak of dynamically created types
+_DISPATCH_TABLE_SIZE = 1024
+# Indentation prefixes cache is dropped on overflow: start indentation is not limited
+_INDENT_PREFIXES_SIZE = 256
+# Formatters used by pretty_repr and pretty_str: one instance per configuration
+_FORMATTERS_CACHE_SIZE = 64
+
+# Types with built-in handling: formatter method name and brackets for containers
+_BUILTIN_HANDLERS: typing.Dict[type, typing.Tuple[str, typing.Optional[typing.Tuple[str, str]]]] = {
+    types.FunctionType: ("_write_callable", None),
+    types.MethodType: ("_write_callable", None),
+    str: ("_write_string", None),
+    bytes: ("_write_string", None),
+    dict: ("_write_dict", ("{", "}")),
+    list: ("_write_iterable", ("[", "]")),
+    tuple: ("_write_iterable", ("(", ")")),
+    set: ("_write_iterable", ("{", "}")),
+    frozenset: ("_write_iterable", ("{", "}")),
+}
+
+# Containers formatted without type name
+_PLAIN_CONTAINERS = (list, tuple, set, dict)
+
+
+class _Visits(threading.local):
+    """Objects expanded in the current thread: shared by nested formatting calls from magic methods and handlers."""
+
+    def __init__(self) -> None:
+        """Objects expanded in the current thread."""
+        super().__init__()
+        # Ids of objects, which are being expanded now. None if formatting is not in progress.
+        self.in_progress: typing.Optional[typing.Set[int]] = None
+        # Already expanded objects by id: objects are referenced to keep ids unique until formatting end
+        self.shown: typing.Dict[int, typing.Any] = {}
+        # Output size budget of the current formatting call. None if not limited.
+        self.budget: typing.Optional[_CharsBudget] = None
+
+
+_VISITS = _Visits()
+
+
+class _CharsBudget:
+    """Output fragments consumer with written characters accounting."""
+
+    __slots__ = ("remaining", "__write")
+
+    def __init__(self, remaining: int, write: _WriteT) -> None:
+        """Output fragments consumer with written characters accounting.
+
+        :param remaining: characters allowed to write before elision of the rest of containers items
+        :type remaining: int
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        """
+        self.remaining: int = remaining
+        self.__write: _WriteT = write
 
-__all__ = ("PrettyFormat", "PrettyRepr", "PrettyStr", "pretty_repr", "pretty_str")
+    def write(self, fragment: str) -> None:
+        """Write output fragment.
 
+        :param fragment: output fragment
+        :type fragment: str
+        """
+        self.remaining -= len(fragment)
+        self.__write(fragment)
 
-def _known_callable(item: typing.Any) -> bool:
-    """Check for possibility to parse callable.
 
-    :param item:  item to check for repr() way
-    :type item: typing.Any
-    :return: item is callable and should be processed not using repr
-    :rtype: bool
+def _call_magic(parser: PrettyFormat, src: typing.Any, indent: int, no_indent_start: bool, write: _WriteT) -> None:
+    """Format object using its own magic method.
+
+    :param parser: formatter instance
+    :type parser: PrettyFormat
+    :param src: object to process
+    :type src: typing.Any
+    :param indent: start indentation
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :param write: output fragments consumer
+    :type write: typing.Callable[[str], typing.Any]
     """
-    return isinstance(item, (types.FunctionType, types.MethodType))
+    write(getattr(src, parser._magic_method_name)(parser, indent=indent, no_indent_start=no_indent_start))
 
 
-def _simple(item: typing.Any) -> bool:
-    """Check for nested iterations: True, if not.
+def _call_magic_dynamic(
+    fallback: _HandlerT,
+    parser: PrettyFormat,
+    src: typing.Any,
+    indent: int,
+    no_indent_start: bool,
+    write: _WriteT,
+) -> typing.Optional[typing.Iterator[_WorkT]]:
+    """Format object with `__getattr__`: magic method can be provided dynamically, so check on each object.
+
+    :param fallback: handler for objects without magic method
+    :type fallback: typing.Callable[..., typing.Optional[typing.Iterator[typing.Any]]]
+    :param parser: formatter instance
+    :type parser: PrettyFormat
+    :param src: object to process
+    :type src: typing.Any
+    :param indent: start indentation
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :param write: output fragments consumer
+    :type write: typing.Callable[[str], typing.Any]
+    :return: iterator over the rest of work for nested objects
+    :rtype: typing.Optional[typing.Iterator[typing.Tuple[typing.Any, int, bool]]]
+    """
+    if hasattr(src, parser._magic_method_name):
+        _call_magic(parser, src, indent, no_indent_start, write)
+        return None
+    return fallback(parser, src, indent, no_indent_start, write)
+
 
-    :param item: item to check for repr() way
-    :type item: typing.Any
-    :return: use repr() iver item by default
-    :rtype: bool
+def _call_type_handler(
+    handler: _TypeHandlerT,
+    parser: PrettyFormat,
+    src: typing.Any,
+    indent: int,
+    no_indent_start: bool,
+    write: _WriteT,
+) -> None:
+    """Format object using handler registered for its type.
+
+    :param handler: registered handler
+    :type handler: typing.Callable[[typing.Any, PrettyFormat, int, bool], str]
+    :param parser: formatter instance
+    :type parser: PrettyFormat
+    :param src: object to process
+    :type src: typing.Any
+    :param indent: start indentation
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :param write: output fragments consumer
+    :type write: typing.Callable[[str], typing.Any]
     """
-    return not isinstance(item, (list, set, tuple, dict, frozenset))
+    write(handler(src, parser, indent, no_indent_start))
 
 
 class ReprParameter:
@@ -144,50 +293,297 @@ class ReprParameter:
         return f'<{self.__class__.__name__} "{self}">'
 
 
-def _prepare_repr(func: typing.Union[types.FunctionType, types.MethodType]) -> typing.List[ReprParameter]:
-    """Get arguments lists with defaults.
+class _CallableInterface(typing.NamedTuple):
+    """Rendered interface of function: parameters text and defaults, return annotation text."""
 
-    :param func: Callable object to process
-    :type func: typing.Union[types.FunctionType, types.MethodType]
-    :return: repr of callable parameter from signature
-    :rtype: typing.List[ReprParameter]
+    # Parameter name with annotation and default value (`inspect.Parameter.empty` if not set)
+    params: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+    # Return annotation (with arrow) or empty string
+    return_annotation: str
+
+
+# Function attributes, which change the signature: interface is rendered again if any of them is replaced.
+# `__signature__` and `__defaults__`, items of `__kwdefaults__` and `__annotations__` (dicts can be changed in place).
+_SignatureStateT = typing.Tuple[
+    typing.Any,
+    typing.Any,
+    typing.Tuple[typing.Tuple[str, typing.Any], ...],
+    typing.Tuple[typing.Tuple[str, typing.Any], ...],
+]
+
+# Rendered interfaces of functions: weak keys do not keep functions alive
+_INTERFACES: weakref.WeakKeyDictionary[
+    typing.Callable[..., typing.Any], typing.Tuple[_SignatureStateT, _CallableInterface]
+] = weakref.WeakKeyDictionary()
+
+
+def _render_interface(func: typing.Callable[..., typing.Any]) -> _CallableInterface:
+    """Render function interface for PrettyFormat.
+
+    :param func: function to process
+    :type func: typing.Callable[..., typing.Any]
+    :return: parameters text and defaults, return annotation text
+    :rtype: _CallableInterface
     """
-    ismethod: bool = isinstance(func, types.MethodType)
-    self_processed: bool = False
-    result: typing.List[ReprParameter] = []
-    if not ismethod:
-        real_func: typing.Callable[..., typing.Any] = func
-    else:
-        real_func = func.__func__  # type: ignore
-
-    for param in inspect.signature(real_func).parameters.values():
-        if not self_processed and ismethod and func.__self__ is not None:  # type: ignore
-            result.append(ReprParameter(param, value=func.__self__))  # type: ignore
-            self_processed = True
+    sig: inspect.Signature = inspect.signature(func)
+    params: typing.List[typing.Tuple[str, typing.Any]] = []
+    for param in (ReprParameter(parameter) for parameter in sig.parameters.values()):
+        if param.annotation is param.empty:
+            params.append((f"{param.name}", param.value))
         else:
-            result.append(ReprParameter(param))
+            params.append((f"{param.name}: {getattr(param.annotation, '__name__', param.annotation)!s}", param.value))
+    if sig.return_annotation is inspect.Parameter.empty:
+        return _CallableInterface(tuple(params), "")
+    return _CallableInterface(
+        tuple(params),
+        f" -> {getattr(sig.return_annotation, '__name__', sig.return_annotation)!s}",
+    )
+
+
+def _dict_state(src: typing.Optional[typing.Dict[str, typing.Any]]) -> typing.Tuple[typing.Tuple[str, typing.Any], ...]:
+    """Items of function attribute dict, which can be changed in place.
+
+    :param src: function attribute dict
+    :type src: typing.Optional[typing.Dict[str, typing.Any]]
+    :return: dict items
+    :rtype: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+    """
+    return () if src is None else tuple(src.items())
+
+
+def _is_same_state(state: _SignatureStateT, cached: _SignatureStateT) -> bool:
+    """Compare signature states by identity: `__eq__` of default values can fail or have side effects.
+
+    :param state: current state of function
+    :type state: typing.Tuple[typing.Any, typing.Any, typing.Tuple[typing.Any, ...], typing.Tuple[typing.Any, ...]]
+    :param cached: state of function, when interface has been rendered
+    :type cached: typing.Tuple[typing.Any, typing.Any, typing.Tuple[typing.Any, ...], typing.Tuple[typing.Any, ...]]
+    :return: state is not changed
+    :rtype: bool
+    """
+    if state[0] is not cached[0] or state[1] is not cached[1]:
+        return False
+    for items, cached_items in zip(state[2:], cached[2:]):
+        if len(items) != len(cached_items):
+            return False
+        for (key, value), (cached_key, cached_value) in zip(items, cached_items):
+            if key is not cached_key or value is not cached_value:
+                return False
+    return True
+
+
+def _get_interface(func: typing.Union[types.FunctionType, types.MethodType]) -> _CallableInterface:
+    """Get rendered interface of function or method.
+
+    Interface is cached per function and rendered again if `__signature__`, `__defaults__`, `__kwdefaults__`
+    or `__annotations__` change.
+    For methods interface of the underlying function is used: the first parameter value is set by the caller.
+
+    :param func: function or method to process
+    :type func: typing.Union[types.FunctionType, types.MethodType]
+    :return: parameters text and defaults, return annotation text
+    :rtype: _CallableInterface
+    """
+    real_func: typing.Callable[..., typing.Any] = func.__func__ if isinstance(func, types.MethodType) else func
+    state: _SignatureStateT = (
+        getattr(real_func, "__signature__", None),
+        getattr(real_func, "__defaults__", None),
+        _dict_state(getattr(real_func, "__kwdefaults__", None)),
+        _dict_state(getattr(real_func, "__annotations__", None)),
+    )
+    try:
+        cached: typing.Optional[typing.Tuple[_SignatureStateT, _CallableInterface]] = _INTERFACES.get(real_func, None)
+    except TypeError:  # Not hashable or not weak referenceable callable in the method
+        return _render_interface(real_func)
+    if cached is not None and _is_same_state(state, cached[0]):
+        return cached[1]
+    interface: _CallableInterface = _render_interface(real_func)
+    _INTERFACES[real_func] = (state, interface)
+    return interface
 
-    return result
+
+@dataclasses.dataclass
+class _DataclassReference:
+    """Dataclass with generated repr."""
+
+
+# Code of generated repr is shared by all dataclasses and all named tuples: wrapper code for dataclasses
+_GENERATED_REPR_CODES: typing.Tuple[types.CodeType, ...] = (
+    _DataclassReference.__repr__.__code__,
+    collections.namedtuple("_NamedTupleReference", ()).__repr__.__code__,  # type: ignore[attr-defined]
+)
+
+
+def _has_generated_repr(cls: type) -> bool:
+    """Check, that text representation of class is generated from fields: not replaced by the class author.
+
+    Own repr can hide field values (passwords, tokens), so such objects are not shown by fields.
+
+    :param cls: object type
+    :type cls: type
+    :return: repr is generated by dataclasses, attrs or named tuple factory and str is not overridden
+    :rtype: bool
+    """
+    if cls.__str__ is not object.__str__:
+        return False
+    code: typing.Optional[types.CodeType] = getattr(cls.__repr__, "__code__", None)
+    if code is None:
+        return False
+    return any(code is reference for reference in _GENERATED_REPR_CODES) or code.co_filename.startswith(
+        "<attrs generated repr "
+    )
+
+
+def _declared_fields(cls: type) -> typing.Optional[_FieldsT]:
+    """Fields declared by the class: dataclass, attrs class or named tuple.
+
+    :param cls: class from the object type MRO
+    :type cls: type
+    :return: fields shown in repr, None if class does not declare fields
+    :rtype: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]]
+    """
+    cls_dict: typing.Mapping[str, typing.Any] = cls.__dict__
+    if "__dataclass_fields__" in cls_dict:
+        return tuple((field.name, field.name) for field in dataclasses.fields(cls) if field.repr)
+    if "__attrs_attrs__" in cls_dict:
+        return tuple((attrib.name, attrib.name) for attrib in cls_dict["__attrs_attrs__"] if attrib.repr)
+    if "_fields" in cls_dict and issubclass(cls, tuple):
+        return tuple((name, name) for name in cls_dict["_fields"])
+    return None
+
+
+def _slots_fields(cls: type) -> typing.Optional[_FieldsT]:
+    """Slots of the class without instance `__dict__` and own text representation.
+
+    :param cls: object type
+    :type cls: type
+    :return: slots in definition order, None if object can not be shown by slots
+    :rtype: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]]
+    """
+    if cls.__dictoffset__ or cls.__repr__ is not object.__repr__ or cls.__str__ is not object.__str__:
+        return None
+    fields: typing.List[typing.Tuple[str, str]] = []
+    for klass in reversed(cls.__mro__):
+        slots: typing.Union[str, typing.Iterable[str]] = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in {"__dict__", "__weakref__"}:
+                continue
+            if name.startswith("__") and not name.endswith("__") and klass.__name__.lstrip("_"):
+                # Private names are mangled
+                fields.append((name, f"_{klass.__name__.lstrip('_')}{name}"))
+            else:
+                fields.append((name, name))
+    return tuple(fields) if fields else None
 
 
 class PrettyFormat(metaclass=abc.ABCMeta):
     """Pretty Formatter.
 
-    Designed for usage as __repr__ and __str__ replacement on complex objects
+    Designed for usage as __repr__ and __str__ replacement on complex objects.
+    Handler for the object is selected by the exact object type using dispatch table of the formatter class:
+    handler is resolved once per type through the MRO.
+    Handlers append output fragments to the single buffer (or text stream), which is joined once at the end.
+    Nested objects are processed iteratively using explicit stack, so deep structures do not hit recursion limit.
+    Object, which is being expanded, is rendered as `<Recursion on list with id=...>` on revisit.
+    Output size budgets are checked during traversal: items past the budget are not processed
+    and replaced by marker like `... 99,990 more items`.
+    Dataclasses, attrs classes, named tuples and objects with slots are shown as class name with fields,
+    if repr is not defined by the class author.
+
+    .. versionchanged:: 10.0.0 dispatch table by object type and handlers registration
+    .. versionchanged:: 10.0.0 output is written by fragments, `dump` to the text stream
+    .. versionchanged:: 10.0.0 non-recursive processing of nested objects
+    .. versionchanged:: 10.0.0 recursion detection and mark_shared parameter
+    .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars budgets
+    .. versionchanged:: 10.0.0 align_keys parameter
+    .. versionchanged:: 10.0.0 structural formatting of dataclasses, attrs classes, named tuples and slots
     """
 
-    __slots__ = ("__max_indent", "__indent_step")
+    __slots__ = (
+        "__max_indent",
+        "__indent_step",
+        "__mark_shared",
+        "__max_items",
+        "__max_str_len",
+        "__max_total_chars",
+        "__align_keys",
+        "__limited_repr",
+        "__indent_prefixes",
+    )
+
+    # Each formatter class has own handlers registry and dispatch table (see __init_subclass__)
+    _type_handlers: typing.ClassVar[typing.Dict[type, _TypeHandlerT]] = {}
+    _dispatch: typing.ClassVar[typing.Dict[type, _HandlerT]] = {}
+    # Text of dict keys: repr() or str(), set by subclasses
+    _key_text: typing.ClassVar[typing.Callable[[typing.Any], str]]
 
-    def __init__(self, max_indent: int = 20, indent_step: int = 4) -> None:
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        """Make own handlers registry and dispatch table for the formatter class.
+
+        :param kwargs: class creation keyword arguments
+        :type kwargs: typing.Any
+        """
+        super().__init_subclass__(**kwargs)
+        cls._type_handlers = {}
+        cls._dispatch = {}
+
+    def __init__(
+        self,
+        max_indent: int = 20,
+        indent_step: int = 4,
+        mark_shared: bool = False,
+        max_items: typing.Optional[int] = None,
+        max_str_len: typing.Optional[int] = None,
+        max_total_chars: typing.Optional[int] = None,
+        align_keys: bool = True,
+    ) -> None:
         """Pretty Formatter.
 
         :param max_indent: maximal indent before classic repr() call
         :type max_indent: int
         :param indent_step: step for the next indentation level
         :type indent_step: int
+        :param mark_shared: objects, which have been already shown, are rendered as references
+        :type mark_shared: bool
+        :param max_items: maximum number of shown items for each container
+        :type max_items: typing.Optional[int]
+        :param max_str_len: maximum number of shown characters (bytes) for each string
+        :type max_str_len: typing.Optional[int]
+        :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+        :type max_total_chars: typing.Optional[int]
+        :param align_keys: align values of dict by the longest shown key
+        :type align_keys: bool
+        :raises ValueError: negative budget
+
+        .. versionchanged:: 10.0.0 mark_shared parameter
+        .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
+        .. versionchanged:: 10.0.0 align_keys parameter
         """
+        for name, budget in (
+            ("max_items", max_items),
+            ("max_str_len", max_str_len),
+            ("max_total_chars", max_total_chars),
+        ):
+            if budget is not None and budget < 0:
+                raise ValueError(f"{name} should not be negative, got {budget}")
         self.__max_indent: int = max_indent
         self.__indent_step: int = indent_step
+        self.__mark_shared: bool = mark_shared
+        self.__max_items: typing.Optional[int] = max_items
+        self.__max_str_len: typing.Optional[int] = max_str_len
+        self.__max_total_chars: typing.Optional[int] = max_total_chars
+        self.__align_keys: bool = align_keys
+        # Containers at the maximal indent are shown using repr() with the same limits
+        if max_items is None and max_str_len is None:
+            self.__limited_repr: typing.Optional[reprlib.Repr] = None
+        else:
+            limited_repr = self.__limited_repr = reprlib.Repr()
+            items_limit: int = sys.maxsize if max_items is None else max_items
+            for attr in ("maxtuple", "maxlist", "maxarray", "maxdict", "maxset", "maxfrozenset", "maxdeque"):
+                setattr(limited_repr, attr, items_limit)
+            limited_repr.maxstring = limited_repr.maxother = sys.maxsize if max_str_len is None else max_str_len
+            limited_repr.maxlong = sys.maxsize
+        self.__indent_prefixes: typing.Dict[int, typing.Tuple[int, str, str, str]] = {}
 
     @property
     def max_indent(self) -> int:
@@ -207,6 +603,55 @@ class PrettyFormat(metaclass=abc.ABCMeta):
         """
         return self.__indent_step
 
+    @property
+    def mark_shared(self) -> bool:
+        """Objects, which have been already shown, are rendered as references.
+
+        :return: shared objects are not expanded again
+        :rtype: bool
+        """
+        return self.__mark_shared
+
+    @property
+    def max_items(self) -> typing.Optional[int]:
+        """Maximum number of shown items for each container.
+
+        :return: items limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_items
+
+    @property
+    def max_str_len(self) -> typing.Optional[int]:
+        """Maximum number of shown characters (bytes) for each string.
+
+        :return: string length limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_str_len
+
+    @property
+    def max_total_chars(self) -> typing.Optional[int]:
+        """Approximate output size limit.
+
+        Containers items are not shown after limit hit, so output can be longer by closing brackets and the last item.
+
+        :return: output size limit or None if not limited
+        :rtype: typing.Optional[int]
+        """
+        return self.__max_total_chars
+
+    @property
+    def align_keys(self) -> bool:
+        """Values of dict are aligned by the longest shown key.
+
+        Alignment requires pass over keys before output, without it keys are formatted on the fly.
+
+        :return: dict values are aligned
+        :rtype: bool
+        """
+        return self.__align_keys
+
     def next_indent(self, indent: int, multiplier: int = 1) -> int:
         """Next indentation value.
 
@@ -219,53 +664,263 @@ class PrettyFormat(metaclass=abc.ABCMeta):
         """
         return indent + multiplier * self.indent_step
 
-    def _repr_callable(
-        self,
-        src: typing.Union[types.FunctionType, types.MethodType],
-        indent: int = 0,
-    ) -> str:
-        """Repr callable object (function or method).
+    def _indent_prefixes(self, indent: int) -> typing.Tuple[int, str, str, str]:
+        """Indentation of nested items and line prefixes for container on the indentation level.
 
-        :param src: Callable to process
-        :type src: typing.Union[types.FunctionType, types.MethodType]
-        :param indent: start indentation
+        Strings are made once per indentation level and reused.
+
+        :param indent: container indentation
         :type indent: int
-        :return: Repr of function or method with signature.
-        :rtype: str
+        :return: nested items indentation, first item line prefix, next items line prefix (with comma of previous item)
+                 and close bracket line prefix (with comma of the last item)
+        :rtype: typing.Tuple[int, str, str, str]
+        """
+        prefixes: typing.Optional[typing.Tuple[int, str, str, str]] = self.__indent_prefixes.get(indent, None)
+        if prefixes is None:
+            if len(self.__indent_prefixes) >= _INDENT_PREFIXES_SIZE:
+                self.__indent_prefixes.clear()
+            next_indent: int = self.next_indent(indent)
+            item_prefix: str = "\n" + " " * next_indent
+            prefixes = (next_indent, item_prefix, "," + item_prefix, ",\n" + " " * indent)
+            self.__indent_prefixes[indent] = prefixes
+        return prefixes
+
+    @classmethod
+    def register_type_handler(cls, obj_type: type, handler: _TypeHandlerT) -> None:
+        """Register formatting handler for objects of type and its subclasses.
+
+        Handler has the same signature as `__pretty_repr__` and `__pretty_str__` magic methods:
+        `handler(src, parser, indent, no_indent_start) -> str`.
+        Handler registered on `PrettyFormat` is used by all formatters, registered on subclass - by subclass only.
+
+        :param obj_type: type of objects to format
+        :type obj_type: type
+        :param handler: formatting handler
+        :type handler: typing.Callable[[typing.Any, PrettyFormat, int, bool], str]
+        :raises TypeError: obj_type is not a type or handler is not callable
+
+        .. versionadded:: 10.0.0
         """
-        param_str: str = ""
-        prefix: str = "\n" + " " * self.next_indent(indent)
+        if not isinstance(obj_type, type):
+            raise TypeError(f"Unexpected type: {obj_type.__class__.__name__}. Should be {type.__name__}.")
+        if not callable(handler):
+            raise TypeError(f"Handler is not callable: {handler!r}")
+        cls._type_handlers[obj_type] = handler
+        cls._clear_dispatch()
 
-        for param in _prepare_repr(src):
-            param_str += f"{prefix}{param.name}"
-            if param.annotation is not param.empty:
-                param_str += f": {getattr(param.annotation, '__name__', param.annotation)!s}"
-            if param.value is not param.empty:
-                param_str += f"={self.process_element(src=param.value, indent=indent, no_indent_start=True)}"
-            param_str += ","
+    @classmethod
+    def unregister_type_handler(cls, obj_type: type) -> None:
+        """Remove formatting handler registered for type.
 
-        if param_str:
-            param_str += "\n" + " " * indent
+        :param obj_type: type of objects to format
+        :type obj_type: type
 
-        sig: inspect.Signature = inspect.signature(src)
-        if sig.return_annotation is inspect.Parameter.empty:
-            annotation: str = ""
+        .. versionadded:: 10.0.0
+        """
+        if cls._type_handlers.pop(obj_type, None) is not None:
+            cls._clear_dispatch()
+
+    @classmethod
+    def _clear_dispatch(cls) -> None:
+        """Drop dispatch table of the formatter class and its subclasses."""
+        cls._dispatch.clear()
+        for subclass in cls.__subclasses__():
+            subclass._clear_dispatch()
+
+    def _resolve_handler(self, obj_type: type) -> _HandlerT:
+        """Resolve handler for objects of the exact type through the MRO and store it in the dispatch table.
+
+        First class in the object type MRO, which defines magic method, has registered handler, declares fields
+        (dataclass, attrs class, named tuple) or has built-in handler, wins.
+        Objects with declared fields are shown by fields only if repr is generated, else using own repr.
+        Objects of other classes with `__slots__` and without `__dict__` and own repr are shown by slots.
+        Fields are resolved once per type: handler with fields is stored in the dispatch table.
+
+        :param obj_type: object type
+        :type obj_type: type
+        :return: formatting handler
+        :rtype: typing.Callable[..., typing.Optional[typing.Iterator[typing.Any]]]
+        """
+        cls: typing.Type[PrettyFormat] = self.__class__
+        magic_method_name: str = self._magic_method_name
+        registries: typing.List[typing.Dict[type, _TypeHandlerT]] = [
+            klass.__dict__["_type_handlers"] for klass in cls.__mro__ if "_type_handlers" in klass.__dict__
+        ]
+
+        handler: _HandlerT = cls._write_simple
+        for base in obj_type.__mro__:
+            if magic_method_name in base.__dict__:
+                handler = _call_magic
+                break
+            type_handler: typing.Optional[_TypeHandlerT] = next(
+                (registry[base] for registry in registries if base in registry), None
+            )
+            if type_handler is not None:
+                handler = functools.partial(_call_type_handler, type_handler)
+                break
+            fields: typing.Optional[_FieldsT] = _declared_fields(base)
+            if fields is not None:
+                # Object with own repr is shown as is
+                if _has_generated_repr(obj_type):
+                    handler = functools.partial(cls._write_structure, fields=fields)
+                break
+            if base in _BUILTIN_HANDLERS:
+                method_name, brackets = _BUILTIN_HANDLERS[base]
+                if brackets is None:
+                    handler = getattr(cls, method_name)
+                    break
+                opening, closing = brackets
+                if obj_type not in _PLAIN_CONTAINERS:
+                    opening, closing = self._container_brackets(obj_type.__name__, opening, closing)
+                handler = functools.partial(getattr(cls, method_name), opening=opening, closing=closing)
+                break
         else:
-            annotation = f" -> {getattr(sig.return_annotation, '__name__', sig.return_annotation)!s}"
+            fields = _slots_fields(obj_type)
+            if fields is not None:
+                handler = functools.partial(cls._write_structure, fields=fields)
 
-        return (
-            f"{'':<{indent}}"
-            f"<{src.__class__.__name__} {src.__module__}.{src.__name__} with interface ({param_str}){annotation}>"
-        )
+        if handler is not _call_magic and hasattr(obj_type, "__getattr__"):
+            handler = functools.partial(_call_magic_dynamic, handler)
 
-    @abc.abstractmethod
-    def _repr_simple(
+        if len(cls._dispatch) >= _DISPATCH_TABLE_SIZE:
+            cls._dispatch.clear()
+        cls._dispatch[obj_type] = handler
+        return handler
+
+    def _write_element(self, src: typing.Any, indent: int, no_indent_start: bool, write: _WriteT) -> None:
+        """Write human readable representation of object.
+
+        Nested objects are processed without recursion: handlers of containers return iterators over the rest of work,
+        which are driven using explicit stack.
+        Output size budget of the call from magic method or handler is limited by the rest of the outer call budget.
+
+        :param src: object to process
+        :type src: typing.Any
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: do not indent open bracket and simple parameters
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        """
+        in_progress: typing.Optional[typing.Set[int]] = _VISITS.in_progress
+        if in_progress is not None and self._write_visited(src, indent, no_indent_start, write, in_progress):
+            return
+
+        outer_budget: typing.Optional[_CharsBudget] = _VISITS.budget
+        budget: typing.Optional[_CharsBudget] = None
+        if self.__max_total_chars is not None:
+            # Output of the nested call is written by the outer call: it is accounted there
+            limit: int = self.__max_total_chars
+            if outer_budget is not None:
+                limit = min(limit, outer_budget.remaining)
+            budget = _CharsBudget(limit, write)
+            write = budget.write
+
+        handler: typing.Optional[_HandlerT] = self._dispatch.get(type(src), None)
+        if handler is None:
+            handler = self._resolve_handler(type(src))
+        nested: typing.Optional[typing.Iterator[_WorkT]] = handler(self, src, indent, no_indent_start, write)
+        if nested is None:
+            return
+
+        if in_progress is not None:  # Called from magic method or handler
+            _VISITS.budget = budget
+            try:
+                self._drive(src, nested, write, in_progress)
+            finally:
+                _VISITS.budget = outer_budget
+            return
+
+        in_progress = _VISITS.in_progress = set()
+        _VISITS.budget = budget
+        try:
+            self._drive(src, nested, write, in_progress)
+        finally:
+            _VISITS.in_progress = None
+            _VISITS.shown = {}
+            _VISITS.budget = None
+
+    def _drive(
         self,
         src: typing.Any,
-        indent: int = 0,
-        no_indent_start: bool = False,
-    ) -> str:
-        """Repr object without iteration.
+        nested: typing.Iterator[_WorkT],
+        write: _WriteT,
+        in_progress: typing.Set[int],
+    ) -> None:
+        """Process nested objects using explicit stack of work iterators.
+
+        :param src: object, which is being expanded
+        :type src: typing.Any
+        :param nested: work iterator of the object
+        :type nested: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :param in_progress: ids of objects, which are being expanded
+        :type in_progress: typing.Set[int]
+        """
+        dispatch: typing.Dict[type, _HandlerT] = self._dispatch
+        shown: typing.Optional[typing.Dict[int, typing.Any]] = _VISITS.shown if self.mark_shared else None
+        stack: typing.List[typing.Iterator[_WorkT]] = [nested]
+        ids: typing.List[int] = [id(src)]
+        in_progress.add(id(src))
+        if shown is not None:
+            shown[id(src)] = src
+        while stack:
+            for obj, obj_indent, obj_no_indent_start in stack[-1]:
+                obj_id: int = id(obj)
+                if obj_id in in_progress or (shown is not None and obj_id in shown):
+                    self._write_visited(obj, obj_indent, obj_no_indent_start, write, in_progress)
+                    continue
+                handler = dispatch.get(type(obj), None)
+                if handler is None:
+                    handler = self._resolve_handler(type(obj))
+                nested_obj = handler(self, obj, obj_indent, obj_no_indent_start, write)
+                if nested_obj is not None:
+                    stack.append(nested_obj)
+                    ids.append(obj_id)
+                    in_progress.add(obj_id)
+                    if shown is not None:
+                        shown[obj_id] = obj
+                    break
+            else:
+                stack.pop()
+                in_progress.discard(ids.pop())
+
+    def _write_visited(
+        self,
+        src: typing.Any,
+        indent: int,
+        no_indent_start: bool,
+        write: _WriteT,
+        in_progress: typing.Set[int],
+    ) -> bool:
+        """Write reference instead of the object, which is being expanded or has been already shown.
+
+        :param src: object to process
+        :type src: typing.Any
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: do not indent open bracket and simple parameters
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :param in_progress: ids of objects, which are being expanded
+        :type in_progress: typing.Set[int]
+        :return: reference has been written
+        :rtype: bool
+        """
+        if id(src) in in_progress:
+            reference: str = "Recursion on"
+        elif self.mark_shared and id(src) in _VISITS.shown:
+            reference = "Already shown"
+        else:
+            return False
+        write(f"{'':<{0 if no_indent_start else indent}}<{reference} {src.__class__.__name__} with id={id(src)}>")
+        return True
+
+    def _write_simple(self, src: typing.Any, indent: int, no_indent_start: bool, write: _WriteT) -> None:
+        """Write object without iteration.
 
         :param src: Source object
         :type src: typing.Any
@@ -273,75 +928,397 @@ class PrettyFormat(metaclass=abc.ABCMeta):
         :type indent: int
         :param no_indent_start: ignore indent
         :type no_indent_start: bool
-        :return: simple repr() over object
-        :rtype: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
         """
+        write(self._repr_simple(src, indent, no_indent_start))
 
-    @abc.abstractmethod
-    def _repr_dict_items(
+    def _write_string(
+        self,
+        src: typing.Union[str, bytes],
+        indent: int,
+        no_indent_start: bool,
+        write: _WriteT,
+    ) -> None:
+        """Write string or binary string: characters past `max_str_len` are not shown.
+
+        :param src: string to process
+        :type src: typing.Union[str, bytes]
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: ignore indent
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        """
+        max_str_len: typing.Optional[int] = self.__max_str_len
+        if max_str_len is None or len(src) <= max_str_len:
+            write(self._repr_simple(src, indent, no_indent_start))
+            return
+        unit: str = "bytes" if isinstance(src, bytes) else "chars"
+        write(
+            f"{self._repr_simple(src[:max_str_len], indent, no_indent_start)} "
+            f"... {len(src) - max_str_len:,} more {unit}"
+        )
+
+    def _write_callable(
+        self,
+        src: typing.Union[types.FunctionType, types.MethodType],
+        indent: int,
+        no_indent_start: bool,  # pylint: disable=unused-argument
+        write: _WriteT,
+    ) -> typing.Iterator[_WorkT]:
+        """Write callable object (function or method) with signature.
+
+        :param src: Callable to process
+        :type src: typing.Union[types.FunctionType, types.MethodType]
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: not used: signature is always indented
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :return: default values of parameters to format
+        :rtype: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        """
+        interface: _CallableInterface = _get_interface(src)
+        params: typing.Tuple[typing.Tuple[str, typing.Any], ...] = interface.params
+        if isinstance(src, types.MethodType) and src.__self__ is not None and params:
+            # Bound instance is shown as the value of the first parameter
+            params = ((params[0][0], src.__self__), *params[1:])
+
+        write(f"{'':<{indent}}<{src.__class__.__name__} {src.__module__}.{src.__name__} with interface (")
+        return self._iter_callable_params(params, indent, f"){interface.return_annotation}>", write)
+
+    def _iter_callable_params(
+        self,
+        params: typing.Sequence[typing.Tuple[str, typing.Any]],
+        indent: int,
+        closing: str,
+        write: _WriteT,
+    ) -> typing.Iterator[_WorkT]:
+        """Write callable parameters, default values are yielded for formatting.
+
+        :param params: rendered parameters with default values (`inspect.Parameter.empty` if not set)
+        :type params: typing.Sequence[typing.Tuple[str, typing.Any]]
+        :param indent: start indentation
+        :type indent: int
+        :param closing: closing fragment
+        :type closing: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :return: default values to format
+        :rtype: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        """
+        prefix: str = self._indent_prefixes(indent)[1]
+        empty: typing.Any = inspect.Parameter.empty
+        for text, value in params:
+            write(prefix + text)
+            if value is not empty:
+                write("=")
+                yield value, indent, True
+            write(",")
+        if params:
+            write("\n" + " " * indent)
+        write(closing)
+
+    def _write_dict(
         self,
         src: typing.Dict[typing.Any, typing.Any],
-        indent: int = 0,
-    ) -> str:
-        """Repr dict items.
+        indent: int,
+        no_indent_start: bool,
+        write: _WriteT,
+        opening: str,
+        closing: str,
+    ) -> typing.Optional[typing.Iterator[_WorkT]]:
+        """Write dict and its subclasses.
 
         :param src: object to process
-        :type src: typing.Dict
+        :type src: typing.Dict[typing.Any, typing.Any]
         :param indent: start indentation
         :type indent: int
-        :return: repr of key/value pairs from dict
-        :rtype: str
+        :param no_indent_start: do not indent open bracket and simple parameters
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :param opening: open bracket (with type name for subclasses)
+        :type opening: str
+        :param closing: close bracket
+        :type closing: str
+        :return: items to format, None if object has been written as is
+        :rtype: typing.Optional[typing.Iterator[typing.Tuple[typing.Any, int, bool]]]
         """
+        if indent >= self.max_indent or not src:
+            write(self._repr_collapsed(src, indent, no_indent_start))
+            return None
+        write(f"{'':<{indent if not no_indent_start else 0}}{opening}")
+        return self._iter_dict_items(src, indent, closing, write)
 
-    @staticmethod
-    @abc.abstractmethod
-    def _repr_iterable_item(
-        obj_type: str,
-        prefix: str,
+    def _write_iterable(
+        self,
+        src: typing.Collection[typing.Any],
         indent: int,
         no_indent_start: bool,
-        result: str,
-        suffix: str,
-    ) -> str:
-        """Repr iterable item.
+        write: _WriteT,
+        opening: str,
+        closing: str,
+    ) -> typing.Optional[typing.Iterator[_WorkT]]:
+        """Write list, tuple, set, frozenset and their subclasses.
 
-        :param obj_type: Object type
-        :type obj_type: str
-        :param prefix: prefix
-        :type prefix: str
+        :param src: object to process
+        :type src: typing.Collection[typing.Any]
         :param indent: start indentation
         :type indent: int
         :param no_indent_start: do not indent open bracket and simple parameters
         :type no_indent_start: bool
-        :param result: result of pre-formatting
-        :type result: str
-        :param suffix: suffix
-        :type suffix: str
-        :return: formatted repr of "result" with prefix and suffix to explain type.
-        :rtype: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :param opening: open bracket (with type name for subclasses)
+        :type opening: str
+        :param closing: close bracket
+        :type closing: str
+        :return: items to format, None if object has been written as is
+        :rtype: typing.Optional[typing.Iterator[typing.Tuple[typing.Any, int, bool]]]
         """
+        if indent >= self.max_indent or not src:
+            write(self._repr_collapsed(src, indent, no_indent_start))
+            return None
+        write(f"{'':<{indent if not no_indent_start else 0}}{opening}")
+        return self._iter_iterable_items(src, indent, closing, write)
 
-    def _repr_iterable_items(
+    def _iter_iterable_items(
         self,
         src: typing.Iterable[typing.Any],
+        indent: int,
+        closing: str,
+        write: _WriteT,
+    ) -> typing.Iterator[_WorkT]:
+        """Write separators between iterable items (not designed for dicts), items are yielded for formatting.
+
+        :param src: object to process
+        :type src: typing.Iterable[typing.Any]
+        :param indent: start indentation
+        :type indent: int
+        :param closing: close bracket
+        :type closing: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :return: items to format
+        :rtype: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        """
+        next_indent, _, _, closing_prefix = self._indent_prefixes(indent)
+        budget: typing.Optional[_CharsBudget] = None if self.__max_total_chars is None else _VISITS.budget
+        # Comma of the previous item is written together with the line break
+        separator: str = "\n"
+        if self.__max_items is None and budget is None:
+            for elem in src:
+                write(separator)
+                yield elem, next_indent, False
+                separator = ",\n"
+            write(closing_prefix + closing)
+            return
+
+        not_shown: int = len(src)
+        for elem in itertools.islice(src, self.__max_items):
+            if budget is not None and budget.remaining <= 0:
+                break
+            write(separator)
+            yield elem, next_indent, False
+            separator = ",\n"
+            not_shown -= 1
+        self._write_closing(len(src), not_shown, indent, closing, write)
+
+    def _iter_dict_items(
+        self,
+        src: typing.Dict[typing.Any, typing.Any],
+        indent: int,
+        closing: str,
+        write: _WriteT,
+    ) -> typing.Iterator[_WorkT]:
+        """Write dict keys, values are yielded for formatting.
+
+        Text of each shown key is made once: the same string is used for alignment and output.
+
+        :param src: object to process
+        :type src: typing.Dict[typing.Any, typing.Any]
+        :param indent: start indentation
+        :type indent: int
+        :param closing: close bracket
+        :type closing: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :return: values to format
+        :rtype: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        """
+        max_items: typing.Optional[int] = self.__max_items
+        keys: typing.Iterable[str] = map(self._key_text, src if max_items is None else itertools.islice(src, max_items))
+        max_len: int = 0
+        if self.__align_keys:
+            keys = list(keys)
+            max_len = max(map(len, keys), default=0)
+        items: typing.Iterator[typing.Tuple[str, typing.Any]] = zip(keys, src.values())
+        next_indent, prefix, separator, closing_prefix = self._indent_prefixes(indent)
+        budget: typing.Optional[_CharsBudget] = None if self.__max_total_chars is None else _VISITS.budget
+        # Comma of the previous item is written together with the line break
+        if max_items is None and budget is None:
+            for key, val in items:
+                write(f"{prefix}{key:<{max_len}}: ")
+                yield val, next_indent, True
+                prefix = separator
+            write(closing_prefix + closing)
+            return
+
+        not_shown: int = len(src)
+        for key, val in items:
+            if budget is not None and budget.remaining <= 0:
+                break
+            write(f"{prefix}{key:<{max_len}}: ")
+            yield val, next_indent, True
+            prefix = separator
+            not_shown -= 1
+        self._write_closing(len(src), not_shown, indent, closing, write)
+
+    def _write_structure(
+        self,
+        src: typing.Any,
+        indent: int,
+        no_indent_start: bool,
+        write: _WriteT,
+        fields: _FieldsT,
+    ) -> typing.Optional[typing.Iterator[_WorkT]]:
+        """Write dataclass, attrs class, named tuple or object with slots as class name with fields.
+
+        :param src: object to process
+        :type src: typing.Any
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: do not indent open bracket and simple parameters
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :param fields: fields to show
+        :type fields: typing.Tuple[typing.Tuple[str, str], ...]
+        :return: field values to format, None if object has been written as is
+        :rtype: typing.Optional[typing.Iterator[typing.Tuple[typing.Any, int, bool]]]
+        """
+        if indent >= self.max_indent or not fields:
+            write(self._repr_simple(src, indent, no_indent_start))
+            return None
+        write(f"{'':<{indent if not no_indent_start else 0}}{src.__class__.__name__}(")
+        return self._iter_structure_fields(src, fields, indent, write)
+
+    def _iter_structure_fields(
+        self,
+        src: typing.Any,
+        fields: _FieldsT,
+        indent: int,
+        write: _WriteT,
+    ) -> typing.Iterator[_WorkT]:
+        """Write field names, values are yielded for formatting. Not set fields (unset slots) are skipped.
+
+        :param src: object to process
+        :type src: typing.Any
+        :param fields: fields to show
+        :type fields: typing.Tuple[typing.Tuple[str, str], ...]
+        :param indent: start indentation
+        :type indent: int
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        :return: field values to format
+        :rtype: typing.Iterator[typing.Tuple[typing.Any, int, bool]]
+        """
+        next_indent, prefix, separator, _ = self._indent_prefixes(indent)
+        budget: typing.Optional[_CharsBudget] = None if self.__max_total_chars is None else _VISITS.budget
+        missing: typing.Any = inspect.Parameter.empty
+        shown: int = 0
+        not_shown: int = len(fields)
+        for name, attr in itertools.islice(fields, self.__max_items):
+            if budget is not None and budget.remaining <= 0:
+                break
+            not_shown -= 1
+            value: typing.Any = getattr(src, attr, missing)
+            if value is missing:
+                continue
+            # Comma of the previous field is written together with the line break
+            write(f"{prefix}{name}=")
+            yield value, next_indent, True
+            prefix = separator
+            shown += 1
+        if shown or not_shown:
+            self._write_closing(shown + not_shown, not_shown, indent, ")", write)
+        else:
+            write(")")
+
+    def _write_closing(self, items: int, not_shown: int, indent: int, closing: str, write: _WriteT) -> None:
+        """Write close bracket of container with marker of not shown items.
+
+        :param items: number of container items
+        :type items: int
+        :param not_shown: number of not shown items
+        :type not_shown: int
+        :param indent: start indentation
+        :type indent: int
+        :param closing: close bracket
+        :type closing: str
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
+        """
+        if not_shown:
+            # Comma is written only after shown item: marker is not an item
+            separator: str = ",\n" if not_shown < items else "\n"
+            write(f"{separator}{'':<{self.next_indent(indent)}}... {not_shown:,} more items\n{'':<{indent}}{closing}")
+        else:
+            write(self._indent_prefixes(indent)[3] + closing)
+
+    def _repr_collapsed(self, src: typing.Collection[typing.Any], indent: int, no_indent_start: bool) -> str:
+        """Repr container without expansion: on the maximal indent or empty.
+
+        :param src: container to process
+        :type src: typing.Collection[typing.Any]
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: ignore indent
+        :type no_indent_start: bool
+        :return: repr() over container, limited by `max_items` and `max_str_len` if set
+        :rtype: str
+        """
+        if self.__limited_repr is None or not src:
+            return self._repr_simple(src, indent, no_indent_start)
+        return f"{'':<{0 if no_indent_start else indent}}{self.__limited_repr.repr(src)}"
+
+    @abc.abstractmethod
+    def _repr_simple(
+        self,
+        src: typing.Any,
         indent: int = 0,
+        no_indent_start: bool = False,
     ) -> str:
-        """Repr iterable items (not designed for dicts).
+        """Repr object without iteration.
 
-        :param src: object to process
-        :type src: typing.Iterable
+        :param src: Source object
+        :type src: typing.Any
         :param indent: start indentation
         :type indent: int
-        :return: repr of elements in iterable item
+        :param no_indent_start: ignore indent
+        :type no_indent_start: bool
+        :return: simple repr() over object
         :rtype: str
         """
-        next_indent: int = self.next_indent(indent)
-        buf: typing.List[str] = []
-        for elem in src:
-            buf.append("\n")
-            buf.append(self.process_element(src=elem, indent=next_indent))
-            buf.append(",")
-        return "".join(buf)
+
+    @staticmethod
+    @abc.abstractmethod
+    def _container_brackets(obj_type: str, prefix: str, suffix: str) -> typing.Tuple[str, str]:
+        """Brackets for container subclass.
+
+        :param obj_type: Object type name
+        :type obj_type: str
+        :param prefix: open bracket of the base container
+        :type prefix: str
+        :param suffix: close bracket of the base container
+        :type suffix: str
+        :return: open and close brackets to explain type.
+        :rtype: typing.Tuple[str, str]
+        """
 
     @property
     @abc.abstractmethod
@@ -369,37 +1346,33 @@ class PrettyFormat(metaclass=abc.ABCMeta):
         :return: formatted string
         :rtype: str
         """
-        if hasattr(src, self._magic_method_name):
-            result = getattr(src, self._magic_method_name)(self, indent=indent, no_indent_start=no_indent_start)
-            return result  # type: ignore
+        buf: typing.List[str] = []
+        self._write_element(src, indent, no_indent_start, buf.append)
+        return "".join(buf)
 
-        if _known_callable(src):
-            return self._repr_callable(src=src, indent=indent)
+    def dump(
+        self,
+        src: typing.Any,
+        stream: typing.TextIO,
+        indent: int = 0,
+        no_indent_start: bool = False,
+    ) -> None:
+        """Write human readable representation of object to the text stream.
 
-        if _simple(src) or indent >= self.max_indent or not src:
-            return self._repr_simple(src=src, indent=indent, no_indent_start=no_indent_start)
+        Output is written by fragments without building the whole text in memory.
 
-        if isinstance(src, dict):
-            prefix, suffix = "{", "}"
-            result = self._repr_dict_items(src=src, indent=indent)
-        else:
-            if isinstance(src, list):
-                prefix, suffix = "[", "]"
-            elif isinstance(src, tuple):
-                prefix, suffix = "(", ")"
-            else:
-                prefix, suffix = "{", "}"
-            result = self._repr_iterable_items(src=src, indent=indent)
-        if type(src) in (list, tuple, set, dict):
-            return f"{'':<{indent if not no_indent_start else 0}}{prefix}{result}\n{'':<{indent}}{suffix}"
-        return self._repr_iterable_item(
-            obj_type=src.__class__.__name__,
-            prefix=prefix,
-            indent=indent,
-            no_indent_start=no_indent_start,
-            result=result,
-            suffix=suffix,
-        )
+        :param src: object to process
+        :type src: typing.Any
+        :param stream: text stream or file opened in text mode
+        :type stream: typing.TextIO
+        :param indent: start indentation
+        :type indent: int
+        :param no_indent_start: do not indent open bracket and simple parameters
+        :type no_indent_start: bool
+
+        .. versionadded:: 10.0.0
+        """
+        self._write_element(src, indent, no_indent_start, stream.write)
 
     def __call__(
         self,
@@ -418,8 +1391,7 @@ class PrettyFormat(metaclass=abc.ABCMeta):
         :return: formatted string
         :rtype: str
         """
-        result = self.process_element(src, indent=indent, no_indent_start=no_indent_start)
-        return result
+        return self.process_element(src, indent=indent, no_indent_start=no_indent_start)
 
 
 class PrettyRepr(PrettyFormat):
@@ -430,6 +1402,8 @@ class PrettyRepr(PrettyFormat):
 
     __slots__ = ()
 
+    _key_text = repr
+
     @property
     def _magic_method_name(self) -> str:
         """Magic method name.
@@ -458,58 +1432,37 @@ class PrettyRepr(PrettyFormat):
         """
         return f"{'':<{0 if no_indent_start else indent}}{src!r}"
 
-    def _repr_dict_items(
-        self,
-        src: typing.Dict[typing.Any, typing.Any],
-        indent: int = 0,
-    ) -> str:
-        """Repr dict items.
+    def _write_simple(self, src: typing.Any, indent: int, no_indent_start: bool, write: _WriteT) -> None:
+        """Write object without iteration.
 
-        :param src: object to process
-        :type src: typing.Dict
+        :param src: Source object
+        :type src: typing.Any
         :param indent: start indentation
         :type indent: int
-        :return: repr of key/value pairs from dict
-        :rtype: str
+        :param no_indent_start: ignore indent
+        :type no_indent_start: bool
+        :param write: output fragments consumer
+        :type write: typing.Callable[[str], typing.Any]
         """
-        max_len: int = max((len(repr(key)) for key in src)) if src else 0
-        next_indent: int = self.next_indent(indent)
-        prefix: str = "\n" + " " * next_indent
-        buf: typing.List[str] = []
-        for key, val in src.items():
-            buf.append(prefix)
-            buf.append(f"{key!r:{max_len}}: ")
-            buf.append(self.process_element(val, indent=next_indent, no_indent_start=True))
-            buf.append(",")
-        return "".join(buf)
+        if indent and not no_indent_start:
+            write(f"{'':<{indent}}{src!r}")
+        else:
+            write(repr(src))
 
     @staticmethod
-    def _repr_iterable_item(
-        obj_type: str,
-        prefix: str,
-        indent: int,
-        no_indent_start: bool,
-        result: str,
-        suffix: str,
-    ) -> str:
-        """Repr iterable item.
+    def _container_brackets(obj_type: str, prefix: str, suffix: str) -> typing.Tuple[str, str]:
+        """Brackets for container subclass: type name is shown.
 
-        :param obj_type: Object type
+        :param obj_type: Object type name
         :type obj_type: str
-        :param prefix: prefix
+        :param prefix: open bracket of the base container
         :type prefix: str
-        :param indent: start indentation
-        :type indent: int
-        :param no_indent_start: do not indent open bracket and simple parameters
-        :type no_indent_start: bool
-        :param result: result of pre-formatting
-        :type result: str
-        :param suffix: suffix
+        :param suffix: close bracket of the base container
         :type suffix: str
-        :return: formatted repr of "result" with prefix and suffix to explain type.
-        :rtype: str
+        :return: open and close brackets to explain type.
+        :rtype: typing.Tuple[str, str]
         """
-        return f"{'':<{indent if not no_indent_start else 0}}{obj_type}({prefix}{result}\n{'':<{indent}}{suffix})"
+        return f"{obj_type}({prefix}", f"{suffix})"
 
 
 class PrettyStr(PrettyFormat):
@@ -520,6 +1473,8 @@ class PrettyStr(PrettyFormat):
 
     __slots__ = ()
 
+    _key_text = str
+
     @property
     def _magic_method_name(self) -> str:
         """Magic method name.
@@ -570,58 +1525,63 @@ class PrettyStr(PrettyFormat):
             return self._strings_str(indent=indent, val=src)
         return f"{'':<{indent}}{src!s}"
 
-    def _repr_dict_items(
-        self,
-        src: typing.Dict[typing.Any, typing.Any],
-        indent: int = 0,
-    ) -> str:
-        """Repr dict items.
-
-        :param src: object to process
-        :type src: typing.Dict
-        :param indent: start indentation
-        :type indent: int
-        :return: repr of key/value pairs from dict
-        :rtype: str
-        """
-        max_len = max((len(str(key)) for key in src)) if src else 0
-        next_indent: int = self.next_indent(indent)
-        prefix: str = "\n" + " " * next_indent
-        buf: typing.List[str] = []
-        for key, val in src.items():
-            buf.append(prefix)
-            buf.append(f"{key!s:{max_len}}: ")
-            buf.append(self.process_element(val, indent=next_indent, no_indent_start=True))
-            buf.append(",")
-        return "".join(buf)
-
     @staticmethod
-    def _repr_iterable_item(
-        obj_type: str,
-        prefix: str,
-        indent: int,
-        no_indent_start: bool,
-        result: str,
-        suffix: str,
-    ) -> str:
-        """Repr iterable item.
+    def _container_brackets(obj_type: str, prefix: str, suffix: str) -> typing.Tuple[str, str]:
+        """Brackets for container subclass: the same as for the base container.
 
-        :param obj_type: Object type
+        :param obj_type: Object type name
         :type obj_type: str
-        :param prefix: prefix
+        :param prefix: open bracket of the base container
         :type prefix: str
-        :param indent: start indentation
-        :type indent: int
-        :param no_indent_start: do not indent open bracket and simple parameters
-        :type no_indent_start: bool
-        :param result: result of pre-formatting
-        :type result: str
-        :param suffix: suffix
+        :param suffix: close bracket of the base container
         :type suffix: str
-        :return: formatted repr of "result" with prefix and suffix to explain type.
-        :rtype: str
+        :return: open and close brackets.
+        :rtype: typing.Tuple[str, str]
         """
-        return f"{'':<{indent if not no_indent_start else 0}}{prefix}{result}\n{'':<{indent}}{suffix}"
+        return prefix, suffix
+
+
+@functools.lru_cache(maxsize=_FORMATTERS_CACHE_SIZE)
+def _get_formatter(
+    formatter_cls: typing.Type[PrettyFormat],
+    max_indent: int,
+    indent_step: int,
+    mark_shared: bool,
+    max_items: typing.Optional[int],
+    max_str_len: typing.Optional[int],
+    max_total_chars: typing.Optional[int],
+    align_keys: bool,
+) -> PrettyFormat:
+    """Get formatter instance for configuration: formatters do not keep state between calls and are reused.
+
+    :param formatter_cls: formatter class
+    :type formatter_cls: typing.Type[PrettyFormat]
+    :param max_indent: maximal indent before classic repr() call
+    :type max_indent: int
+    :param indent_step: step for the next indentation level
+    :type indent_step: int
+    :param mark_shared: objects, which have been already shown, are rendered as references
+    :type mark_shared: bool
+    :param max_items: maximum number of shown items for each container
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+    :type max_total_chars: typing.Optional[int]
+    :param align_keys: align values of dict by the longest shown key
+    :type align_keys: bool
+    :return: formatter instance
+    :rtype: PrettyFormat
+    """
+    return formatter_cls(  # type: ignore[abstract]
+        max_indent=max_indent,
+        indent_step=indent_step,
+        mark_shared=mark_shared,
+        max_items=max_items,
+        max_str_len=max_str_len,
+        max_total_chars=max_total_chars,
+        align_keys=align_keys,
+    )
 
 
 def pretty_repr(
@@ -630,6 +1590,11 @@ def pretty_repr(
     no_indent_start: bool = False,
     max_indent: int = 20,
     indent_step: int = 4,
+    mark_shared: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
+    align_keys: bool = True,
 ) -> str:
     """Make human readable repr of object.
 
@@ -643,10 +1608,33 @@ def pretty_repr(
     :type max_indent: int
     :param indent_step: step for the next indentation level
     :type indent_step: int
+    :param mark_shared: objects, which have been already shown, are rendered as references
+    :type mark_shared: bool
+    :param max_items: maximum number of shown items for each container
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+    :type max_total_chars: typing.Optional[int]
+    :param align_keys: align values of dict by the longest shown key
+    :type align_keys: bool
     :return: formatted string
     :rtype: str
+
+    .. versionchanged:: 10.0.0 mark_shared parameter
+    .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
+    .. versionchanged:: 10.0.0 align_keys parameter
     """
-    return PrettyRepr(max_indent=max_indent, indent_step=indent_step)(
+    return _get_formatter(
+        PrettyRepr,
+        max_indent,
+        indent_step,
+        mark_shared,
+        max_items,
+        max_str_len,
+        max_total_chars,
+        align_keys,
+    )(
         src=src,
         indent=indent,
         no_indent_start=no_indent_start,
@@ -659,6 +1647,11 @@ def pretty_str(
     no_indent_start: bool = False,
     max_indent: int = 20,
     indent_step: int = 4,
+    mark_shared: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
+    align_keys: bool = True,
 ) -> str:
     """Make human readable str of object.
 
@@ -672,10 +1665,147 @@ def pretty_str(
     :type max_indent: int
     :param indent_step: step for the next indentation level
     :type indent_step: int
+    :param mark_shared: objects, which have been already shown, are rendered as references
+    :type mark_shared: bool
+    :param max_items: maximum number of shown items for each container
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+    :type max_total_chars: typing.Optional[int]
+    :param align_keys: align values of dict by the longest shown key
+    :type align_keys: bool
     :return: formatted string
+
+    .. versionchanged:: 10.0.0 mark_shared parameter
+    .. versionchanged:: 10.0.0 max_items, max_str_len and max_total_chars parameters
+    .. versionchanged:: 10.0.0 align_keys parameter
+    """
+    return _get_formatter(
+        PrettyStr,
+        max_indent,
+        indent_step,
+        mark_shared,
+        max_items,
+        max_str_len,
+        max_total_chars,
+        align_keys,
+    )(
+        src=src,
+        indent=indent,
+        no_indent_start=no_indent_start,
+    )
+
+
+def pretty_repr_dump(
+    src: typing.Any,
+    stream: typing.TextIO,
+    indent: int = 0,
+    no_indent_start: bool = False,
+    max_indent: int = 20,
+    indent_step: int = 4,
+    mark_shared: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
+    align_keys: bool = True,
+) -> None:
+    """Write human readable repr of object to the text stream.
+
+    :param src: object to process
+    :type src: typing.Any
+    :param stream: text stream or file opened in text mode
+    :type stream: typing.TextIO
+    :param indent: start indentation, all next levels is +indent_step
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :param max_indent: maximal indent before classic repr() call
+    :type max_indent: int
+    :param indent_step: step for the next indentation level
+    :type indent_step: int
+    :param mark_shared: objects, which have been already shown, are rendered as references
+    :type mark_shared: bool
+    :param max_items: maximum number of shown items for each container
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+    :type max_total_chars: typing.Optional[int]
+    :param align_keys: align values of dict by the longest shown key
+    :type align_keys: bool
+
+    .. versionadded:: 10.0.0
+    """
+    _get_formatter(
+        PrettyRepr,
+        max_indent,
+        indent_step,
+        mark_shared,
+        max_items,
+        max_str_len,
+        max_total_chars,
+        align_keys,
+    ).dump(
+        src=src,
+        stream=stream,
+        indent=indent,
+        no_indent_start=no_indent_start,
+    )
+
+
+def pretty_str_dump(
+    src: typing.Any,
+    stream: typing.TextIO,
+    indent: int = 0,
+    no_indent_start: bool = False,
+    max_indent: int = 20,
+    indent_step: int = 4,
+    mark_shared: bool = False,
+    max_items: typing.Optional[int] = None,
+    max_str_len: typing.Optional[int] = None,
+    max_total_chars: typing.Optional[int] = None,
+    align_keys: bool = True,
+) -> None:
+    """Write human readable str of object to the text stream.
+
+    :param src: object to process
+    :type src: typing.Any
+    :param stream: text stream or file opened in text mode
+    :type stream: typing.TextIO
+    :param indent: start indentation, all next levels is +indent_step
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :param max_indent: maximal indent before classic repr() call
+    :type max_indent: int
+    :param indent_step: step for the next indentation level
+    :type indent_step: int
+    :param mark_shared: objects, which have been already shown, are rendered as references
+    :type mark_shared: bool
+    :param max_items: maximum number of shown items for each container
+    :type max_items: typing.Optional[int]
+    :param max_str_len: maximum number of shown characters (bytes) for each string
+    :type max_str_len: typing.Optional[int]
+    :param max_total_chars: approximate output size limit: items of containers are not shown after limit hit
+    :type max_total_chars: typing.Optional[int]
+    :param align_keys: align values of dict by the longest shown key
+    :type align_keys: bool
+
+    .. versionadded:: 10.0.0
     """
-    return PrettyStr(max_indent=max_indent, indent_step=indent_step)(
+    _get_formatter(
+        PrettyStr,
+        max_indent,
+        indent_step,
+        mark_shared,
+        max_items,
+        max_str_len,
+        max_total_chars,
+        align_keys,
+    ).dump(
         src=src,
+        stream=stream,
         indent=indent,
         no_indent_start=no_indent_start,
     )
@@ -0,0 +1,316 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Sampling policies for the function calls logging."""
+
+from __future__ import annotations
+
+# Standard Library
+import abc
+import copy
+import random
+import threading
+import time
+import typing
+
+__all__ = ("SamplingPolicy", "EveryNth", "Probabilistic", "TokenBucket")
+
+
+class SamplingPolicy(metaclass=abc.ABCMeta):
+    """Base class for sampling policies.
+
+    Policy decides, should the call be logged. Policy object is stateful:
+    `LogWrap` samples each decorated function by own clone of the policy, counters are summarized in the original.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__lock", "__logged", "__skipped", "__origin")
+
+    def __init__(self) -> None:
+        """Base class for sampling policies."""
+        self.__lock: threading.Lock = threading.Lock()
+        self.__logged: int = 0
+        self.__skipped: int = 0
+        self.__origin: typing.Optional[SamplingPolicy] = None
+
+    @property
+    def logged(self) -> int:
+        """Number of calls selected for logging.
+
+        :return: logged calls counter
+        :rtype: int
+        """
+        return self.__logged
+
+    @property
+    def skipped(self) -> int:
+        """Number of calls skipped by policy.
+
+        :return: skipped calls counter
+        :rtype: int
+        """
+        return self.__skipped
+
+    @abc.abstractmethod
+    def _decide(self) -> bool:
+        """Make decision about the next call. Called under the lock.
+
+        :return: call should be logged
+        :rtype: bool
+        """
+
+    def should_log(self) -> bool:
+        """Make decision about the next call and update counters.
+
+        :return: call should be logged
+        :rtype: bool
+        """
+        with self.__lock:
+            decision: bool = self._decide()
+            self.__count(decision)
+        if self.__origin is not None:
+            with self.__origin.__lock:
+                self.__origin.__count(decision)
+        return decision
+
+    def __count(self, decision: bool) -> None:
+        """Update counters. Called under the lock.
+
+        :param decision: call has been selected for logging
+        :type decision: bool
+        """
+        if decision:
+            self.__logged += 1
+        else:
+            self.__skipped += 1
+
+    def reset(self) -> None:
+        """Reset counters."""
+        with self.__lock:
+            self.__logged = 0
+            self.__skipped = 0
+
+    def _make_clone(self) -> SamplingPolicy:
+        """Make policy with the same settings and initial state.
+
+        Default implementation makes shallow copy with reset counters: override, if policy state is mutable.
+
+        :return: new policy object
+        :rtype: SamplingPolicy
+        """
+        policy: SamplingPolicy = copy.copy(self)
+        SamplingPolicy.__init__(policy)
+        return policy
+
+    def clone(self) -> SamplingPolicy:
+        """Make policy with the same settings and own state, which reports decisions to the counters of this policy.
+
+        :return: new policy object
+        :rtype: SamplingPolicy
+        """
+        policy: SamplingPolicy = self._make_clone()
+        policy.__origin = self
+        return policy
+
+
+class EveryNth(SamplingPolicy):
+    """Log each N-th call, starting from the first one.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__n", "__calls")
+
+    def __init__(self, n: int) -> None:
+        """Log each N-th call, starting from the first one.
+
+        :param n: log 1 call from N
+        :type n: int
+        :raises ValueError: n is not positive
+        """
+        if n < 1:
+            raise ValueError(f"n should be positive, got {n}")
+        super().__init__()
+        self.__n: int = n
+        self.__calls: int = 0
+
+    @property
+    def n(self) -> int:
+        """Log 1 call from N.
+
+        :return: sampling rate
+        :rtype: int
+        """
+        return self.__n
+
+    def _decide(self) -> bool:
+        """Make decision about the next call. Called under the lock.
+
+        :return: call should be logged
+        :rtype: bool
+        """
+        decision: bool = self.__calls == 0
+        self.__calls = (self.__calls + 1) % self.__n
+        return decision
+
+    def _make_clone(self) -> EveryNth:
+        """Make policy with the same settings and initial state.
+
+        :return: new policy object
+        :rtype: EveryNth
+        """
+        return self.__class__(self.__n)
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(n={self.__n})"
+
+
+class Probabilistic(SamplingPolicy):
+    """Log call with the fixed probability.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__probability", "__seed", "__random")
+
+    def __init__(self, probability: float, seed: typing.Optional[int] = None) -> None:
+        """Log call with the fixed probability.
+
+        :param probability: probability to log call (0.0 - 1.0)
+        :type probability: float
+        :param seed: random generator seed (for reproducible sampling)
+        :type seed: typing.Optional[int]
+        :raises ValueError: probability is out of range
+        """
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError(f"probability should be in range 0.0 - 1.0, got {probability}")
+        super().__init__()
+        self.__probability: float = probability
+        self.__seed: typing.Optional[int] = seed
+        self.__random: random.Random = random.Random(seed)
+
+    @property
+    def probability(self) -> float:
+        """Probability to log call.
+
+        :return: probability
+        :rtype: float
+        """
+        return self.__probability
+
+    def _decide(self) -> bool:
+        """Make decision about the next call. Called under the lock.
+
+        :return: call should be logged
+        :rtype: bool
+        """
+        return self.__random.random() < self.__probability
+
+    def _make_clone(self) -> Probabilistic:
+        """Make policy with the same settings and initial state.
+
+        :return: new policy object, seeded with the same seed
+        :rtype: Probabilistic
+        """
+        return self.__class__(self.__probability, seed=self.__seed)
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(probability={self.__probability})"
+
+
+class TokenBucket(SamplingPolicy):
+    """Rate limit: log no more than `rate` calls per second with bursts up to `burst` calls.
+
+    .. versionadded:: 10.0.0
+    """
+
+    __slots__ = ("__rate", "__burst", "__tokens", "__timestamp")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Rate limit: log no more than `rate` calls per second with bursts up to `burst` calls.
+
+        :param rate: tokens refill rate (calls per second)
+        :type rate: float
+        :param burst: bucket capacity (maximum calls logged in a row)
+        :type burst: int
+        :raises ValueError: rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate should be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst should be positive, got {burst}")
+        super().__init__()
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__tokens: float = float(burst)
+        self.__timestamp: float = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Tokens refill rate (calls per second).
+
+        :return: calls per second
+        :rtype: float
+        """
+        return self.__rate
+
+    @property
+    def burst(self) -> int:
+        """Bucket capacity.
+
+        :return: maximum calls logged in a row
+        :rtype: int
+        """
+        return self.__burst
+
+    def _decide(self) -> bool:
+        """Make decision about the next call. Called under the lock.
+
+        :return: call should be logged
+        :rtype: bool
+        """
+        now: float = time.monotonic()
+        self.__tokens = min(float(self.__burst), self.__tokens + (now - self.__timestamp) * self.__rate)
+        self.__timestamp = now
+        if self.__tokens >= 1.0:
+            self.__tokens -= 1.0
+            return True
+        return False
+
+    def _make_clone(self) -> TokenBucket:
+        """Make policy with the same settings and initial state.
+
+        :return: new policy object with full bucket
+        :rtype: TokenBucket
+        """
+        return self.__class__(self.__rate, burst=self.__burst)
+
+    def __repr__(self) -> str:
+        """Repr for debug purposes.
+
+        :return: representation for logging/debug purposes
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(rate={self.__rate}, burst={self.__burst})"
@@ -0,0 +1,171 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Watchdog for calls in flight: callback is called from the watchdog thread if call is not finished in time.
+
+Finished calls are marked as cancelled and release their callbacks immediately:
+entries are dropped when their deadline is reached or on queue compaction.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import heapq
+import itertools
+import logging
+import threading
+import time
+import typing
+
+__all__ = ("Watch", "Watchdog", "watch")
+
+LOGGER: logging.Logger = logging.getLogger("logwrap")
+# Queue is compacted, when cancelled entries are more than half of it and at least this number
+_COMPACT_MIN_CANCELLED = 64
+
+
+class Watch:
+    """Single watched call."""
+
+    __slots__ = ("deadline", "callback", "cancelled", "__watchdog")
+
+    def __init__(
+        self,
+        deadline: float,
+        callback: typing.Callable[[], typing.Any],
+        watchdog: typing.Optional[Watchdog] = None,
+    ) -> None:
+        """Single watched call.
+
+        :param deadline: `time.monotonic()` timestamp to call callback at
+        :type deadline: float
+        :param callback: callback for the call in flight
+        :type callback: typing.Callable[[], typing.Any]
+        :param watchdog: watchdog, which queue contains this watch
+        :type watchdog: typing.Optional[Watchdog]
+        """
+        self.deadline: float = deadline
+        self.callback: typing.Optional[typing.Callable[[], typing.Any]] = callback
+        self.cancelled: bool = False
+        self.__watchdog: typing.Optional[Watchdog] = watchdog
+
+    def cancel(self) -> None:
+        """Call has been finished: callback should not be called.
+
+        Callback is released immediately: arguments and result of the call are not kept until deadline.
+        """
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.callback = None
+        if self.__watchdog is not None:
+            self.__watchdog._count_cancelled()  # pylint: disable=protected-access
+
+
+class Watchdog:
+    """Call callbacks of the calls in flight after deadline from the background thread.
+
+    Thread is started on the first watched call.
+    Cancelled entries are counted without lock (approximately) and removed from the queue on the next watch,
+    when they are more than half of the queue.
+    """
+
+    __slots__ = ("__condition", "__heap", "__counter", "__thread", "__cancelled")
+
+    def __init__(self) -> None:
+        """Call callbacks of the calls in flight after deadline from the background thread."""
+        self.__condition: threading.Condition = threading.Condition(threading.Lock())
+        self.__heap: typing.List[typing.Tuple[float, int, Watch]] = []
+        self.__counter: typing.Iterator[int] = itertools.count()
+        self.__thread: typing.Optional[threading.Thread] = None
+        self.__cancelled: int = 0
+
+    def __len__(self) -> int:
+        """Number of watched calls including not yet dropped cancelled ones.
+
+        :return: watch queue size
+        :rtype: int
+        """
+        return len(self.__heap)
+
+    def watch(self, timeout: float, callback: typing.Callable[[], typing.Any]) -> Watch:
+        """Watch call.
+
+        :param timeout: time in seconds before callback is called
+        :type timeout: float
+        :param callback: callback for the call in flight
+        :type callback: typing.Callable[[], typing.Any]
+        :return: watch, which should be cancelled on call finish
+        :rtype: Watch
+        """
+        entry: Watch = Watch(time.monotonic() + timeout, callback, self)
+        with self.__condition:
+            if self.__cancelled >= _COMPACT_MIN_CANCELLED and self.__cancelled * 2 > len(self.__heap):
+                self.__compact()
+            heapq.heappush(self.__heap, (entry.deadline, next(self.__counter), entry))
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="logwrap-watchdog", daemon=True)
+                self.__thread.start()
+            elif self.__heap[0][2] is entry:  # New earliest deadline
+                self.__condition.notify()
+        return entry
+
+    def __compact(self) -> None:
+        """Drop cancelled entries from the queue. Called under the lock."""
+        self.__heap = [item for item in self.__heap if not item[2].cancelled]
+        heapq.heapify(self.__heap)
+        self.__cancelled = 0
+
+    def _count_cancelled(self) -> None:
+        """Count cancelled entry. Lock is not used: counter is only a hint for queue compaction."""
+        self.__cancelled += 1
+
+    def __run(self) -> None:
+        """Watchdog thread loop."""
+        while True:
+            with self.__condition:
+                while not self.__heap:
+                    self.__condition.wait()
+                deadline, _, entry = self.__heap[0]
+                delay: float = deadline - time.monotonic()
+                if delay > 0:
+                    self.__condition.wait(delay)
+                    continue
+                heapq.heappop(self.__heap)
+                if entry.cancelled:
+                    self.__cancelled = max(self.__cancelled - 1, 0)
+                    continue
+            callback: typing.Optional[typing.Callable[[], typing.Any]] = entry.callback
+            if callback is None:  # Cancelled concurrently
+                continue
+            try:
+                callback()
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Watchdog callback failed")
+
+
+_WATCHDOG: Watchdog = Watchdog()
+
+
+def watch(timeout: float, callback: typing.Callable[[], typing.Any]) -> Watch:
+    """Watch call using shared watchdog.
+
+    :param timeout: time in seconds before callback is called
+    :type timeout: float
+    :param callback: callback for the call in flight
+    :type callback: typing.Callable[[], typing.Any]
+    :return: watch, which should be cancelled on call finish
+    :rtype: Watch
+    """
+    return _WATCHDOG.watch(timeout, callback)
@@ -18,23 +18,13 @@
 
 # Standard Library
 import ast
-import distutils.errors
 import os.path
-import shutil
 import sys
 import typing
-from distutils.command import build_ext
 
 # External Dependencies
 import setuptools
 
-try:
-    # noinspection PyPackageRequirements
-    # External Dependencies
-    from Cython.Build import cythonize
-except ImportError:
-    cythonize = None
-
 PACKAGE_NAME = "logwrap"
 
 with open(os.path.join(os.path.dirname(__file__), PACKAGE_NAME, "__init__.py")) as f:
@@ -47,81 +37,6 @@ with open("README.rst") as f:
     LONG_DESCRIPTION = f.read()
 
 
-# noinspection PyCallingNonCallable
-if cythonize is not None:
-    if "win32" != sys.platform:
-        REQUIRES_OPTIMIZATION = [
-            setuptools.Extension("logwrap.repr_utils", ["logwrap/repr_utils.pyx"]),
-            setuptools.Extension("logwrap.log_wrap", ["logwrap/log_wrap.pyx"]),
-        ]
-        INTERFACES = ["log_wrap.pxd", "repr_utils.pxd"]
-    else:
-        REQUIRES_OPTIMIZATION = [
-            setuptools.Extension("logwrap.repr_utils", ["logwrap/repr_utils.pyx"]),
-        ]
-        INTERFACES = ["repr_utils.pxd"]
-
-    EXT_MODULES = cythonize(
-        module_list=REQUIRES_OPTIMIZATION,
-        compiler_directives=dict(
-            always_allow_keywords=True, binding=True, embedsignature=True, overflowcheck=True, language_level=3
-        ),
-    )
-else:
-    REQUIRES_OPTIMIZATION = []
-    INTERFACES = []
-    EXT_MODULES = []
-
-
-class BuildFailed(Exception):
-    """For install clear scripts."""
-
-
-class AllowFailRepair(build_ext.build_ext):
-    """This class allows C extension building to fail and repairs init."""
-
-    def run(self):
-        """Run.
-
-        :raises BuildFailed: Build is failed and clean python code should be used.
-        """
-        try:
-            build_ext.build_ext.run(self)
-
-            # Copy __init__.py back to repair package.
-            build_dir = os.path.abspath(self.build_lib)
-            root_dir = os.path.abspath(os.path.join(__file__, ".."))
-            target_dir = build_dir if not self.inplace else root_dir
-
-            src_file = os.path.join(PACKAGE_NAME, "__init__.py")
-
-            src = os.path.join(root_dir, src_file)
-            dst = os.path.join(target_dir, src_file)
-
-            if src != dst:
-                shutil.copyfile(src, dst)
-        except (
-            distutils.errors.DistutilsPlatformError,
-            FileNotFoundError,
-        ):
-            raise BuildFailed()
-
-    def build_extension(self, ext):
-        """build_extension.
-
-        :raises BuildFailed: Build is failed and clean python code should be used.
-        """
-        try:
-            build_ext.build_ext.build_extension(self, ext)
-        except (
-            distutils.errors.CCompilerError,
-            distutils.errors.DistutilsExecError,
-            distutils.errors.DistutilsPlatformError,
-            ValueError,
-        ):
-            raise BuildFailed()
-
-
 # noinspection PyUnresolvedReferences
 def get_simple_vars_from_src(
     src: str,
@@ -238,17 +153,7 @@ SETUP_ARGS: typing.Dict[str, typing.Union[str, typing.List[str], typing.Dict[str
     ],
     use_scm_version={"write_to": f"{PACKAGE_NAME}/_version.py"},
     install_requires=REQUIRED,
-    package_data={PACKAGE_NAME: INTERFACES + ["py.typed"]},
+    package_data={PACKAGE_NAME: ["py.typed"]},
 )
-if cythonize is not None:
-    SETUP_ARGS["ext_modules"] = EXT_MODULES
-    SETUP_ARGS["cmdclass"] = dict(build_ext=AllowFailRepair)
-
-try:
-    setuptools.setup(**SETUP_ARGS)
-except BuildFailed:
-    print("*" * 80 + "\n* Build Failed!\n* Use clear scripts version.\n" + "*" * 80 + "\n")
-    del SETUP_ARGS["ext_modules"]
-    del SETUP_ARGS["cmdclass"]
-    SETUP_ARGS["package_data"][PACKAGE_NAME] = ["py.typed"]
-    setuptools.setup(**SETUP_ARGS)
+
+setuptools.setup(**SETUP_ARGS)
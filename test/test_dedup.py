@@ -0,0 +1,122 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Repeated failures suppression tests."""
+
+# Standard Library
+import queue
+import unittest
+from unittest import mock
+
+# Package Implementation
+import logwrap
+from logwrap import dedup
+
+
+def fail(exc_type):
+    raise exc_type("Expected")
+
+
+def capture(exc_type):
+    try:
+        fail(exc_type)
+    except Exception as e:
+        return e
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestFailureDeduplicator(unittest.TestCase):
+    def test_001_fingerprint(self):
+        self.assertEqual(
+            dedup.fingerprint("func", capture(ValueError)),
+            dedup.fingerprint("func", capture(ValueError)),
+        )
+        self.assertNotEqual(
+            dedup.fingerprint("func", capture(ValueError)),
+            dedup.fingerprint("func", capture(TypeError)),
+        )
+        self.assertNotEqual(
+            dedup.fingerprint("func", capture(ValueError)),
+            dedup.fingerprint("other", capture(ValueError)),
+        )
+
+    @mock.patch("time.monotonic")
+    def test_002_register(self, monotonic):
+        deduplicator = logwrap.FailureDeduplicator(interval=10)
+        monotonic.return_value = 100.0
+        self.assertEqual((True, 0, 0.0), deduplicator.register("key"))
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key"))
+        monotonic.return_value = 105.0
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key"))
+        monotonic.return_value = 110.0
+        self.assertEqual((False, 3, 10.0), deduplicator.register("key"))
+        monotonic.return_value = 115.0
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key"))
+        self.assertEqual(4, deduplicator.suppressed)
+
+        # Stopped recurring: the rest is reported and failure is logged in full again
+        monotonic.return_value = 130.0
+        self.assertEqual((True, 1, 20.0), deduplicator.register("key"))
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key"))
+
+    def test_003_lru(self):
+        deduplicator = logwrap.FailureDeduplicator(max_fingerprints=2)
+        deduplicator.register("first")
+        deduplicator.register("second")
+        deduplicator.register("first")
+        deduplicator.register("third")  # "second" is evicted
+        self.assertEqual(2, len(deduplicator))
+        self.assertFalse(deduplicator.register("first")[0])
+        self.assertTrue(deduplicator.register("second")[0])
+
+        deduplicator.clear()
+        self.assertEqual(0, len(deduplicator))
+
+    def test_004_flush_expired(self):
+        flushed = queue.Queue()
+        deduplicator = logwrap.FailureDeduplicator(interval=0.5)
+        self.assertEqual((True, 0, 0.0), deduplicator.register("key", flush=lambda *summary: flushed.put(summary)))
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key", flush=lambda *summary: flushed.put(summary)))
+        self.assertEqual((False, 0, 0.0), deduplicator.register("key", flush=lambda *summary: flushed.put(summary)))
+
+        # Failure did not recur: trailing repeats are reported on interval expiration
+        repeated, period = flushed.get(timeout=5)
+        self.assertEqual(2, repeated)
+        self.assertGreaterEqual(period, 0.5)
+        self.assertTrue(flushed.empty())
+
+    @mock.patch("time.monotonic")
+    def test_005_flush(self, monotonic):
+        flushed = []
+        deduplicator = logwrap.FailureDeduplicator(interval=10)
+        monotonic.return_value = 100.0
+        deduplicator.register("key", flush=lambda *summary: flushed.append(summary))
+        deduplicator.register("key", flush=lambda *summary: flushed.append(summary))
+        deduplicator.register("other", flush=lambda *summary: flushed.append(summary))
+
+        monotonic.return_value = 103.0
+        deduplicator.flush()
+        self.assertEqual([(1, 3.0)], flushed)
+        deduplicator.flush()  # Already reported
+        self.assertEqual([(1, 3.0)], flushed)
+
+    def test_006_validation(self):
+        with self.assertRaises(ValueError):
+            logwrap.FailureDeduplicator(interval=0)
+        with self.assertRaises(ValueError):
+            logwrap.FailureDeduplicator(max_fingerprints=0)
+        with self.assertRaises(TypeError):
+            logwrap.LogWrap().dedup = 10
@@ -0,0 +1,91 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Structured records formatters tests."""
+
+# Standard Library
+import io
+import json
+import logging
+import unittest
+
+# Package Implementation
+import logwrap
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestJsonLinesFormatter(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("logwrap.test.formatters")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setFormatter(logwrap.JsonLinesFormatter())
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    def lines(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_001_plain_record(self):
+        self.logger.info("Message %s", "é")
+        (line,) = self.lines()
+        self.assertEqual({"time", "level", "logger", "message"}, set(line))
+        self.assertEqual("INFO", line["level"])
+        self.assertEqual("logwrap.test.formatters", line["logger"])
+        self.assertEqual("Message é", line["message"])
+        self.assertIn("é", self.stream.getvalue())
+
+    def test_002_structured(self):
+        @logwrap.logwrap(log=self.logger, structured=True)
+        def func(arg, obj=None):
+            return {"arg": arg}
+
+        func(1, obj=object())
+        calling, done = self.lines()
+        self.assertEqual("Calling: 'func'", calling["message"])
+        self.assertEqual("calling", calling["outcome"])
+        self.assertEqual(1, calling["call_args"]["arg"])
+        self.assertTrue(calling["call_args"]["obj"].startswith("<object object at "))
+        self.assertLessEqual(set(logwrap.STRUCTURED_FIELDS), set(calling) & set(done))
+        self.assertEqual("success", done["outcome"])
+        self.assertEqual("{'arg': 1}", done["result"])
+
+    def test_003_exception(self):
+        @logwrap.logwrap(log=self.logger, structured=True)
+        def func():
+            raise ValueError("Expected")
+
+        with self.assertRaises(ValueError):
+            func()
+        _, failed = self.lines()
+        self.assertEqual("ERROR", failed["level"])
+        self.assertEqual("failure", failed["outcome"])
+        self.assertIn("ValueError: Expected", failed["exc_info"])
+        self.assertEqual(1, self.stream.getvalue().count("\n") - 1)
+
+    def test_004_not_serializable(self):
+        self.logger.info("Message", extra={"result": {1, 2}})
+        (line,) = self.lines()
+        self.assertEqual("{1, 2}", line["result"])
+
+    def test_005_ensure_ascii(self):
+        self.handler.setFormatter(logwrap.JsonLinesFormatter(ensure_ascii=True))
+        self.logger.info("é")
+        self.assertIn("\\u00e9", self.stream.getvalue())
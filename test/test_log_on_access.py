@@ -437,3 +437,67 @@ class TestLogOnAccess(unittest.TestCase):
         logged = self.stream.getvalue().splitlines()
         self.assertEqual("DEBUG:Target:Request: del Target(val=OK).ok", logged[0])
         self.assertRegex(logged[1], r"DEBUG:Target:Done at (?:\d+\.\d{3})s: del Target\(val=OK\)\.ok")
+
+    def test_11_record_location(self):
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logging.getLogger().addHandler(handler)
+
+        # noinspection PyMissingOrEmptyDocstring
+        class Target:
+            def __init__(tself, val=VALUE):
+                tself.val = val
+
+            @logwrap.LogOnAccess
+            def ok(tself):
+                return tself.val
+
+            @ok.setter
+            def ok(tself, val):
+                tself.val = val
+
+        target = Target()
+        self.assertEqual(target.ok, VALUE)
+        target.ok = "OK"
+
+        self.assertEqual(4, len(records))
+        for record in records[:2]:
+            self.assertEqual(__file__, record.pathname)
+            self.assertEqual(Target.__dict__["ok"].fget.__code__.co_firstlineno, record.lineno)
+            self.assertEqual("ok", record.funcName)
+        for record in records[2:]:
+            self.assertEqual(Target.__dict__["ok"].fset.__code__.co_firstlineno, record.lineno)
+
+    def test_12_output_budgets(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Target:
+            def __init__(tself):
+                tself.val = list(range(1000))
+
+            def __repr__(tself):
+                return f"{tself.__class__.__name__}()"
+
+            def get_ok(tself):
+                return tself.val
+
+            ok = logwrap.LogOnAccess(get_ok, max_items=1)
+
+        self.assertEqual(1, Target.__dict__["ok"].max_items)
+        Target().ok
+        self.assertIn("Target().ok -> [\n    0,\n    ... 999 more items\n]", self.stream.getvalue())
+
+        prop = Target.__dict__["ok"]
+        for name in ("max_items", "max_str_len", "max_total_chars"):
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    setattr(prop, name, -1)
+                with self.assertRaises(TypeError):
+                    setattr(prop, name, "1")
+                with self.assertRaises(TypeError):
+                    setattr(prop, name, True)
+                with self.assertRaises(ValueError):
+                    logwrap.LogOnAccess(Target.get_ok, **{name: -1})
+        self.assertEqual(1, prop.max_items)
+        prop.max_items = None
+        self.assertIsNone(prop.max_items)
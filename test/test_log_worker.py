@@ -0,0 +1,117 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""LogWorker tests."""
+
+# Standard Library
+import logging
+import threading
+import unittest
+
+# Package Implementation
+import logwrap
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.gate = gate
+        self.records = []
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.append((threading.current_thread().name, record.levelno, record.getMessage()))
+
+
+def get_logger(handler):
+    logger = logging.Logger("logwrap.test_worker", level=logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestLogWorker(unittest.TestCase):
+    def test_001_logwrap(self):
+        handler = RecordingHandler()
+        worker = logwrap.LogWorker()
+        self.addCleanup(worker.stop)
+
+        @logwrap.logwrap(log=get_logger(handler), worker=worker)
+        def func(arg):
+            return arg
+
+        self.assertEqual(func(1), 1)
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertTrue(worker.is_alive)
+        self.assertEqual(
+            handler.records,
+            [
+                ("LogWorker", logging.DEBUG, "Calling: \nfunc(\n    # POSITIONAL_OR_KEYWORD:\n    arg=1,\n)"),
+                ("LogWorker", logging.DEBUG, "Done: 'func' with result:\n1"),
+            ],
+        )
+
+        self.assertTrue(worker.stop())
+        self.assertFalse(worker.is_alive)
+
+        # Restart on demand
+        func(2)
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertEqual(len(handler.records), 4)
+
+    def test_002_drop(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        logger = get_logger(handler)
+        worker = logwrap.LogWorker(max_queue_size=1, overflow="drop")
+        self.addCleanup(worker.stop)
+        self.assertIs(worker.overflow, logwrap.OverflowPolicy.DROP)
+
+        results = [
+            worker.submit(logger, logger.makeRecord(logger.name, logging.INFO, "", 0, idx, (), None))
+            for idx in range(10)
+        ]
+        self.assertFalse(all(results))
+        self.assertEqual(worker.dropped, results.count(False))
+
+        gate.set()
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertEqual(len(handler.records), results.count(True))
+
+    def test_003_sample(self):
+        worker = logwrap.LogWorker(max_queue_size=1, overflow=logwrap.OverflowPolicy.SAMPLE, sample_rate=2)
+        self.addCleanup(worker.stop)
+        handler = RecordingHandler()
+        logger = get_logger(handler)
+        for idx in range(10):
+            worker.submit(logger, logger.makeRecord(logger.name, logging.INFO, "", 0, idx, (), None))
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertEqual(len(handler.records) + worker.dropped, 10)
+
+    def test_004_validation(self):
+        with self.assertRaises(ValueError):
+            logwrap.LogWorker(max_queue_size=0)
+        with self.assertRaises(ValueError):
+            logwrap.LogWorker(sample_rate=0)
+        with self.assertRaises(ValueError):
+            logwrap.LogWorker(overflow="unknown")
+
+    def test_005_repr(self):
+        self.assertEqual(
+            repr(logwrap.LogWorker()),
+            "LogWorker(max_queue_size=10000, overflow='drop', sample_rate=100, flush_timeout=5.0, )",
+        )
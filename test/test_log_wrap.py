@@ -20,15 +20,38 @@
 
 # Standard Library
 import functools
+import gc
+import inspect
 import io
 import logging
+import threading
+import time
 import unittest
+import weakref
 from unittest import mock
 
 # Package Implementation
 import logwrap
 
 
+class MockHandler(logging.Handler):
+    """Handler, which passes rendered records to the mock object."""
+
+    def __init__(self, target):
+        super().__init__(level=logging.DEBUG)
+        self.target = target
+
+    def emit(self, record):
+        self.target(level=record.levelno, msg=record.getMessage())
+
+
+def get_mock_logger(target):
+    """Get standalone logger, which passes rendered records to the mock object."""
+    logger = logging.Logger("logwrap.test", level=logging.DEBUG)
+    logger.addHandler(MockHandler(target))
+    return logger
+
+
 class AnyStringWith(str):
     """Special string for substring-only checking in tests."""
 
@@ -200,9 +223,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_008_negative_substitutions(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, log_level=logging.INFO, exc_level=logging.WARNING)
         def func():
@@ -214,15 +236,14 @@ class TestLogWrap(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.INFO, msg="Calling: \nfunc()"),
-                mock.call(level=logging.WARNING, msg=AnyStringWith("Failed: \nfunc()"), exc_info=False),
+                mock.call(level=logging.WARNING, msg=AnyStringWith("Failed: \nfunc()")),
             ],
             log.mock_calls,
         )
 
     def test_010_indent(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, max_indent=10)
         def func():
@@ -266,9 +287,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_013_py3_args(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         log_call = logwrap.logwrap(log=new_logger)
 
@@ -334,9 +354,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_015_args_blacklist(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         arg1 = "test arg 1"
         arg2 = "test arg 2"
@@ -365,9 +384,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_016_exceptions_blacklist(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, blacklisted_exceptions=[TypeError])
         def func():
@@ -379,15 +397,14 @@ class TestLogWrap(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.DEBUG, msg="Calling: \nfunc()"),
-                mock.call(exc_info=False, level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
+                mock.call(level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
             ],
             log.mock_calls,
         )
 
     def test_017_disable_args(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         arg1 = "test arg 1"
         arg2 = "test arg 2"
@@ -407,9 +424,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_018_disable_args_exc(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         arg1 = "test arg 1"
         arg2 = "test arg 2"
@@ -434,15 +450,14 @@ class TestLogWrap(unittest.TestCase):
                         f")"
                     ),
                 ),
-                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()"), exc_info=False),
+                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()")),
             ],
             log.mock_calls,
         )
 
     def test_019_disable_all_args(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         arg1 = "test arg 1"
         arg2 = "test arg 2"
@@ -457,15 +472,14 @@ class TestLogWrap(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.DEBUG, msg="Calling: \n" "func()"),
-                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()"), exc_info=False),
+                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()")),
             ],
             log.mock_calls,
         )
 
     def test_020_disable_result(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, log_result_obj=False)
         def func():
@@ -502,9 +516,8 @@ class TestLogWrap(unittest.TestCase):
         )
 
     def test_022_disable_traceback(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, log_traceback=False)
         def func():
@@ -516,7 +529,7 @@ class TestLogWrap(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.DEBUG, msg="Calling: \n" "func()"),
-                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()"), exc_info=False),
+                mock.call(level=logging.ERROR, msg=AnyStringWith("Failed: \nfunc()")),
             ],
             log.mock_calls,
         )
@@ -524,7 +537,6 @@ class TestLogWrap(unittest.TestCase):
             mock.call(
                 level=logging.ERROR,
                 msg=AnyStringWith("Failed: \nfunc()\nTraceback (most recent call last):"),
-                exc_info=False,
             ),
             log.mock_calls[1],
         )
@@ -553,6 +565,707 @@ class TestLogWrap(unittest.TestCase):
             self.stream.getvalue(),
         )
 
+        # Result is rendered by handler: repr failure is reported in record
+        self.stream.seek(0)
+        self.stream.truncate()
+
+        @logwrap.logwrap(log_call_args=False)
+        def func():
+            return tst
+
+        self.assertIs(func(), tst)
+        self.assertEqual(
+            f"DEBUG>Calling: \n"
+            f"func()\n"
+            f"DEBUG>Done: 'func' with result:\n"
+            f"{object.__repr__(tst)} (repr failed with reason: Exception: expected)\n",
+            self.stream.getvalue(),
+        )
+
+    def test_024_disabled_level(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Tst:
+            def __repr__(tst_self):
+                raise AssertionError("Repr should not be called for disabled level")
+
+        @logwrap.logwrap(log_level=logging.DEBUG, exc_level=logging.DEBUG)
+        def func(arg):
+            return arg
+
+        self.logger.setLevel(logging.INFO)
+        tst = Tst()
+        self.assertIs(func(tst), tst)
+        self.assertEqual("", self.stream.getvalue())
+
+    def test_025_exc_level_only(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Tst:
+            def __init__(tst_self):
+                tst_self.repr_calls = 0
+
+            def __repr__(tst_self):
+                tst_self.repr_calls += 1
+                return "<Tst_instance>"
+
+        @logwrap.logwrap
+        def func(arg, fail=False):
+            if fail:
+                raise ValueError(arg)
+            return arg
+
+        self.logger.setLevel(logging.ERROR)
+        tst = Tst()
+        func(tst)
+        self.assertEqual(0, tst.repr_calls)
+        self.assertEqual("", self.stream.getvalue())
+
+        with self.assertRaises(ValueError):
+            func(tst, fail=True)
+
+        self.assertEqual(
+            "ERROR>Failed: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=<Tst_instance>,\n"
+            "    fail=True,\n"
+            ")",
+            "\n".join(self.stream.getvalue().split("\n")[:6]),
+        )
+
+    def test_026_blacklist_changed_after_decoration(self):
+        log_call = logwrap.LogWrap(log_result_obj=False)
+
+        @log_call
+        def func(arg, secret):
+            pass
+
+        log_call.blacklisted_names.append("secret")
+        func(1, "password")
+        self.assertEqual(
+            "DEBUG>Calling: \n" "func(\n" "    # POSITIONAL_OR_KEYWORD:\n" "    arg=1,\n" ")\n" "DEBUG>Done: 'func'\n",
+            self.stream.getvalue(),
+        )
+
+    def test_027_deferred_render(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Tst:
+            def __init__(tst_self):
+                tst_self.repr_calls = 0
+
+            def __repr__(tst_self):
+                tst_self.repr_calls += 1
+                return "<Tst_instance>"
+
+        @logwrap.logwrap
+        def func(arg):
+            return arg
+
+        tst = Tst()
+        drop_all = logging.Filter(name="nothing")
+        self.logger.addFilter(drop_all)
+        try:
+            func(tst)
+        finally:
+            self.logger.removeFilter(drop_all)
+        self.assertEqual(0, tst.repr_calls)
+        self.assertEqual("", self.stream.getvalue())
+
+        second_stream = io.StringIO()
+        self.logger.addHandler(logging.StreamHandler(second_stream))
+        func(tst)
+        self.assertEqual(2, tst.repr_calls)  # Argument and result
+        self.assertEqual(
+            "Calling: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=<Tst_instance>,\n"
+            ")\n"
+            "Done: 'func' with result:\n"
+            "<Tst_instance>\n",
+            second_stream.getvalue(),
+        )
+
+    def test_028_sampling(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Tst:
+            def __init__(tst_self):
+                tst_self.repr_calls = 0
+
+            def __repr__(tst_self):
+                tst_self.repr_calls += 1
+                return "<Tst_instance>"
+
+        policy = logwrap.EveryNth(3)
+
+        @logwrap.logwrap(sampling=policy, log_result_obj=False)
+        def func(arg, fail=False):
+            if fail:
+                raise ValueError(arg)
+            return arg
+
+        tst = Tst()
+        for _ in range(3):
+            func(tst)
+        self.assertEqual(1, tst.repr_calls)
+        self.assertEqual(1, policy.logged)
+        self.assertEqual(2, policy.skipped)
+        self.assertEqual(
+            "DEBUG>Calling: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=<Tst_instance>,\n"
+            "    fail=False,\n"
+            ")\n"
+            "DEBUG>Done: 'func'\n",
+            self.stream.getvalue(),
+        )
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        func(tst)  # logged
+        with self.assertRaises(ValueError):
+            func(tst, fail=True)  # skipped by policy, but exception is logged
+        self.assertIn(
+            "ERROR>Failed: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=<Tst_instance>,\n"
+            "    fail=True,\n"
+            ")\n",
+            self.stream.getvalue(),
+        )
+        self.assertEqual(2, self.stream.getvalue().count("DEBUG>"))
+
+        with self.assertRaises(TypeError):
+            func()  # skipped by policy, arguments do not match signature
+        self.assertIn("ERROR>Failed: \nfunc()\n", self.stream.getvalue())
+
+        # Each decorated function is sampled separately, counters are summarized in the policy
+        policy.reset()
+        log_call = logwrap.LogWrap(sampling=policy, log_call_args=False, log_result_obj=False)
+
+        @log_call
+        def sampled_a():
+            pass
+
+        @log_call
+        def sampled_b():
+            pass
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        sampled_a()
+        sampled_b()
+        sampled_a()
+        sampled_b()
+        self.assertEqual(
+            "DEBUG>Calling: \nsampled_a()\nDEBUG>Done: 'sampled_a'\n"
+            "DEBUG>Calling: \nsampled_b()\nDEBUG>Done: 'sampled_b'\n",
+            self.stream.getvalue(),
+        )
+        self.assertEqual(2, policy.logged)
+        self.assertEqual(2, policy.skipped)
+
+        # Policy replaced on decorator is applied to the decorated functions
+        log_call.sampling = logwrap.EveryNth(1)
+        self.stream.seek(0)
+        self.stream.truncate()
+        sampled_a()
+        self.assertIn("DEBUG>Calling: \nsampled_a()\n", self.stream.getvalue())
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 1_500_000, 0, 2_000_000])
+    def test_029_log_duration(self, perf_counter_ns):
+        @logwrap.logwrap(log_duration=True)
+        def func(fail=False):
+            if fail:
+                raise ValueError("fail")
+            return 1
+
+        func()
+        self.assertEqual(
+            "DEBUG>Calling: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    fail=False,\n"
+            ")\n"
+            "DEBUG>Done: 'func' at 0.001500s with result:\n"
+            "1\n",
+            self.stream.getvalue(),
+        )
+
+        with self.assertRaises(ValueError):
+            func(fail=True)
+        self.assertIn("ERROR>Failed after 0.002000s: \nfunc(\n", self.stream.getvalue())
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 50_000_000, 0, 200_000_000])
+    def test_030_slow_threshold(self, perf_counter_ns):
+        # noinspection PyMissingOrEmptyDocstring
+        class Tst:
+            def __init__(tst_self):
+                tst_self.repr_calls = 0
+
+            def __repr__(tst_self):
+                tst_self.repr_calls += 1
+                return "<Tst_instance>"
+
+        @logwrap.logwrap(slow_threshold=0.1, log_result_obj=False)
+        def func(arg):
+            return arg
+
+        tst = Tst()
+        func(tst)  # fast call
+        self.assertEqual(0, tst.repr_calls)
+        self.assertEqual("", self.stream.getvalue())
+
+        func(tst)  # slow call
+        self.assertEqual(1, tst.repr_calls)
+        self.assertEqual(
+            "DEBUG>Calling: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=<Tst_instance>,\n"
+            ")\n"
+            "DEBUG>Done: 'func' at 0.200000s\n",
+            self.stream.getvalue(),
+        )
+
+    def test_031_slow_threshold_property(self):
+        log_call = logwrap.LogWrap(slow_threshold=0.5)
+        self.assertEqual(0.5, log_call.slow_threshold)
+        log_call.slow_threshold = None
+        self.assertIsNone(log_call.slow_threshold)
+        with self.assertRaises(TypeError):
+            log_call.slow_threshold = "1"
+        with self.assertRaises(ValueError):
+            log_call.slow_threshold = -1
+        with self.assertRaises(TypeError):
+            log_call.log_duration = 1
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 2_000_000])
+    def test_032_generator(self, perf_counter_ns):
+        consumed = []
+
+        @logwrap.logwrap(log_items_every=2)
+        def func(count):
+            for idx in range(count):
+                consumed.append(idx)
+                received = yield idx
+                if received is not None:
+                    yield received
+            return "result"
+
+        with self.assertRaises(TypeError):  # Arguments are checked on call, not on iteration
+            func()
+        self.assertEqual("", self.stream.getvalue())
+
+        self.assertTrue(inspect.isgeneratorfunction(func))
+        gen = func(3)
+        self.assertTrue(inspect.isgenerator(gen))
+        self.assertEqual([], consumed)
+        perf_counter_ns.assert_not_called()  # iteration time is measured from the first item request
+        self.assertEqual(0, next(gen))
+        self.assertEqual([0], consumed)  # items are passed lazily
+        self.assertEqual("sent", gen.send("sent"))
+        self.assertEqual([1, 2], list(gen))
+        self.assertEqual(
+            "DEBUG>Iterating: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    count=3,\n"
+            ")\n"
+            "DEBUG>Yielded: 'func' item #1:\n"
+            "0\n"
+            "DEBUG>Yielded: 'func' item #3:\n"
+            "1\n"
+            "DEBUG>Done: 'func' yielded 4 items at 0.002000s with result:\n"
+            "'result'\n",
+            self.stream.getvalue(),
+        )
+
+    def test_033_generator_fail_and_close(self):
+        @logwrap.logwrap(log_call_args=False)
+        def func(fail):
+            yield 1
+            if fail:
+                raise ValueError("Expected")
+            yield 2
+
+        with self.assertRaises(ValueError):
+            list(func(True))
+        self.assertIn("ERROR>Failed after ", self.stream.getvalue())
+        self.assertIn("s (1 items yielded): \nfunc(\n", self.stream.getvalue())
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        gen = func(False)
+        self.assertEqual(1, next(gen))
+        gen.close()
+        self.assertIn("DEBUG>Closed: 'func' yielded 1 items at ", self.stream.getvalue())
+
+        # Thrown exception is delegated
+        gen = func(False)
+        next(gen)
+        with self.assertRaises(KeyError):
+            gen.throw(KeyError("thrown"))
+        self.assertIn("(1 items yielded): \nfunc(\n", self.stream.getvalue())
+
+        # Wrapper is bound as plain function
+        class Tst:
+            @logwrap.logwrap(log_call_args=False)
+            def method(self, count):
+                yield from range(count)
+
+        tst = Tst()
+        self.assertTrue(inspect.isgeneratorfunction(tst.method))
+        self.assertEqual([0, 1], list(tst.method(2)))
+
+    def test_034_traceback(self):
+        def inner():
+            raise ValueError("Expected")
+
+        @logwrap.logwrap(log_call_args=False)
+        def func():
+            inner()
+
+        with self.assertRaises(ValueError):
+            func()
+        logged = self.stream.getvalue().split("\n")
+        self.assertEqual("Traceback (most recent call last):", logged[4])
+        self.assertIn('    raise ValueError("Expected")', logged)
+        self.assertEqual("ValueError: Expected", logged[-3])
+        self.assertFalse(any(logwrap.log_wrap.__file__ in line for line in logged))
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        func_limited = logwrap.logwrap(func.__wrapped__, log_call_args=False, traceback_limit=1)
+        with self.assertRaises(ValueError):
+            func_limited()
+        self.assertEqual(
+            [
+                "ERROR>Failed: ",
+                "func()",
+                "Traceback (most recent call last):",
+                AnyStringWith(", in inner"),
+                '    raise ValueError("Expected")',
+                "ValueError: Expected",
+                "",
+                "",
+            ],
+            self.stream.getvalue().split("\n")[2:],
+        )
+
+        with self.assertRaises(ValueError):
+            logwrap.LogWrap(traceback_limit=-1)
+        with self.assertRaises(TypeError):
+            logwrap.LogWrap(traceback_limit="1")
+
+    def test_035_blacklisted_exceptions_changed(self):
+        log_call = logwrap.LogWrap(log_call_args=False)
+
+        @log_call
+        def func():
+            raise TypeError("Blacklisted")
+
+        with self.assertRaises(TypeError):
+            func()
+        self.assertIn("Traceback (most recent call last):", self.stream.getvalue())
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        log_call.blacklisted_exceptions.append(TypeError)
+        with self.assertRaises(TypeError):
+            func()
+        self.assertEqual("DEBUG>Calling: \nfunc()\nERROR>Failed: \nfunc()\nTypeError\n", self.stream.getvalue())
+
+    @mock.patch("time.monotonic")
+    def test_036_dedup(self, monotonic):
+        deduplicator = logwrap.FailureDeduplicator(interval=10)
+
+        @logwrap.logwrap(log_level=logging.INFO, dedup=deduplicator)
+        def func():
+            raise ValueError("Expected")
+
+        for timestamp in (100.0, 105.0, 109.0):
+            monotonic.return_value = timestamp
+            with self.assertRaises(ValueError):
+                func()
+        self.assertEqual(1, self.stream.getvalue().count("ERROR>"))
+        self.assertIn("Traceback (most recent call last):", self.stream.getvalue())
+
+        self.stream.seek(0)
+        self.stream.truncate()
+        monotonic.return_value = 110.0
+        with self.assertRaises(ValueError):
+            func()
+        self.assertEqual(
+            "INFO>Calling: \nfunc()\nERROR>Failed: 'func' with ValueError: repeated 3 times in the last 10s\n",
+            self.stream.getvalue(),
+        )
+
+        # Trailing repeats are reported without the next occurrence
+        self.stream.seek(0)
+        self.stream.truncate()
+        monotonic.return_value = 112.0
+        with self.assertRaises(ValueError):
+            func()
+        monotonic.return_value = 115.0
+        deduplicator.flush()
+        self.assertEqual(
+            "INFO>Calling: \nfunc()\nERROR>Failed: 'func' with ValueError: repeated 1 times in the last 5s\n",
+            self.stream.getvalue(),
+        )
+
+
+    def test_037_errors_only(self):
+        @logwrap.logwrap(errors_only=True, log_traceback=False, log_call_args_on_exc=False)
+        def func(arg, fail=False):
+            if fail:
+                raise ValueError(arg)
+            return arg
+
+        self.assertEqual(1, func(1))
+        self.assertEqual("", self.stream.getvalue())
+
+        with self.assertRaises(ValueError):
+            func(2, fail=True)
+        self.assertEqual(
+            "DEBUG>Calling: \n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=2,\n"
+            "    fail=True,\n"
+            ")\n"
+            "ERROR>Failed: \n"
+            "func()\n"
+            "ValueError\n",
+            self.stream.getvalue(),
+        )
+
+    def test_038_args_snapshot(self):
+        def func(arg):
+            arg.append(2)
+            raise ValueError(arg)
+
+        for policy, mutated in (
+            (logwrap.ArgsSnapshot.REFERENCE, True),
+            (logwrap.ArgsSnapshot.SHALLOW, False),
+            (logwrap.ArgsSnapshot.DEEP, False),
+            ("repr", False),
+        ):
+            with self.subTest(policy=policy):
+                self.stream.seek(0)
+                self.stream.truncate()
+                wrapped = logwrap.logwrap(errors_only=True, log_traceback=False, args_snapshot=policy)(func)
+                with self.assertRaises(ValueError):
+                    wrapped([1])
+                self.assertEqual(mutated, "    2,\n" in self.stream.getvalue().split("ERROR>")[1])
+
+        log_call = logwrap.LogWrap(args_snapshot="deep")
+        self.assertIs(logwrap.ArgsSnapshot.DEEP, log_call.args_snapshot)
+        with self.assertRaises(ValueError):
+            log_call.args_snapshot = "unknown"
+        with self.assertRaises(TypeError):
+            log_call.args_snapshot = None
+        with self.assertRaises(TypeError):
+            log_call.errors_only = 1
+
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 1_500_000])
+    def test_039_merge_records(self, perf_counter_ns):
+        @logwrap.logwrap(merge_records=True)
+        def func(arg):
+            return arg
+
+        self.assertEqual(1, func(1))
+        self.assertEqual(
+            "DEBUG>Done: 'func' at 0.001500s\n"
+            "func(\n"
+            "    # POSITIONAL_OR_KEYWORD:\n"
+            "    arg=1,\n"
+            ")\n"
+            "with result:\n"
+            "1\n",
+            self.stream.getvalue(),
+        )
+
+    def test_040_in_flight(self):
+        called = threading.Event()
+        release = threading.Event()
+
+        @logwrap.logwrap(merge_records=True, log_result_obj=False, in_flight_threshold=0.01)
+        def func(arg):
+            called.set()
+            release.wait(5)
+            return arg
+
+        worker = threading.Thread(target=func, args=(1,))
+        worker.start()
+        called.wait(5)
+        for _ in range(500):
+            if "In flight" in self.stream.getvalue():
+                break
+            time.sleep(0.01)
+        release.set()
+        worker.join(5)
+
+        records = self.stream.getvalue().split("DEBUG>")[1:]
+        self.assertEqual(2, len(records))
+        self.assertTrue(records[0].startswith("In flight: 'func' running for "))
+        self.assertIn("    arg=1,\n", records[0])
+        self.assertTrue(records[1].startswith("Done: 'func' at "))
+
+        # Fast call: in flight record is not emitted
+        self.stream.seek(0)
+        self.stream.truncate()
+        release.set()
+        func(2)
+        time.sleep(0.05)
+        self.assertNotIn("In flight", self.stream.getvalue())
+
+        log_call = logwrap.LogWrap(in_flight_threshold=1)
+        self.assertEqual(1.0, log_call.in_flight_threshold)
+        with self.assertRaises(ValueError):
+            log_call.in_flight_threshold = 0
+        with self.assertRaises(TypeError):
+            log_call.in_flight_threshold = "1"
+        with self.assertRaises(TypeError):
+            log_call.merge_records = None
+
+        # Arguments of finished calls are not kept by watchdog until deadline
+        # noinspection PyMissingOrEmptyDocstring
+        class Arg:
+            def __repr__(arg_self):
+                return "<Arg>"
+
+        silent = logging.Logger("logwrap.silent", level=logging.DEBUG)  # Records are not rendered
+        slow_watched = logwrap.logwrap(func.__wrapped__, log=silent, merge_records=True, in_flight_threshold=60)
+        arg = Arg()
+        arg_ref = weakref.ref(arg)
+        self.assertIs(arg, slow_watched(arg))
+        del arg
+        gc.collect()
+        self.assertIsNone(arg_ref())
+
+    def test_041_record_location(self):
+        def func(arg):
+            return arg
+
+        wrapped = logwrap.logwrap(func)
+        handler = mock.Mock(level=logging.DEBUG)
+        self.logger.addHandler(handler)
+        with mock.patch.object(logging.Logger, "findCaller", side_effect=AssertionError("findCaller used")):
+            wrapped(1)
+
+        for (record,), _ in handler.handle.call_args_list:
+            self.assertEqual(__file__, record.pathname)
+            self.assertEqual(func.__code__.co_firstlineno, record.lineno)
+            self.assertEqual("func", record.funcName)
+        self.assertEqual(2, handler.handle.call_count)
+
+    def test_042_structured(self):
+        class Unrepresentable:
+            def __repr__(self):
+                raise RuntimeError("No repr")
+
+        def func(arg, obj, *args, fail=False):
+            if fail:
+                raise ValueError(arg)
+            return [arg]
+
+        wrapped = logwrap.logwrap(func, structured=True, log_duration=True)
+        handler = mock.Mock(level=logging.DEBUG)
+        self.logger.addHandler(handler)
+        wrapped(1, Unrepresentable(), "x")
+        with self.assertRaises(ValueError):
+            wrapped("a", None, fail=True)
+
+        calling, done, calling_exc, failed = (record for (record,), _ in handler.handle.call_args_list)
+        self.assertEqual("Calling: 'func'", calling.getMessage())
+        self.assertEqual("calling", calling.outcome)
+        self.assertEqual("func", calling.func)
+        self.assertEqual(__name__, calling.func_module)
+        self.assertIn("test_042_structured.<locals>.func", calling.qualname)
+        self.assertEqual({"arg", "obj", "args", "fail"}, set(calling.call_args))
+        self.assertEqual(1, calling.call_args["arg"])
+        self.assertTrue(calling.call_args["obj"].startswith("<Unrepresentable at 0x"))
+        self.assertEqual("('x',)", calling.call_args["args"])
+        self.assertFalse(calling.call_args["fail"])
+        self.assertIsNone(calling.duration_ns)
+
+        self.assertTrue(done.getMessage().startswith("Done: 'func' at "))
+        self.assertEqual("success", done.outcome)
+        self.assertEqual("[1]", done.result)
+        self.assertIsInstance(done.duration_ns, int)
+
+        self.assertEqual({"arg": "a", "obj": None, "args": "()", "fail": True}, calling_exc.call_args)
+        self.assertEqual(logging.ERROR, failed.levelno)
+        self.assertTrue(failed.getMessage().startswith("Failed after "))
+        self.assertTrue(failed.getMessage().endswith(": 'func' with ValueError"))
+        self.assertEqual("failure", failed.outcome)
+        self.assertEqual({"arg": "a", "obj": None, "args": "()", "fail": True}, failed.call_args)
+        self.assertIs(ValueError, failed.exc_info[0])
+
+        self.assertTrue(logwrap.LogWrap(structured=True).structured)
+        with self.assertRaises(TypeError):
+            logwrap.LogWrap().structured = 1
+
+    def test_043_structured_override(self):
+        class HideSecret(logwrap.LogWrap):
+            def pre_process_param(self, arg):
+                if "skip" in arg.name:
+                    return None
+                return arg
+
+            def post_process_param(self, arg, arg_repr):
+                if "secret" in arg.name:
+                    return "<*hidden*>"
+                return arg_repr
+
+        def func(arg, arg_skip, arg_secret):
+            return None
+
+        wrapped = HideSecret(structured=True, log_call_args_on_exc=False)(func)
+        handler = mock.Mock(level=logging.DEBUG)
+        self.logger.addHandler(handler)
+        wrapped(1, 2, [3])
+
+        calling, done = (record for (record,), _ in handler.handle.call_args_list)
+        self.assertEqual({"arg": 1, "arg_secret": "<*hidden*>"}, calling.call_args)
+        self.assertIsNone(done.call_args)
+        self.assertIsNone(done.result)
+
+    def test_044_output_budgets(self):
+        @logwrap.logwrap(max_items=2, max_str_len=4)
+        def func(arg, text):
+            return list(range(100))
+
+        func(list(range(1000)), "long text")
+        logged = self.stream.getvalue()
+        self.assertIn(
+            "    arg=[\n            0,\n            1,\n            ... 998 more items\n        ],\n",
+            logged,
+        )
+        self.assertIn("    text='long' ... 5 more chars,\n", logged)
+        self.assertIn("[\n    0,\n    1,\n    ... 98 more items\n]", logged)
+
+        log_call = logwrap.LogWrap(max_total_chars=1000)
+        self.assertEqual(1000, log_call.max_total_chars)
+        self.assertIsNone(log_call.max_items)
+        with self.assertRaises(ValueError):
+            log_call.max_items = -1
+        with self.assertRaises(TypeError):
+            log_call.max_str_len = "1"
+        log_call.max_total_chars = None
+        self.assertIsNone(log_call.max_total_chars)
+
+        # Formatter is reused until settings change
+        formatter = log_call._repr_formatter()
+        self.assertIs(formatter, log_call._repr_formatter())
+        log_call.max_items = 5
+        self.assertEqual(5, log_call._repr_formatter().max_items)
+        log_call.max_indent = 10
+        self.assertEqual(10, log_call._repr_formatter().max_indent)
+
 
 # noinspection PyMissingOrEmptyDocstring
 class TestObject(unittest.TestCase):
@@ -601,11 +1314,45 @@ class TestObject(unittest.TestCase):
             "blacklisted_exceptions={obj.blacklisted_exceptions}, "
             "log_call_args={obj.log_call_args}, "
             "log_call_args_on_exc={obj.log_call_args_on_exc}, "
+            "log_traceback={obj.log_traceback}, "
             "log_result_obj={obj.log_result_obj}, "
+            "worker=None, "
+            "sampling=None, "
+            "log_duration=False, "
+            "slow_threshold=None, "
+            "collect_metrics=False, "
+            "log_items_every=0, "
+            "traceback_limit=None, "
+            "dedup=None, "
+            "errors_only=False, "
+            "args_snapshot=reference, "
+            "merge_records=False, "
+            "in_flight_threshold=None, "
+            "structured=False, "
+            "max_items=None, "
+            "max_str_len=None, "
+            "max_total_chars=None, "
             ")".format(cls=log_call.__class__.__name__, logger=log_call._logger, obj=log_call),
             repr(log_call),
         )
 
+        sampling = logwrap.EveryNth(3)
+        log_call = logwrap.LogWrap(
+            sampling=sampling,
+            slow_threshold=0.5,
+            errors_only=True,
+            args_snapshot="deep",
+            max_items=10,
+        )
+        for part in (
+            f"sampling={sampling!r}, ",
+            "slow_threshold=0.5, ",
+            "errors_only=True, ",
+            "args_snapshot=deep, ",
+            "max_items=10, ",
+        ):
+            self.assertIn(part, repr(log_call))
+
     def test_002_override_skip_arg(self):
         # noinspection PyMissingOrEmptyDocstring
         class SkipArg(logwrap.LogWrap):
@@ -617,9 +1364,9 @@ class TestObject(unittest.TestCase):
                     return None
                 return arg
 
-        log = mock.Mock(spec=logging.Logger, name="logger")
+        log = mock.Mock(name="log")
 
-        wrapper = SkipArg(log=log, log_result_obj=False)
+        wrapper = SkipArg(log=get_mock_logger(log), log_result_obj=False)
 
         @wrapper
         def func(arg, arg_skip, arg2=None, skip_arg=None):
@@ -629,11 +1376,11 @@ class TestObject(unittest.TestCase):
         self.assertEqual(
             log.mock_calls,
             [
-                mock.call.log(
+                mock.call(
                     level=logging.DEBUG,
                     msg="Calling: \n" "func(\n" "    # POSITIONAL_OR_KEYWORD:\n" "    arg=1,\n" "    arg2=None,\n" ")",
                 ),
-                mock.call.log(level=logging.DEBUG, msg="Done: 'func'"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func'"),
             ],
         )
 
@@ -648,9 +1395,9 @@ class TestObject(unittest.TestCase):
                     return arg, None
                 return arg
 
-        log = mock.Mock(spec=logging.Logger, name="logger")
+        log = mock.Mock(name="log")
 
-        wrapper = ChangeArg(log=log, log_result_obj=False)
+        wrapper = ChangeArg(log=get_mock_logger(log), log_result_obj=False)
 
         @wrapper
         def func(arg, arg_secret, arg2="public", secret_arg="key"):
@@ -660,7 +1407,7 @@ class TestObject(unittest.TestCase):
         self.assertEqual(
             log.mock_calls,
             [
-                mock.call.log(
+                mock.call(
                     level=logging.DEBUG,
                     msg="Calling: \n"
                     "func(\n"
@@ -671,7 +1418,7 @@ class TestObject(unittest.TestCase):
                     "    secret_arg=None,\n"
                     ")",
                 ),
-                mock.call.log(level=logging.DEBUG, msg="Done: 'func'"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func'"),
             ],
         )
 
@@ -683,9 +1430,9 @@ class TestObject(unittest.TestCase):
                     return "<*hidden*>"
                 return arg_repr
 
-        log = mock.Mock(spec=logging.Logger, name="logger")
+        log = mock.Mock(name="log")
 
-        wrapper = ChangeRepr(log=log, log_result_obj=False)
+        wrapper = ChangeRepr(log=get_mock_logger(log), log_result_obj=False)
 
         @wrapper
         def func(arg, arg_secret, arg2="public", secret_arg="key"):
@@ -695,7 +1442,7 @@ class TestObject(unittest.TestCase):
         self.assertEqual(
             log.mock_calls,
             [
-                mock.call.log(
+                mock.call(
                     level=logging.DEBUG,
                     msg="Calling: \n"
                     "func(\n"
@@ -706,6 +1453,6 @@ class TestObject(unittest.TestCase):
                     "    secret_arg=<*hidden*>,\n"
                     ")",
                 ),
-                mock.call.log(level=logging.DEBUG, msg="Done: 'func'"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func'"),
             ],
         )
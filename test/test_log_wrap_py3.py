@@ -30,6 +30,24 @@ from unittest import mock
 import logwrap
 
 
+class MockHandler(logging.Handler):
+    """Handler, which passes rendered records to the mock object."""
+
+    def __init__(self, target):
+        super().__init__(level=logging.DEBUG)
+        self.target = target
+
+    def emit(self, record):
+        self.target(level=record.levelno, msg=record.getMessage())
+
+
+def get_mock_logger(target):
+    """Get standalone logger, which passes rendered records to the mock object."""
+    logger = logging.Logger("logwrap.test", level=logging.DEBUG)
+    logger.addHandler(MockHandler(target))
+    return logger
+
+
 # noinspection PyUnusedLocal,PyMissingOrEmptyDocstring
 class TestLogWrapAsync(unittest.TestCase):
     @classmethod
@@ -69,9 +87,8 @@ class TestLogWrapAsync(unittest.TestCase):
         )
 
     def test_coroutine_async_as_argumented(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger)
         @asyncio.coroutine
@@ -82,8 +99,8 @@ class TestLogWrapAsync(unittest.TestCase):
 
         self.assertEqual(
             [
-                mock.call.log(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
-                mock.call.log(level=logging.DEBUG, msg="Done: 'func' with result:\nNone"),
+                mock.call(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func' with result:\nNone"),
             ],
             log.mock_calls,
         )
@@ -103,9 +120,8 @@ class TestLogWrapAsync(unittest.TestCase):
         )
 
     def test_exceptions_blacklist(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, blacklisted_exceptions=[TypeError])
         @asyncio.coroutine
@@ -121,7 +137,7 @@ class TestLogWrapAsync(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
-                mock.call(exc_info=False, level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
+                mock.call(level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
             ],
             log.mock_calls,
         )
@@ -18,6 +18,7 @@
 
 # Standard Library
 import asyncio
+import inspect
 import io
 import logging
 import unittest
@@ -27,6 +28,24 @@ from unittest import mock
 import logwrap
 
 
+class MockHandler(logging.Handler):
+    """Handler, which passes rendered records to the mock object."""
+
+    def __init__(self, target):
+        super().__init__(level=logging.DEBUG)
+        self.target = target
+
+    def emit(self, record):
+        self.target(level=record.levelno, msg=record.getMessage())
+
+
+def get_mock_logger(target):
+    """Get standalone logger, which passes rendered records to the mock object."""
+    logger = logging.Logger("logwrap.test", level=logging.DEBUG)
+    logger.addHandler(MockHandler(target))
+    return logger
+
+
 # noinspection PyUnusedLocal,PyMissingOrEmptyDocstring
 class TestLogWrapAsync(unittest.TestCase):
     """async def differs from asyncio.coroutine."""
@@ -67,9 +86,8 @@ class TestLogWrapAsync(unittest.TestCase):
         )
 
     def test_coroutine_async_as_argumented(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger)
         async def func():
@@ -79,8 +97,8 @@ class TestLogWrapAsync(unittest.TestCase):
 
         self.assertEqual(
             [
-                mock.call.log(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
-                mock.call.log(level=logging.DEBUG, msg="Done: 'func' with result:\nNone"),
+                mock.call(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func' with result:\nNone"),
             ],
             log.mock_calls,
         )
@@ -99,9 +117,8 @@ class TestLogWrapAsync(unittest.TestCase):
         )
 
     def test_exceptions_blacklist(self):
-        new_logger = mock.Mock(spec=logging.Logger, name="logger")
         log = mock.Mock(name="log")
-        new_logger.attach_mock(log, "log")
+        new_logger = get_mock_logger(log)
 
         @logwrap.logwrap(log=new_logger, blacklisted_exceptions=[TypeError])
         async def func():
@@ -116,7 +133,78 @@ class TestLogWrapAsync(unittest.TestCase):
         self.assertEqual(
             [
                 mock.call(level=logging.DEBUG, msg="Awaiting: \nfunc()"),
-                mock.call(exc_info=False, level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
+                mock.call(level=40, msg=f"Failed: \nfunc()\n{TypeError.__name__}"),
+            ],
+            log.mock_calls,
+        )
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 3_000_000])
+    def test_async_generator(self, perf_counter_ns):
+        log = mock.Mock(name="log")
+        new_logger = get_mock_logger(log)
+
+        @logwrap.logwrap(log=new_logger, log_items_every=2)
+        async def func(count):
+            for idx in range(count):
+                received = yield idx
+                if received is not None:
+                    yield received
+
+        async def consume():
+            gen = func(3)
+            self.assertTrue(inspect.isasyncgen(gen))
+            result = [await gen.__anext__()]
+            result.append(await gen.asend("sent"))
+            result.extend([item async for item in gen])
+            return result
+
+        self.assertTrue(inspect.isasyncgenfunction(func))
+        with self.assertRaises(TypeError):  # Arguments are checked on call, not on iteration
+            func()
+        self.assertEqual([0, "sent", 1, 2], self.loop.run_until_complete(consume()))
+        self.assertEqual(
+            [
+                mock.call(level=logging.DEBUG, msg="Iterating: \nfunc(\n    # POSITIONAL_OR_KEYWORD:\n    count=3,\n)"),
+                mock.call(level=logging.DEBUG, msg="Yielded: 'func' item #1:\n0"),
+                mock.call(level=logging.DEBUG, msg="Yielded: 'func' item #3:\n1"),
+                mock.call(level=logging.DEBUG, msg="Done: 'func' yielded 4 items at 0.003000s"),
             ],
             log.mock_calls,
         )
+
+    def test_async_generator_log_disabled(self):
+        log = mock.Mock(name="log")
+        new_logger = get_mock_logger(log)
+        new_logger.setLevel(logging.CRITICAL)
+
+        @logwrap.logwrap(log=new_logger)
+        async def func():
+            received = yield 1
+            while received is not None:
+                received = yield received * 2
+
+        async def consume():
+            gen = func()
+            result = [await gen.__anext__(), await gen.asend(2), await gen.asend(3)]
+            await gen.aclose()
+            return result
+
+        self.assertEqual([1, 4, 6], self.loop.run_until_complete(consume()))
+        with self.assertRaises(TypeError):
+            func(1)
+        log.assert_not_called()
+
+    def test_async_generator_fail(self):
+        @logwrap.logwrap
+        async def func():
+            yield 1
+            raise ValueError("Expected")
+
+        async def consume():
+            return [item async for item in func()]
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(consume())
+
+        self.assertIn("ERROR>Failed after ", self.stream.getvalue())
+        self.assertIn("s (1 items yielded): \nfunc()\nTraceback (most recent call last):", self.stream.getvalue())
@@ -139,3 +139,54 @@ class TestBind(unittest.TestCase):
         self.assertEqual(arg_3_bound.annotation, int)
         self.assertEqual(arg_3_bound.kind, arg_3_bound.POSITIONAL_OR_KEYWORD)
         self.assertEqual(str(arg_3_bound), "arg3: int=4  # 3")
+
+
+# noinspection PyUnusedLocal,PyMissingOrEmptyDocstring
+class TestCallPlan(unittest.TestCase):
+    def test_001_bind_matches_signature(self):
+        plan = log_wrap._CallPlan(example_function, ())
+        for args, kwargs in (
+            ((1,), {"arg3": 33}),
+            ((1, 2, 3), {"arg3": 30, "arg4": 40, "arg5": 50}),
+            ((), {"arg1": 1, "arg2": 2, "arg3": 3}),
+            ((1,), {"arg3": 3, "arg1_extra": 1}),
+        ):
+            self.assertEqual(
+                [param.value for param in log_wrap.bind_args_kwargs(sig, *args, **kwargs)],
+                plan.bind(args, kwargs),
+            )
+
+    def test_002_bind_errors(self):
+        def func(arg1, arg2=2, *, arg3):
+            """Function without *args and **kwargs."""
+
+        plan = log_wrap._CallPlan(func, ())
+        for args, kwargs in (
+            ((1, 2, 3), {"arg3": 3}),
+            ((1,), {"arg1": 1, "arg3": 3}),
+            ((1,), {}),
+            ((1,), {"arg3": 3, "arg4": 4}),
+        ):
+            with self.assertRaises(TypeError):
+                plan.bind(args, kwargs)
+
+    def test_003_blacklist(self):
+        plan = log_wrap._CallPlan(example_function, ("arg2", "kwargs"))
+        self.assertEqual((0, 2, 3, 4), plan.blacklist.logged_indices)
+        plan.set_blacklisted_names(())
+        self.assertEqual((0, 1, 2, 3, 4, 5), plan.blacklist.logged_indices)
+
+        # Snapshot of names is replaced on each change in place
+        names = log_wrap._BlacklistedNames(["arg2"])
+        snapshot = names.snapshot
+        plan.set_blacklisted_names(snapshot)
+        self.assertIs(snapshot, plan.blacklist.names)
+        names.append("kwargs")
+        self.assertIsNot(snapshot, names.snapshot)
+        self.assertEqual(("arg2", "kwargs"), names.snapshot)
+        names += ["arg1"]
+        self.assertIsInstance(names, log_wrap._BlacklistedNames)
+        self.assertEqual(("arg2", "kwargs", "arg1"), names.snapshot)
+        del names[0]
+        self.assertEqual(["kwargs", "arg1"], names)
+        self.assertEqual(("kwargs", "arg1"), names.snapshot)
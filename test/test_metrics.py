@@ -0,0 +1,131 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Calls metrics tests."""
+
+# Standard Library
+import logging
+import threading
+import unittest
+from unittest import mock
+
+# Package Implementation
+import logwrap
+from logwrap import metrics
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestFunctionMetrics(unittest.TestCase):
+    def test_001_histogram(self):
+        func_metrics = logwrap.FunctionMetrics("test.histogram")
+        for duration in range(1, 101):
+            func_metrics.record(duration * 1000)
+        func_metrics.record(10 ** 9, failed=True)
+
+        result = func_metrics.snapshot()
+        self.assertEqual("test.histogram", result.name)
+        self.assertEqual(101, result.calls)
+        self.assertEqual(1, result.errors)
+        self.assertEqual(5050 * 1000 + 10 ** 9, result.total_ns)
+        self.assertAlmostEqual(result.total_ns / 101, result.mean_ns)
+
+        p50, p99, p100 = result.percentiles(50, 99, 100)
+        # 4 bits of mantissa: value is not more than 1/16 higher
+        self.assertTrue(51_000 <= p50 <= 51_000 * 17 // 16, p50)
+        self.assertTrue(100_000 <= p99 <= 100_000 * 17 // 16, p99)
+        self.assertTrue(10 ** 9 <= p100 <= 10 ** 9 * 17 // 16, p100)
+        self.assertEqual(p50, result.percentile(50))
+
+        with self.assertRaises(ValueError):
+            result.percentile(101)
+
+        func_metrics.reset()
+        self.assertEqual((0, 0), (func_metrics.snapshot().calls, func_metrics.snapshot().percentile(50)))
+
+    def test_002_buckets(self):
+        for value in (0, 1, 31, 32, 33, 1000, 123_456_789, 2 ** 43):
+            index = metrics._bucket_index(value)
+            self.assertTrue(value <= metrics._bucket_upper_bound(index) <= value * 17 // 16 + 1, value)
+        self.assertEqual(metrics._BUCKETS_COUNT - 1, metrics._bucket_index(2 ** 60))
+
+    def test_003_threads(self):
+        func_metrics = logwrap.FunctionMetrics("test.threads")
+
+        def worker():
+            for _ in range(100):
+                func_metrics.record(10)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(400, func_metrics.snapshot().calls)
+        # Shards of finished threads are folded into the retired shards aggregate
+        self.assertEqual(1, len(func_metrics._shards()))
+
+        threads = [threading.Thread(target=worker) for _ in range(100)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+        self.assertEqual(1, len(func_metrics._shards()))
+        self.assertEqual(10_400, func_metrics.snapshot().calls)
+
+    def test_004_snapshot_reset(self):
+        func_metrics = logwrap.FunctionMetrics("test.snapshot_reset")
+        func_metrics.record(10)
+        func_metrics.record(20, failed=True)
+        result = func_metrics.snapshot(reset=True)
+        self.assertEqual((2, 1, 30), (result.calls, result.errors, result.total_ns))
+        func_metrics.record(30)
+        self.assertEqual(1, func_metrics.snapshot(reset=True).calls)
+        self.assertEqual(0, func_metrics.snapshot().calls)
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestLogWrapMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    @mock.patch("time.perf_counter_ns", side_effect=[0, 1000, 0, 2000, 0, 500])
+    def test_001_collect(self, perf_counter_ns):
+        logger = logging.Logger("logwrap.test_metrics", level=logging.CRITICAL)
+
+        @logwrap.logwrap(log=logger, collect_metrics=True)
+        def func(fail=False):
+            if fail:
+                raise ValueError("fail")
+
+        func()
+        with self.assertRaises(ValueError):
+            func(fail=True)
+
+        result = metrics.snapshot()[f"{__name__}.{func.__qualname__}"]
+        self.assertEqual(2, result.calls)
+        self.assertEqual(1, result.errors)
+        self.assertEqual(3000, result.total_ns)
+
+        func()
+        self.assertEqual(3, metrics.snapshot(reset=True)[f"{__name__}.{func.__qualname__}"].calls)
+        self.assertNotIn(f"{__name__}.{func.__qualname__}", metrics.snapshot())
+
+    def test_002_disabled(self):
+        @logwrap.logwrap
+        def func():
+            pass
+
+        func()
+        self.assertNotIn(f"{__name__}.{func.__qualname__}", metrics.snapshot())
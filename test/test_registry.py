@@ -0,0 +1,131 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Wrappers registry tests."""
+
+# Standard Library
+import io
+import logging
+import unittest
+
+# Package Implementation
+import logwrap
+from logwrap import registry
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.Logger("logwrap.test_registry", level=logging.DEBUG)
+        self.stream = io.StringIO()
+        self.logger.addHandler(logging.StreamHandler(self.stream))
+
+    def tearDown(self):
+        registry.enable()
+
+    def test_001_function(self):
+        @logwrap.logwrap(log=self.logger)
+        def func(arg):
+            return arg
+
+        self.assertTrue(registry.is_enabled(func))
+        self.assertEqual(1, registry.disable(func))
+        self.assertFalse(registry.is_enabled(func))
+        self.assertEqual(1, func(1))
+        self.assertEqual("", self.stream.getvalue())
+
+        registry.enable(func)
+        func(1)
+        self.assertIn("Calling", self.stream.getvalue())
+
+        with self.assertRaises(TypeError):
+            registry.disable(print)
+        with self.assertRaises(TypeError):
+            registry.is_enabled(print)
+
+    def test_002_patterns(self):
+        @logwrap.logwrap(log=self.logger)
+        def first():
+            pass
+
+        @logwrap.logwrap(log=self.logger)
+        def second():
+            pass
+
+        self.assertEqual(2, registry.disable(f"{__name__}.*.<locals>.*"))
+        self.assertEqual(1, registry.enable("*.second"))
+        self.assertFalse(registry.is_enabled(first))
+        self.assertTrue(registry.is_enabled(second))
+        self.assertEqual(
+            {f"{__name__}.{first.__qualname__}": False, f"{__name__}.{second.__qualname__}": True},
+            {name: state for name, state in registry.registered().items() if name.startswith(__name__)},
+        )
+
+        # Rules are applied to the new wrappers
+        @logwrap.logwrap(log=self.logger)
+        def third():
+            pass
+
+        self.assertFalse(registry.is_enabled(third))
+
+        # Rule for the same pattern is replaced and becomes the latest one
+        for _ in range(10):
+            registry.enable(f"{__name__}.*.<locals>.*")
+            registry.disable(f"{__name__}.*.<locals>.*")
+        self.assertEqual(2, len(registry._RULES))
+        self.assertEqual(1, registry.enable("*.second"))
+
+        @logwrap.logwrap(log=self.logger)
+        def second():
+            pass
+
+        self.assertTrue(registry.is_enabled(second))
+
+    def test_003_global(self):
+        @logwrap.logwrap(log=self.logger)
+        def gen():
+            yield 1
+
+        registry.disable()
+        self.assertFalse(registry.is_enabled(gen))
+        self.assertEqual([1], list(gen()))
+
+        @logwrap.logwrap(log=self.logger)
+        def func():
+            pass
+
+        self.assertFalse(registry.is_enabled(func))
+        func()
+        self.assertEqual("", self.stream.getvalue())
+
+        registry.enable()
+        self.assertTrue(registry.is_enabled(gen))
+        self.assertTrue(registry.is_enabled(func))
+
+    def test_004_generator_passed_as_is(self):
+        @logwrap.logwrap(log=self.logger)
+        def gen():
+            received = yield 1
+            while received is not None:
+                received = yield received * 2
+
+        registry.disable(gen)
+        generator = gen()
+        self.assertIs(gen.__wrapped__.__code__, generator.gi_code)
+        self.assertEqual([1, 4, 6], [next(generator), generator.send(2), generator.send(3)])
+        with self.assertRaises(KeyError):
+            generator.throw(KeyError("thrown"))
+        self.assertEqual("", self.stream.getvalue())
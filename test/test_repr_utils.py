@@ -21,8 +21,15 @@
 from __future__ import annotations
 
 # Standard Library
+import collections
+import dataclasses
+import gc
+import inspect
+import io
+import sys
 import typing
 import unittest
+import weakref
 
 # Package Implementation
 import logwrap
@@ -207,6 +214,419 @@ class TestPrettyRepr(unittest.TestCase):
         self.assertNotEqual(result, "Test")
         self.assertEqual(result, f"'<Test Class at 0x{id(Tst):X}>'")
 
+    def test_011_type_handler(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Point:
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+        # noinspection PyMissingOrEmptyDocstring
+        class Point3D(Point):
+            pass
+
+        def handler(src, parser, indent, no_indent_start):
+            return parser.process_element([src.x, src.y], indent=indent, no_indent_start=no_indent_start)
+
+        logwrap.PrettyRepr.register_type_handler(Point, handler)
+        try:
+            self.assertEqual("[\n    1,\n    2,\n]", logwrap.pretty_repr(Point(1, 2)))
+            self.assertEqual(
+                "{\n    'p': [\n        3,\n        4,\n    ],\n}",
+                logwrap.pretty_repr({"p": Point3D(3, 4)}),
+            )
+            # Registered on PrettyRepr only
+            self.assertNotEqual("[\n    1,\n    2,\n]", logwrap.pretty_str(Point(1, 2)))
+        finally:
+            logwrap.PrettyRepr.unregister_type_handler(Point)
+        self.assertEqual(repr(Point3D(3, 4))[:10], logwrap.pretty_repr(Point3D(3, 4))[:10])
+
+        logwrap.PrettyFormat.register_type_handler(Point, lambda src, parser, indent, no_indent_start: "<Point>")
+        try:
+            self.assertEqual("<Point>", logwrap.pretty_repr(Point(1, 2)))
+            self.assertEqual("<Point>", logwrap.pretty_str(Point3D(1, 2)))
+        finally:
+            logwrap.PrettyFormat.unregister_type_handler(Point)
+
+        with self.assertRaises(TypeError):
+            logwrap.PrettyRepr.register_type_handler(Point(1, 2), handler)
+        with self.assertRaises(TypeError):
+            logwrap.PrettyRepr.register_type_handler(Point, None)
+
+    def test_012_dispatch_mro(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Base:
+            def __pretty_repr__(self, parser, indent, no_indent_start):
+                return "<Base>"
+
+        # noinspection PyMissingOrEmptyDocstring
+        class MyList(list, Base):
+            pass
+
+        # noinspection PyMissingOrEmptyDocstring
+        class Custom(Base, list):
+            pass
+
+        # noinspection PyMissingOrEmptyDocstring
+        class Proxy:
+            def __init__(self, target):
+                self.__target = target
+
+            def __getattr__(self, item):
+                return getattr(self.__target, item)
+
+            def __repr__(self):
+                return "<Proxy>"
+
+        # First class in MRO wins
+        self.assertEqual("MyList([\n    1,\n])", logwrap.pretty_repr(MyList([1])))
+        self.assertEqual("<Base>", logwrap.pretty_repr(Custom([1])))
+        # Magic method of proxied object is checked on each object
+        self.assertEqual("<Base>", logwrap.pretty_repr(Proxy(Base())))
+        self.assertEqual("<Proxy>", logwrap.pretty_repr(Proxy(1)))
+
+    def test_013_dump(self):
+        val = {"key": [1, ("a", b"b")], 2: {3}}
+        stream = io.StringIO()
+        logwrap.pretty_repr_dump(val, stream, indent=4)
+        self.assertEqual(logwrap.pretty_repr(val, indent=4), stream.getvalue())
+
+        stream = io.StringIO()
+        logwrap.pretty_str_dump(val, stream, max_indent=4)
+        self.assertEqual(logwrap.pretty_str(val, max_indent=4), stream.getvalue())
+
+        stream = io.StringIO()
+        logwrap.PrettyRepr().dump(val, stream)
+        logwrap.PrettyRepr().dump(val, stream)
+        self.assertEqual(logwrap.pretty_repr(val) * 2, stream.getvalue())
+
+    def test_014_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 2
+        obj = [1]
+        for _ in range(depth - 1):
+            obj = [obj]
+        result = logwrap.pretty_repr(obj, max_indent=depth * 4)
+        self.assertTrue(result.startswith("[\n    [\n        [\n"))
+        self.assertTrue(f"\n{'':<{depth * 4}}1,\n" in result)
+        self.assertTrue(result.endswith("    ],\n]"))
+        self.assertEqual(depth, logwrap.pretty_str(obj, max_indent=depth * 4).count("["))
+
+    def test_015_recursion(self):
+        obj = [1]
+        obj.append(obj)
+        self.assertEqual(f"[\n    1,\n    <Recursion on list with id={id(obj)}>,\n]", logwrap.pretty_repr(obj))
+        self.assertEqual(f"[\n    1,\n    <Recursion on list with id={id(obj)}>,\n]", logwrap.pretty_str(obj))
+
+        dct = {"self": None, "nested": {"items": []}}
+        dct["self"] = dct
+        dct["nested"]["items"].append(dct["nested"])
+        self.assertEqual(
+            "{\n"
+            f"    'self'  : <Recursion on dict with id={id(dct)}>,\n"
+            "    'nested': {\n"
+            "        'items': [\n"
+            f"            <Recursion on dict with id={id(dct['nested'])}>,\n"
+            "        ],\n"
+            "    },\n"
+            "}",
+            logwrap.pretty_repr(dct),
+        )
+
+        # Not a recursion: shared objects are expanded by default
+        shared = [1]
+        self.assertEqual(
+            "[\n    [\n        1,\n    ],\n    [\n        1,\n    ],\n]",
+            logwrap.pretty_repr([shared, shared]),
+        )
+
+    def test_016_recursion_magic(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Node:
+            def __init__(self):
+                self.children = [self]
+
+            def __pretty_repr__(self, parser, indent, no_indent_start):
+                return parser.process_element(self.children, indent=indent, no_indent_start=no_indent_start)
+
+        node = Node()
+        self.assertEqual(
+            f"[\n    <Recursion on list with id={id(node.children)}>,\n]",
+            logwrap.pretty_repr(node),
+        )
+
+    def test_017_mark_shared(self):
+        shared = [1]
+        self.assertEqual(
+            f"[\n    [\n        1,\n    ],\n    <Already shown list with id={id(shared)}>,\n]",
+            logwrap.pretty_repr([shared, shared], mark_shared=True),
+        )
+        self.assertTrue(logwrap.PrettyStr(mark_shared=True).mark_shared)
+        self.assertFalse(logwrap.PrettyStr().mark_shared)
+
+    def test_018_budgets(self):
+        self.assertEqual(
+            "[\n    0,\n    1,\n    ... 99,998 more items\n]",
+            logwrap.pretty_repr(list(range(100000)), max_items=2),
+        )
+        self.assertEqual(
+            "{\n    'a': 'abc' ... 3 more chars,\n    ... 1 more items\n}",
+            logwrap.pretty_repr({"a": "abcdef", "bb": b"abcdef"}, max_items=1, max_str_len=3),
+        )
+        self.assertEqual(
+            "{\n    a : abc,\n    bb: abc ... 3 more bytes,\n}",
+            logwrap.pretty_str({"a": "abc", "bb": b"abcdef"}, max_str_len=3),
+        )
+        self.assertEqual("(\n    ... 2 more items\n)", logwrap.pretty_repr((1, 2), max_items=0))
+        # Container on the maximal indent: limited classic repr
+        self.assertEqual(
+            "[\n    [0, 1, ...],\n]",
+            logwrap.pretty_repr([list(range(10))], max_indent=4, max_items=2),
+        )
+
+        # Output size: items of containers are not shown after budget exhausted
+        result = logwrap.pretty_repr([[1, 2, 3]] * 1000, max_total_chars=60)
+        self.assertEqual(
+            "[\n"
+            "    [\n        1,\n        2,\n        3,\n    ],\n"
+            "    [\n        1,\n        ... 2 more items\n    ],\n"
+            "    ... 998 more items\n"
+            "]",
+            result,
+        )
+        self.assertEqual(result, logwrap.PrettyRepr(max_total_chars=60)([[1, 2, 3]] * 1000))
+
+        with self.assertRaises(ValueError):
+            logwrap.PrettyRepr(max_items=-1)
+
+    def test_019_budgets_not_visited(self):
+        visited = []
+
+        # noinspection PyMissingOrEmptyDocstring
+        class Item:
+            def __init__(self, idx):
+                self.idx = idx
+
+            def __pretty_repr__(self, parser, indent, no_indent_start):
+                visited.append(self.idx)
+                return f"{'':<{0 if no_indent_start else indent}}Item({self.idx})"
+
+        items = [Item(idx) for idx in range(1000)]
+        self.assertEqual(
+            "[\n    Item(0),\n    Item(1),\n    Item(2),\n    ... 997 more items\n]",
+            logwrap.pretty_repr(items, max_items=3),
+        )
+        self.assertEqual([0, 1, 2], visited)
+
+        visited.clear()
+        logwrap.pretty_repr({idx: item for idx, item in enumerate(items)}, max_total_chars=50)
+        self.assertLess(len(visited), 5)
+
+    def test_020_formatters_cache(self):
+        get_formatter = logwrap.repr_utils._get_formatter
+        formatter = get_formatter(logwrap.PrettyRepr, 20, 4, False, None, None, None, True)
+        self.assertIs(formatter, get_formatter(logwrap.PrettyRepr, 20, 4, False, None, None, None, True))
+        self.assertIsNot(formatter, get_formatter(logwrap.PrettyStr, 20, 4, False, None, None, None, True))
+        self.assertIsNot(formatter, get_formatter(logwrap.PrettyRepr, 20, 2, False, None, None, None, True))
+
+        hits = get_formatter.cache_info().hits
+        self.assertEqual("[\n  1,\n]", logwrap.pretty_repr([1], indent_step=2))
+        self.assertEqual("[\n  1,\n]", logwrap.pretty_repr([1], indent_step=2))
+        self.assertLess(hits, get_formatter.cache_info().hits)
+        # Indentation prefixes are reused by the same formatter for different start indentation
+        self.assertEqual("  [\n    1,\n  ]", logwrap.pretty_repr([1], indent=2, indent_step=2))
+
+    def test_021_callable_interface_cache(self):
+        def func(arg=1, *, kwarg=2):
+            pass
+
+        def expected(arg, kwarg):
+            return (
+                f"<function {func.__module__}.{func.__name__} with interface (\n"
+                f"    arg={arg},\n"
+                f"    kwarg={kwarg},\n"
+                ")>"
+            )
+
+        self.assertEqual(expected(1, 2), logwrap.pretty_repr(func))
+        self.assertIn(func, logwrap.repr_utils._INTERFACES)
+        self.assertEqual(expected(1, 2), logwrap.pretty_repr(func))
+
+        func.__defaults__ = (3,)
+        self.assertEqual(expected(3, 2), logwrap.pretty_repr(func))
+        func.__kwdefaults__["kwarg"] = 4
+        self.assertEqual(expected(3, 4), logwrap.pretty_repr(func))
+        func.__annotations__["arg"] = int
+        self.assertIn("    arg: int=3,\n", logwrap.pretty_repr(func))
+        func.__signature__ = inspect.Signature()
+        self.assertEqual(
+            f"<function {func.__module__}.{func.__name__} with interface ()>",
+            logwrap.pretty_repr(func),
+        )
+
+        # Functions are not kept alive by cache
+        func_ref = weakref.ref(func)
+        del func
+        gc.collect()
+        self.assertIsNone(func_ref())
+
+        # Default values are not compared using __eq__: it can fail like for numpy arrays
+        class Ambiguous:
+            def __eq__(self, other):
+                raise ValueError("The truth value is ambiguous")
+
+            __hash__ = object.__hash__
+
+            def __repr__(self):
+                return "Ambiguous()"
+
+        def with_ambiguous(arg=Ambiguous()):
+            pass
+
+        self.assertIn("    arg=Ambiguous(),\n", logwrap.pretty_repr(with_ambiguous))
+        with_ambiguous.__defaults__ = (Ambiguous(),)
+        self.assertIn("    arg=Ambiguous(),\n", logwrap.pretty_repr(with_ambiguous))
+
+    def test_022_align_keys(self):
+        src = {"a": 1, "long_key": 2, "": 3}
+        self.assertEqual(
+            "{\n    'a'       : 1,\n    'long_key': 2,\n    ''        : 3,\n}",
+            logwrap.pretty_repr(src),
+        )
+        self.assertEqual(
+            "{\n    a       : 1,\n    long_key: 2,\n            : 3,\n}",
+            logwrap.pretty_str(src),
+        )
+        self.assertEqual(
+            "{\n    'a': 1,\n    'long_key': 2,\n    '': 3,\n}",
+            logwrap.pretty_repr(src, align_keys=False),
+        )
+        self.assertEqual(
+            "{\n    a: 1,\n    long_key: 2,\n    : 3,\n}",
+            logwrap.pretty_str(src, align_keys=False),
+        )
+        self.assertFalse(logwrap.PrettyRepr(align_keys=False).align_keys)
+
+        # Only shown keys are used for alignment
+        self.assertEqual(
+            "{\n    'a': 1,\n    ... 2 more items\n}",
+            logwrap.pretty_repr(src, max_items=1),
+        )
+
+        class Key:
+            calls = 0
+
+            def __repr__(self):
+                Key.calls += 1
+                return "Key()"
+
+        self.assertEqual("{\n    Key(): 1,\n}", logwrap.pretty_repr({Key(): 1}))
+        self.assertEqual(1, Key.calls)
+
+    def test_023_structures(self):
+        class Point(typing.NamedTuple):
+            x: int
+            y: typing.List[int]
+
+        @dataclasses.dataclass
+        class Data:
+            name: str
+            point: Point
+            secret: str = dataclasses.field(default="", repr=False)
+            nested: typing.Optional[Data] = None
+
+        class Slots:
+            __slots__ = ("value", "__private", "unset")
+
+            def __init__(self):
+                self.value = collections.namedtuple("Pair", "left right")(1, 2)
+                self.__private = "p"
+
+        data = Data("data", Point(1, [2]), secret="s")
+        self.assertEqual(
+            "Data(\n"
+            "    name='data',\n"
+            "    point=Point(\n"
+            "        x=1,\n"
+            "        y=[\n"
+            "            2,\n"
+            "        ],\n"
+            "    ),\n"
+            "    nested=None,\n"
+            ")",
+            logwrap.pretty_repr(data),
+        )
+        self.assertEqual(
+            "Data(\n    name=data,\n    point=Point(x=1, y=[2]),\n    nested=None,\n)",
+            logwrap.pretty_str(data, max_indent=4),
+        )
+        self.assertEqual(
+            "Slots(\n"
+            "    value=Pair(\n"
+            "        left=1,\n"
+            "        right=2,\n"
+            "    ),\n"
+            "    __private='p',\n"
+            ")",
+            logwrap.pretty_repr(Slots()),
+        )
+
+        # Fields are resolved once per type
+        self.assertIn(Data, logwrap.PrettyRepr._dispatch)
+        self.assertEqual(
+            (("name", "name"), ("point", "point"), ("nested", "nested")),
+            logwrap.PrettyRepr._dispatch[Data].keywords["fields"],
+        )
+
+        # Indentation and budgets are applied to fields
+        self.assertEqual(
+            "    Data(\n        name='data',\n        ... 2 more items\n    )",
+            logwrap.pretty_repr(data, indent=4, max_items=1),
+        )
+        data.nested = data
+        self.assertEqual(
+            "Data(\n"
+            "    name='data',\n"
+            "    point=Point(x=1, y=[2]),\n"
+            f"    nested=<Recursion on Data with id={id(data)}>,\n"
+            ")",
+            logwrap.pretty_repr(data, max_indent=4),
+        )
+
+    def test_024_structures_own_repr(self):
+        @dataclasses.dataclass(repr=False)
+        class Credentials:
+            user: str
+            password: str
+
+            def __repr__(self):
+                return f"Credentials(user={self.user!r}, password=***)"
+
+        class Token(typing.NamedTuple):
+            name: str
+            token: str
+
+            def __repr__(self):
+                return f"Token(name={self.name!r}, token=***)"
+
+        @dataclasses.dataclass
+        class Masked:
+            secret: str
+
+            def __str__(self):
+                return "Masked(***)"
+
+        for obj, expected in (
+            (Credentials("user", "secret"), "Credentials(user='user', password=***)"),
+            (Token("api", "secret"), "Token(name='api', token=***)"),
+        ):
+            for formatter in (logwrap.pretty_repr, logwrap.pretty_str):
+                with self.subTest(obj=type(obj).__name__, formatter=formatter.__name__):
+                    self.assertEqual(expected, formatter(obj))
+                    self.assertEqual(f"[\n    {expected},\n]", formatter([obj]))
+
+        self.assertEqual("Masked(***)", logwrap.pretty_str(Masked("secret")))
+        self.assertEqual(repr(Masked("secret")), logwrap.pretty_repr(Masked("secret")))
+
 
 # noinspection PyUnusedLocal,PyMissingOrEmptyDocstring
 class TestAnnotated(unittest.TestCase):
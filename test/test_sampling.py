@@ -0,0 +1,116 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Sampling policies tests."""
+
+# Standard Library
+import unittest
+from unittest import mock
+
+# Package Implementation
+import logwrap
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestSampling(unittest.TestCase):
+    def test_001_every_nth(self):
+        policy = logwrap.EveryNth(3)
+        self.assertEqual([True, False, False, True, False, False, True], [policy.should_log() for _ in range(7)])
+        self.assertEqual(3, policy.logged)
+        self.assertEqual(4, policy.skipped)
+        policy.reset()
+        self.assertEqual(0, policy.logged)
+        self.assertEqual(0, policy.skipped)
+        self.assertEqual("EveryNth(n=3)", repr(policy))
+
+    def test_002_probabilistic(self):
+        self.assertTrue(all(logwrap.Probabilistic(1.0).should_log() for _ in range(100)))
+        self.assertFalse(any(logwrap.Probabilistic(0.0).should_log() for _ in range(100)))
+
+        first = logwrap.Probabilistic(0.5, seed=42)
+        second = logwrap.Probabilistic(0.5, seed=42)
+        self.assertEqual([first.should_log() for _ in range(50)], [second.should_log() for _ in range(50)])
+        self.assertEqual(50, first.logged + first.skipped)
+        self.assertTrue(0 < first.logged < 50)
+
+    @mock.patch("time.monotonic")
+    def test_003_token_bucket(self, monotonic):
+        monotonic.return_value = 100.0
+        policy = logwrap.TokenBucket(rate=2, burst=2)
+        self.assertEqual([True, True, False], [policy.should_log() for _ in range(3)])
+
+        monotonic.return_value = 100.5  # 1 token refilled
+        self.assertEqual([True, False], [policy.should_log() for _ in range(2)])
+
+        monotonic.return_value = 110.0  # bucket is limited by burst
+        self.assertEqual([True, True, False], [policy.should_log() for _ in range(3)])
+        self.assertEqual(5, policy.logged)
+        self.assertEqual(3, policy.skipped)
+
+    @mock.patch("time.monotonic", return_value=100.0)
+    def test_004_clone(self, monotonic):
+        for policy in (logwrap.EveryNth(2), logwrap.Probabilistic(0.5, seed=42), logwrap.TokenBucket(rate=1)):
+            with self.subTest(policy=policy):
+                first_decisions = [policy.should_log() for _ in range(4)]
+                clone = policy.clone()
+                self.assertIsNot(policy, clone)
+                self.assertEqual(repr(policy), repr(clone))
+                self.assertEqual((0, 0), (clone.logged, clone.skipped))
+                # Clone starts from the initial state and reports decisions to the original policy counters
+                self.assertEqual(first_decisions, [clone.should_log() for _ in range(4)])
+                self.assertEqual(4, clone.logged + clone.skipped)
+                self.assertEqual(8, policy.logged + policy.skipped)
+
+    def test_005_custom_clone(self):
+        # noinspection PyMissingOrEmptyDocstring
+        class Alternate(logwrap.SamplingPolicy):
+            __slots__ = ("log_next",)
+
+            def __init__(self):
+                super().__init__()
+                self.log_next = True
+
+            def _decide(self):
+                self.log_next = not self.log_next
+                return not self.log_next
+
+        policy = Alternate()
+        self.assertTrue(policy.should_log())
+        clone = policy.clone()
+        self.assertIsInstance(clone, Alternate)
+        self.assertFalse(clone.should_log())  # shallow copy of the current state
+        self.assertEqual(1, policy.skipped)
+        self.assertEqual(1, clone.skipped)
+        self.assertEqual(0, clone.logged)
+
+    def test_006_validation(self):
+        with self.assertRaises(ValueError):
+            logwrap.EveryNth(0)
+        with self.assertRaises(ValueError):
+            logwrap.Probabilistic(1.5)
+        with self.assertRaises(ValueError):
+            logwrap.TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            logwrap.TokenBucket(rate=1, burst=0)
+
+    def test_007_logwrap_property(self):
+        log_call = logwrap.LogWrap()
+        self.assertIsNone(log_call.sampling)
+        policy = logwrap.TokenBucket(rate=10)
+        log_call.sampling = policy
+        self.assertIs(log_call.sampling, policy)
+        with self.assertRaises(TypeError):
+            log_call.sampling = 10
@@ -0,0 +1,63 @@
+#    Copyright 2016 - 2021 Alexey Stepanov aka penguinolog
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# pylint: disable=missing-docstring
+
+"""Calls in flight watchdog tests."""
+
+# Standard Library
+import threading
+import unittest
+
+# Package Implementation
+from logwrap import watchdog
+
+
+# noinspection PyMissingOrEmptyDocstring
+class TestWatchdog(unittest.TestCase):
+    def test_001_callback(self):
+        fired = threading.Event()
+        dog = watchdog.Watchdog()
+        dog.watch(0.01, fired.set)
+        self.assertTrue(fired.wait(5))
+
+    def test_002_order(self):
+        fired = []
+        done = threading.Event()
+        dog = watchdog.Watchdog()
+        dog.watch(0.1, done.set)
+        dog.watch(0.05, lambda: fired.append("late"))
+        dog.watch(0.01, lambda: fired.append("early"))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(["early", "late"], fired)
+        self.assertEqual(0, len(dog))
+
+    def test_003_cancel(self):
+        fired = []
+        done = threading.Event()
+        dog = watchdog.Watchdog()
+        dog.watch(0.01, lambda: fired.append("cancelled")).cancel()
+        dog.watch(0.02, done.set)
+        self.assertTrue(done.wait(5))
+        self.assertEqual([], fired)
+
+    def test_004_compact(self):
+        dog = watchdog.Watchdog()
+        watches = [dog.watch(60, lambda: None) for _ in range(watchdog._COMPACT_MIN_CANCELLED)]
+        for entry in watches:
+            entry.cancel()
+            self.assertIsNone(entry.callback)
+        self.assertEqual(watchdog._COMPACT_MIN_CANCELLED, len(dog))
+        dog.watch(60, lambda: None)
+        self.assertEqual(1, len(dog))